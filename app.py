@@ -1,3 +1,4 @@
+import importlib
 import streamlit as st
 import snowflake.connector
 import pandas as pd
@@ -8,14 +9,24 @@ from streamlit_option_menu import option_menu
 
 # Import utility modules
 from utils.image_utils import get_art_form_images, get_cached_art_form_images
+from utils.filter_index import dataset_version
+from utils.image_warmup import get_image_warmup
 from components.styling import load_css
+from components.status import show_api_status
 
-# Import page modules
-from pages.heritage_explorer import show_heritage_explorer
-from pages.tourism_analytics import show_tourism_analytics
-from pages.responsible_tourism import show_responsible_tourism
-from pages.cultural_gallery import show_cultural_gallery
-from pages.cultural_quiz import show_quiz
+# Page modules, imported on first selection so a run only loads the page it renders
+PAGES = {
+    "Heritage Walks": ('pages.heritage_explorer', 'show_heritage_explorer'),
+    "Tourism Trends": ('pages.tourism_analytics', 'show_tourism_analytics'),
+    "Responsible Tourism": ('pages.responsible_tourism', 'show_responsible_tourism'),
+    "Desi Gallery": ('pages.cultural_gallery', 'show_cultural_gallery'),
+    "Culture Quest": ('pages.cultural_quiz', 'show_quiz')
+}
+
+def load_page(name):
+    """Import a page module on demand and return its render function."""
+    module_name, function_name = PAGES[name]
+    return getattr(importlib.import_module(module_name), function_name)
 
 # Set page config
 st.set_page_config(
@@ -93,10 +104,14 @@ def main():
         
         # Store the query result in session state
         st.session_state.df = run_query(query)
+        st.session_state.df_version = dataset_version(st.session_state.df)
         
         # Debug 
         # st.write("Available columns:", st.session_state.df.columns.tolist())
     
+    # Opt-in background job resolving known art form and hidden gem images, once per process
+    get_image_warmup()
+    
     left_co, cent_co,last_co = st.columns(3)
 
     with cent_co:
@@ -107,7 +122,7 @@ def main():
     # Navigation menu 
     selected = option_menu(
         menu_title=None,
-        options=["Heritage Walks", "Tourism Trends", "Responsible Tourism", "Desi Gallery", "Culture Quest"],
+        options=list(PAGES),
         icons=["🏛️", "📊", "🌱", "🎨", "🎯"],
         menu_icon="cast",
         default_index=0,
@@ -150,16 +165,16 @@ def main():
     )
     
     # Display selected page
+    show_page = load_page(selected)
     if selected == "Heritage Walks":
-        show_heritage_explorer(st.session_state.df)
+        show_page(st.session_state.df, st.session_state.df_version)
     elif selected == "Tourism Trends":
-        show_tourism_analytics(st.session_state.df)
-    elif selected == "Responsible Tourism":
-        show_responsible_tourism()
-    elif selected == "Desi Gallery":
-        show_cultural_gallery()
-    elif selected == "Culture Quest":
-        show_quiz()
+        show_page(st.session_state.df)
+    else:
+        show_page()
+
+    # Image API rate-limit headroom, shared by every session of this process
+    show_api_status()
 
     # Footer with data source attribution
     st.markdown("---")
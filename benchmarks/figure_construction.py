@@ -0,0 +1,157 @@
+"""
+Figure construction benchmark for DesiVerse application.
+Times Plotly figure building plus Streamlit's serialization, with the layout applied
+as an inline update_layout dict (the previous approach) and through the shared template.
+
+Usage:
+    python benchmarks/figure_construction.py [--repeat 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+import plotly.tools
+
+# Importing Streamlit's Plotly element registers its default template, as in the app
+import streamlit.elements.plotly_chart  # noqa: F401
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.visualization import (
+    create_bar_chart,
+    create_pie_chart,
+    create_radar_chart,
+    create_seasonal_line_chart
+)
+
+# The layout every builder used to pass to update_layout
+LEGACY_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='white', size=12),
+    title_font=dict(size=16),
+    margin=dict(t=50, b=50, l=50, r=50),
+    legend=dict(
+        yanchor="top",
+        y=0.99,
+        xanchor="right",
+        x=0.99,
+        bgcolor='rgba(0,0,0,0.5)',
+        bordercolor='rgba(255,255,255,0.2)',
+        borderwidth=1
+    )
+)
+
+DATA = pd.DataFrame({
+    'state': ['Rajasthan', 'Kerala', 'Goa', 'Assam', 'Bihar'],
+    'visits': [120, 95, 80, 40, 35]
+})
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+DOMESTIC = [95, 82, 70, 55, 48, 42, 55, 60, 72, 98, 89, 110]
+FOREIGN = [12, 10, 9, 8, 7, 4, 3, 3, 6, 9, 11, 13]
+CATEGORIES = ['Heritage', 'Culture', 'Food', 'Nature', 'Crafts']
+
+
+def legacy_bar():
+    fig = px.bar(DATA, x='state', y='visits', title='Bar',
+                 color_discrete_sequence=['#FF9933'])
+    fig.update_layout(height=400, xaxis=dict(tickangle=45), **LEGACY_LAYOUT)
+    return fig
+
+
+def legacy_pie():
+    fig = px.pie(DATA, values='visits', names='state', title='Pie', hole=0.4,
+                 color_discrete_sequence=px.colors.qualitative.Set3)
+    fig.update_layout(height=400, **LEGACY_LAYOUT)
+    return fig
+
+
+def legacy_radar():
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(r=[80, 70, 60, 50, 40], theta=CATEGORIES, fill='toself', name='A',
+                                  line_color='#FF6B6B', fillcolor='rgba(255, 107, 107, 0.3)'))
+    fig.add_trace(go.Scatterpolar(r=[40, 50, 60, 70, 80], theta=CATEGORIES, fill='toself', name='B',
+                                  line_color='#4ECDC4', fillcolor='rgba(78, 205, 196, 0.3)'))
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(visible=True, range=[0, 100], showticklabels=True,
+                            tickfont=dict(color='white'), gridcolor='rgba(255, 255, 255, 0.1)'),
+            angularaxis=dict(tickfont=dict(color='white'), gridcolor='rgba(255, 255, 255, 0.1)'),
+            bgcolor='rgba(0,0,0,0)'
+        ),
+        **dict(LEGACY_LAYOUT, title_font=dict(size=20)),
+        height=500,
+        title='Radar'
+    )
+    return fig
+
+
+def legacy_seasonal():
+    df = pd.DataFrame({
+        'Month': MONTHS * 2,
+        'Visitors': DOMESTIC + FOREIGN,
+        'Type': ['Domestic'] * len(MONTHS) + ['Foreign'] * len(MONTHS)
+    })
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=df[df['Type'] == 'Domestic']['Month'], y=df[df['Type'] == 'Domestic']['Visitors'],
+                             mode='lines+markers', name='Domestic Visitors',
+                             line=dict(color='#2ca02c', width=3), marker=dict(size=8)))
+    fig.add_trace(go.Scatter(x=df[df['Type'] == 'Foreign']['Month'], y=df[df['Type'] == 'Foreign']['Visitors'],
+                             mode='lines+markers', name='Foreign Visitors',
+                             line=dict(color='#d62728', width=3), marker=dict(size=8)))
+    fig.update_layout(
+        title='Seasonal',
+        xaxis_title='Month',
+        yaxis_title='Number of Visitors',
+        **dict(LEGACY_LAYOUT, title_font=dict(size=20), legend=dict(LEGACY_LAYOUT['legend'], title='Visitor Type')),
+        height=500,
+        xaxis=dict(gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white')),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.1)', tickfont=dict(color='white'))
+    )
+    return fig
+
+
+CASES = [
+    ('bar (px)', legacy_bar, lambda: create_bar_chart(DATA, 'state', 'visits', 'Bar')),
+    ('pie (px)', legacy_pie, lambda: create_pie_chart(DATA, 'visits', 'state', 'Pie')),
+    ('radar (go)', legacy_radar,
+     lambda: create_radar_chart(CATEGORIES, [80, 70, 60, 50, 40], [40, 50, 60, 70, 80], ['A', 'B'], 'Radar')),
+    ('seasonal line (go)', legacy_seasonal,
+     lambda: create_seasonal_line_chart(MONTHS, DOMESTIC, FOREIGN, 'Seasonal')),
+]
+
+
+def build_and_serialize(build):
+    """Build a figure and serialize it the way st.plotly_chart does."""
+    figure = plotly.tools.return_figure_from_figure_or_data(build(), validate_figure=True)
+    return pio.to_json(figure, validate=False)
+
+
+def time_ms(build, repeat):
+    build_and_serialize(build)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        build_and_serialize(build)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'figure':<22}{'inline dict':>14}{'template':>12}{'change':>10}")
+    for name, legacy, themed in CASES:
+        before = time_ms(legacy, args.repeat)
+        after = time_ms(themed, args.repeat)
+        print(f"{name:<22}{before:>11.1f} ms{after:>9.1f} ms{(after - before) / before:>+10.0%}")
+
+
+if __name__ == "__main__":
+    main()
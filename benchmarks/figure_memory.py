@@ -0,0 +1,86 @@
+"""
+Figure memory benchmark for DesiVerse application.
+Renders the matplotlib builders repeatedly, as uncached reruns would, and fails if
+resident memory keeps growing after warm-up.
+
+Usage:
+    python benchmarks/figure_memory.py [--iterations 1000] [--tolerance-mb 25]
+"""
+
+import argparse
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.visualization import (
+    create_art_forms_wordcloud,
+    create_correlation_heatmap,
+    create_funding_heatmap,
+    create_wordcloud,
+    render_figure_png
+)
+
+WORD_FREQUENCIES = {'Bharatanatyam': 100, 'Kathak': 90, 'Madhubani': 85, 'Warli': 75, 'Odissi': 65}
+LABELS = ['Visitors', 'Revenue', 'Heritage', 'Employment', 'Sustainability']
+
+
+def current_rss_mb():
+    """Current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def rerun(iteration, wordcloud_every):
+    """Render every heatmap builder, and the word clouds every few iterations."""
+    rng = np.random.default_rng(iteration)
+    matrix = rng.uniform(-1, 1, size=(5, 5))
+    render_figure_png(create_funding_heatmap(matrix, LABELS, LABELS, 'Funding'))
+    render_figure_png(create_correlation_heatmap(pd.DataFrame(matrix, index=LABELS, columns=LABELS)))
+    if iteration % wordcloud_every == 0:
+        render_figure_png(create_wordcloud(WORD_FREQUENCIES))
+        render_figure_png(create_art_forms_wordcloud(WORD_FREQUENCIES))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--warmup', type=int, default=50)
+    parser.add_argument('--wordcloud-every', type=int, default=10,
+                        help='Render the (slow) word clouds every N iterations')
+    parser.add_argument('--tolerance-mb', type=float, default=25.0,
+                        help='Allowed RSS growth between the end of warm-up and the last iteration')
+    args = parser.parse_args()
+
+    for i in range(args.warmup):
+        rerun(i, args.wordcloud_every)
+    baseline = current_rss_mb()
+    start = time.perf_counter()
+
+    for i in range(args.iterations):
+        rerun(args.warmup + i, args.wordcloud_every)
+        if (i + 1) % max(1, args.iterations // 10) == 0:
+            print(f"{i + 1:>6} reruns  rss={current_rss_mb():8.1f} MB")
+
+    growth = current_rss_mb() - baseline
+    elapsed = time.perf_counter() - start
+    print(f"baseline={baseline:.1f} MB  growth={growth:+.1f} MB  "
+          f"({elapsed / args.iterations * 1000:.1f} ms per rerun)")
+
+    if growth > args.tolerance_mb:
+        print(f"FAIL: RSS grew by more than {args.tolerance_mb} MB")
+        sys.exit(1)
+    print("OK: RSS is flat")
+
+
+if __name__ == "__main__":
+    main()
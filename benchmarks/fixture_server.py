@@ -0,0 +1,328 @@
+"""
+Image API fixture server for DesiVerse application.
+Stands in for Pexels and Pixabay offline: replays the JSON fixtures in
+benchmarks/fixtures, serves generated test images, and can add latency, enforce a
+request quota and inject 429 responses.
+
+Usage:
+    python benchmarks/fixture_server.py [--port 8765] [--latency-ms 0] [--jitter-ms 0]
+                                        [--error-rate 0] [--quota 0] [--window 60]
+                                        [--miss generate] [--seed 0]
+
+    DESIVERSE_PEXELS_URL=http://127.0.0.1:8765 DESIVERSE_PIXABAY_URL=http://127.0.0.1:8765 \\
+        streamlit run app.py
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image, ImageDraw
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Search endpoints as (provider, query parameter, results field, default page size)
+SEARCH_ROUTES = {
+    '/v1/search': ('pexels', 'query', 'photos', 15),
+    '/api/': ('pixabay', 'q', 'hits', 20)
+}
+
+# Size of the generated test images, comparable to the originals the APIs link to
+IMAGE_SIZE = (1600, 1067)
+
+
+def normalize_query(query):
+    """Normalize a query the way utils.search_cache does, so fixtures match app queries."""
+    return ' '.join(str(query).lower().split())
+
+
+def load_fixtures(fixtures_dir=FIXTURES_DIR):
+    """
+    Load the recorded responses of every provider.
+
+    Returns:
+        dict: Provider mapped to {normalized query: response}
+    """
+    fixtures = {}
+    for provider, _, _, _ in SEARCH_ROUTES.values():
+        path = os.path.join(fixtures_dir, f'{provider}.json')
+        with open(path) as f:
+            fixtures[provider] = {normalize_query(query): response for query, response in json.load(f).items()}
+    return fixtures
+
+
+def generate_response(provider, query, count):
+    """Build a deterministic response in the provider's format for a query without a fixture."""
+    seed = zlib.crc32(query.encode('utf-8'))
+    if provider == 'pexels':
+        photos = []
+        for i in range(count):
+            image = '{base}/images/pexels-%d.jpg' % (seed + i)
+            photos.append({
+                'id': seed + i,
+                'width': IMAGE_SIZE[0],
+                'height': IMAGE_SIZE[1],
+                'photographer': 'Fixture Photographer',
+                'photographer_url': 'https://www.pexels.com/@fixture',
+                'alt': query.title(),
+                'src': {'original': image, 'large2x': image + '?w=1880', 'large': image + '?w=940',
+                        'medium': image + '?w=350', 'small': image + '?w=130'}
+            })
+        return {'page': 1, 'per_page': count, 'photos': photos, 'total_results': count}
+
+    hits = []
+    for i in range(count):
+        image = '{base}/images/pixabay-%d.jpg' % (seed + i)
+        hits.append({
+            'id': seed + i,
+            'tags': ', '.join(query.split()),
+            'previewURL': image + '?w=150',
+            'webformatURL': image + '?w=640',
+            'largeImageURL': image + '?w=1280',
+            'imageWidth': IMAGE_SIZE[0],
+            'imageHeight': IMAGE_SIZE[1],
+            'user': 'fixture'
+        })
+    return {'total': count, 'totalHits': count, 'hits': hits}
+
+
+def render_test_image(name, size=IMAGE_SIZE):
+    """Render a deterministic JPEG whose colours depend on ``name``."""
+    seed = zlib.crc32(name.encode('utf-8'))
+    start = ((seed >> 16) & 255, (seed >> 8) & 255, seed & 255)
+    end = tuple(255 - channel for channel in start)
+    image = Image.new('RGB', size)
+    draw = ImageDraw.Draw(image)
+    # A gradient with stripes compresses like a photo rather than a flat colour
+    for y in range(size[1]):
+        t = y / size[1]
+        colour = tuple(int(a + (b - a) * t) for a, b in zip(start, end))
+        draw.line([(0, y), (size[0], y)], fill=colour)
+    for x in range(0, size[0], 40):
+        draw.line([(x, 0), (x + size[1], size[1])], fill=end, width=3)
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=90)
+    return buffer.getvalue()
+
+
+class FixtureServer:
+    """
+    Local stand-in for the Pexels and Pixabay APIs.
+
+    Runs in a background thread, so benchmarks can start it in-process and point
+    ``DESIVERSE_PEXELS_URL`` / ``DESIVERSE_PIXABAY_URL`` at ``url``. Search
+    responses carry ETags and the providers' rate-limit headers.
+    """
+
+    def __init__(self, port=0, latency=0.0, jitter=0.0, error_rate=0.0, quota=0, window=60.0,
+                 miss='generate', seed=0, fixtures_dir=FIXTURES_DIR):
+        """
+        Args:
+            port (int): Port to listen on; 0 picks a free one
+            latency (float): Delay added to every response in seconds
+            jitter (float): Random extra delay of up to this many seconds
+            error_rate (float): Share of search requests answered with a 429
+            quota (int): Search requests allowed per provider and window; 0 for no limit
+            window (float): Length of the quota window in seconds
+            miss (str): Answer to a query without a fixture, 'generate' or 'empty'
+            seed (int): Seed of the random latency and error injection
+            fixtures_dir (str): Directory holding pexels.json and pixabay.json
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.quota = quota
+        self.window = window
+        self.miss = miss
+        self.fixtures = load_fixtures(fixtures_dir)
+        self.stats = {}
+        self._random = random.Random(seed)
+        self._windows = {}
+        self._images = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self):
+        """Base URL of the server."""
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Serve in a background thread and return the server."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def reset_stats(self):
+        """Clear the request counters."""
+        with self._lock:
+            self.stats = {}
+
+    def delay(self):
+        with self._lock:
+            extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        time.sleep(self.latency + extra)
+        return fail
+
+    def take_quota(self, provider):
+        """
+        Count a search request against the provider's quota window.
+
+        Returns:
+            tuple: (int, float) requests left in the window, or None without a quota,
+                and seconds until the window resets
+        """
+        if not self.quota:
+            return None, 0.0
+        now = time.monotonic()
+        with self._lock:
+            started, used = self._windows.get(provider, (now, 0))
+            if now - started >= self.window:
+                started, used = now, 0
+            used += 1
+            self._windows[provider] = (started, used)
+        return self.quota - used, self.window - (now - started)
+
+    def image(self, name):
+        with self._lock:
+            data = self._images.get(name)
+        if data is None:
+            data = render_test_image(name)
+            with self._lock:
+                self._images[name] = data
+        return data
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urllib.parse.urlsplit(self.path)
+                if parsed.path in SEARCH_ROUTES:
+                    self.search(parsed)
+                elif parsed.path.startswith('/images/') and parsed.path.endswith('.jpg'):
+                    self.send_image(parsed.path[len('/images/'):-len('.jpg')])
+                elif parsed.path == '/stats':
+                    with server._lock:
+                        self.send_body(200, json.dumps(server.stats).encode('utf-8'), 'application/json')
+                else:
+                    self.send_body(404, b'{"error": "not found"}', 'application/json')
+
+            def search(self, parsed):
+                provider, query_param, results_key, default_count = SEARCH_ROUTES[parsed.path]
+                server.count(f'{provider}_requests')
+                fail = server.delay()
+
+                remaining, reset_after = server.take_quota(provider)
+                headers = {}
+                if remaining is not None:
+                    headers['X-Ratelimit-Limit'] = str(server.quota)
+                    headers['X-Ratelimit-Remaining'] = str(max(0, remaining))
+                    # Pexels reports the reset as a UNIX timestamp, Pixabay as seconds
+                    headers['X-Ratelimit-Reset'] = (str(int(time.time() + reset_after)) if provider == 'pexels'
+                                                    else str(int(reset_after) + 1))
+                if fail or (remaining is not None and remaining < 0):
+                    server.count(f'{provider}_429')
+                    headers['Retry-After'] = str(int(reset_after) + 1 if remaining is not None and remaining < 0 else 1)
+                    self.send_body(429, b'{"error": "Too Many Requests"}', 'application/json', headers)
+                    return
+
+                params = urllib.parse.parse_qs(parsed.query)
+                query = normalize_query(params.get(query_param, [''])[0])
+                count = int(params.get('per_page', [default_count])[0])
+                response = server.fixtures[provider].get(query)
+                if response is not None:
+                    server.count(f'{provider}_fixture_hits')
+                else:
+                    server.count(f'{provider}_fixture_misses')
+                    response = generate_response(provider, query, count if server.miss == 'generate' else 0)
+                response = dict(response, **{results_key: response[results_key][:count]})
+
+                body = json.dumps(response).replace('{base}', f"http://{self.headers['Host']}").encode('utf-8')
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                headers['ETag'] = etag
+                if self.headers.get('If-None-Match') == etag:
+                    server.count(f'{provider}_304')
+                    self.send_body(304, b'', None, headers)
+                    return
+                self.send_body(200, body, 'application/json', headers)
+
+            def send_image(self, name):
+                server.count('image_requests')
+                server.delay()
+                self.send_body(200, server.image(name), 'image/jpeg', {'Cache-Control': 'max-age=86400'})
+
+            def send_body(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                if content_type:
+                    self.send_header('Content-Type', content_type)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if status != 304:
+                    self.wfile.write(body)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0, help='Delay added to every response')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random extra delay of up to this much')
+    parser.add_argument('--error-rate', type=float, default=0, help='Share of searches answered with a 429')
+    parser.add_argument('--quota', type=int, default=0, help='Searches per provider and window; 0 for no limit')
+    parser.add_argument('--window', type=float, default=60, help='Quota window in seconds')
+    parser.add_argument('--miss', choices=['generate', 'empty'], default='generate',
+                        help='Answer to queries without a fixture')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = FixtureServer(
+        port=args.port,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        quota=args.quota,
+        window=args.window,
+        miss=args.miss,
+        seed=args.seed
+    )
+    print(f"Serving Pexels and Pixabay fixtures on {server.url}")
+    print(f"    DESIVERSE_PEXELS_URL={server.url} DESIVERSE_PIXABAY_URL={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Image layer benchmark for DesiVerse application.
+Runs the image searches and thumbnails against the local fixture server and reports
+latency and upstream requests for cold and warm caches, coalesced concurrent
+searches, and searches under injected 429 responses.
+
+Usage:
+    python benchmarks/image_layer.py [--latency-ms 100] [--queries 12] [--threads 16]
+                                     [--error-rate 0.3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixture_server import FixtureServer
+
+
+def timed(label, server, run):
+    """Run a scenario and print its wall time and the requests the server received."""
+    server.reset_stats()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    with server._lock:
+        stats = ', '.join(f'{name}={value}' for name, value in sorted(server.stats.items())) or 'no requests'
+    print(f"{label:<34}{elapsed * 1000:>9.0f} ms    {stats}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--latency-ms', type=float, default=100, help='Fixture server latency per response')
+    parser.add_argument('--queries', type=int, default=12,
+                        help='Distinct searches per scenario; stay within the 20-request bursts of the rate limiter')
+    parser.add_argument('--threads', type=int, default=16, help='Sessions searching for the same query at once')
+    parser.add_argument('--error-rate', type=float, default=0.3, help='Share of searches answered with a 429')
+    args = parser.parse_args()
+
+    server = FixtureServer(latency=args.latency_ms / 1000).start()
+    # The image modules read these at import time
+    os.environ['DESIVERSE_PEXELS_URL'] = server.url
+    os.environ['DESIVERSE_PIXABAY_URL'] = server.url
+    os.environ['DESIVERSE_CACHE_DIR'] = tempfile.mkdtemp(prefix='desiverse-bench-')
+
+    from utils.image_utils import fetch_images_batch, search_pexels_images, search_pixabay_images
+    from utils.thumbnails import get_thumbnail
+
+    print(f"fixture server {server.url}, {args.latency_ms:.0f} ms latency")
+
+    queries = [f'benchmark heritage query {i}' for i in range(args.queries)]
+    timed('search, sequential, cold', server, lambda: [search_pexels_images(query) for query in queries[:1]])
+    results = timed('search, batch, cold', server, lambda: fetch_images_batch(search_pexels_images, queries[1:]))
+    timed('search, batch, warm', server, lambda: fetch_images_batch(search_pexels_images, queries))
+
+    def same_query():
+        threads = [threading.Thread(target=search_pexels_images, args=('coalesced heritage query',))
+                   for _ in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    timed(f'search, {args.threads} sessions, same query', server, same_query)
+
+    urls = [images[0]['url'] for images in results if images]
+    timed('thumbnails, sequential, cold', server, lambda: [get_thumbnail(url, 'gallery') for url in urls[:1]])
+    timed('thumbnails, batch, cold', server, lambda: fetch_images_batch(lambda url: get_thumbnail(url, 'gallery'), urls[1:]))
+    timed('thumbnails, batch, warm', server, lambda: fetch_images_batch(lambda url: get_thumbnail(url, 'gallery'), urls))
+
+    server.error_rate = args.error_rate
+    pixabay_queries = [f'benchmark craft query {i}' for i in range(args.queries)]
+    found = timed(f'search, {args.error_rate:.0%} 429s, cold', server,
+                  lambda: fetch_images_batch(search_pixabay_images, pixabay_queries))
+    print(f"    {sum(1 for images in found if images)}/{len(found)} searches returned images")
+
+    server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Import-time benchmark for DesiVerse application.
+Profiles cold imports of the app's modules with ``python -X importtime`` in fresh
+processes, reports the slowest packages, and times the first render of a page.
+
+Usage:
+    python benchmarks/import_time.py [--top 15] [--modules app pages.heritage_explorer]
+                                     [--first-paint] [--fail-on-heavy]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    'app',
+    'utils.visualization',
+    'pages.heritage_explorer',
+    'pages.tourism_analytics',
+    'pages.responsible_tourism'
+]
+
+# Packages that should only load when a static (matplotlib) figure is rendered
+HEAVY_PACKAGES = ['matplotlib', 'seaborn', 'wordcloud']
+
+# Renders the Heritage Walks page once in a fresh process through Streamlit's test runner
+PAGE_SCRIPT = '''
+import pandas as pd
+from pages.heritage_explorer import show_heritage_explorer
+df = pd.read_csv('data/heritage_tourism_data.csv').rename(columns=str.upper)
+show_heritage_explorer(df)
+'''
+
+FIRST_PAINT_SCRIPT = f'''
+import sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_string({PAGE_SCRIPT!r}, default_timeout=300).run()
+if at.exception:
+    sys.exit(f"page raised: {{at.exception[0].value}}")
+print(time.perf_counter() - start)
+'''
+
+
+def profile_import(module):
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        tuple: (float, dict) wall time in seconds and import microseconds spent in
+            each root package's own modules
+    """
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+    return elapsed, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES)
+    parser.add_argument('--top', type=int, default=10, help='Packages listed per module')
+    parser.add_argument('--first-paint', action='store_true',
+                        help='Also time the first render of the Heritage Walks page')
+    parser.add_argument('--fail-on-heavy', action='store_true',
+                        help=f"Exit non-zero if a module pulls in {', '.join(HEAVY_PACKAGES)}")
+    args = parser.parse_args()
+
+    heavy_found = False
+    for module in args.modules:
+        elapsed, packages = profile_import(module)
+        total = sum(packages.values())
+        heavy = [name for name in HEAVY_PACKAGES if name in packages]
+        heavy_found = heavy_found or bool(heavy)
+
+        print(f"{module}: {elapsed * 1000:.0f} ms process, {total / 1000:.0f} ms imports, "
+              f"heavy: {', '.join(heavy) or 'none'}")
+        for name, self_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {name:<28}{self_us / 1000:>9.1f} ms")
+
+    if args.first_paint:
+        result = subprocess.run([sys.executable, '-c', FIRST_PAINT_SCRIPT],
+                                cwd=ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"first paint failed: {result.stderr.strip().splitlines()[-1]}")
+            sys.exit(1)
+        print(f"first paint (Heritage Walks): {float(result.stdout.split()[-1]) * 1000:.0f} ms")
+
+    if args.fail_on_heavy and heavy_found:
+        print(f"FAIL: {', '.join(HEAVY_PACKAGES)} should load only when a static figure is rendered")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
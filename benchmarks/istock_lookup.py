@@ -0,0 +1,137 @@
+"""
+iStock lookup benchmark for DesiVerse application.
+Checks that get_istock_images returns what the previous linear scan returned for a
+corpus of app and randomized queries, and times both.
+
+Usage:
+    python benchmarks/istock_lookup.py [--repeat 2000] [--random-queries 5000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.constants import art_form_details
+from utils.image_utils import ISTOCK_IMAGES, get_istock_images
+
+STATES = ['Tamil Nadu', 'Kerala', 'Odisha', 'Bihar', 'Maharashtra', 'Uttar Pradesh']
+
+# Queries the pages send: art form searches, hidden gems and gallery categories
+APP_QUERIES = [
+    'bharatanatyam dancer tamil nadu',
+    'kathakali face paint',
+    'kathak dance northern india',
+    'odissi temple dance',
+    'thanjavur painting temple',
+    'tanjore painting gold',
+    'madhubani painting bihar',
+    'warli tribal art',
+    'gond mp',
+    'pattachitra scroll',
+    'phulkari embroidery punjab',
+    'chikankari uttar pradesh',
+    'zardozi metallic',
+    'majuli island assam river',
+    'ziro valley arunachal pradesh',
+    'champaner pavagadh gujarat',
+    'chettinad mansions tamil nadu',
+    'orchha madhya pradesh palace',
+    'festivals india',
+    'Diwali festivals india'
+]
+
+
+def legacy_istock_images(query):
+    """The previous lookup: rebuild the mapping, scan for a contained key, then for partial matches."""
+    istock_images = {key: list(urls) for key, urls in ISTOCK_IMAGES.items()}
+    query_lower = query.lower()
+    results = []
+    for key, urls in istock_images.items():
+        if key in query_lower:
+            for url in urls:
+                results.append({
+                    'url': url,
+                    'photographer': 'iStock Contributor',
+                    'photographer_url': 'https://www.istockphoto.com',
+                    'description': f'{key.title()} - Traditional Indian Art Form',
+                    'source': 'iStock'
+                })
+            return results
+    for key, urls in istock_images.items():
+        for term in query_lower.split():
+            if term in key or key in term:
+                for url in urls:
+                    results.append({
+                        'url': url,
+                        'photographer': 'iStock Contributor',
+                        'photographer_url': 'https://www.istockphoto.com',
+                        'description': f'{key.title()} - Traditional Indian Art Form',
+                        'source': 'iStock'
+                    })
+                return results
+    return []
+
+
+def random_queries(count, seed=0):
+    """Queries mixing key fragments, glued words, odd spacing and unrelated words."""
+    rng = random.Random(seed)
+    keys = list(ISTOCK_IMAGES)
+    words = ['dance', 'art', 'in', 'a', 'of', 'temple', 'india', 'village', 'x', 'ka', 'ing', 'ant']
+    queries = []
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 4)):
+            key = rng.choice(keys)
+            start = rng.randrange(len(key))
+            choice = rng.random()
+            if choice < 0.3:
+                parts.append(key)
+            elif choice < 0.6:
+                parts.append(key[start:start + rng.randint(1, 8)])
+            else:
+                parts.append(rng.choice(words))
+        separator = rng.choice([' ', '  ', '', '\t'])
+        query = separator.join(parts)
+        queries.append(query.upper() if rng.random() < 0.1 else query)
+    return queries
+
+
+def time_lookup(lookup, queries, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            lookup(query)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=2000, help='Passes over the app queries when timing')
+    parser.add_argument('--random-queries', type=int, default=5000, help='Randomized queries checked for equal results')
+    args = parser.parse_args()
+
+    app_queries = APP_QUERIES + [f'{name} traditional india' for name in art_form_details]
+    app_queries += [f'{key} {state}' for key in ISTOCK_IMAGES for state in STATES]
+    checked = app_queries + random_queries(args.random_queries) + ['', ' ', 'xbharatanatyam', 'thanjavur  painting']
+
+    mismatches = [query for query in checked if get_istock_images(query) != legacy_istock_images(query)]
+    print(f"{len(checked)} queries checked, {len(mismatches)} mismatches")
+    for query in mismatches[:10]:
+        print(f"    {query!r}")
+
+    get_istock_images('')  # Build the index outside the timing
+    legacy = time_lookup(legacy_istock_images, app_queries, args.repeat)
+    indexed = time_lookup(get_istock_images, app_queries, args.repeat)
+    print(f"linear scan: {legacy:.2f} us/query")
+    print(f"index:       {indexed:.2f} us/query ({(1 - indexed / legacy) * 100:.0f}% less)")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
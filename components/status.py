@@ -0,0 +1,61 @@
+"""
+Status readout for DesiVerse application.
+Shows operators the image API rate-limit headroom and image warm-up coverage of this
+server process.
+"""
+
+import pandas as pd
+import streamlit as st
+
+from utils.image_warmup import get_image_warmup
+from utils.request_scheduler import rate_limit_headroom
+
+# Readable names of the image warm-up job's lookup kinds
+WARMUP_KINDS = {'art_form': 'Art form cards', 'hidden_gem': 'Hidden gems'}
+
+
+def show_api_status():
+    """
+    Display a collapsed readout of the image API rate limits and the image warm-up.
+
+    The numbers are process-wide: every session of this server shares the same
+    request tokens, so they show how close the app is to the providers' quotas.
+    """
+    with st.expander("Image API status"):
+        rows = []
+        for provider, stats in rate_limit_headroom().items():
+            rows.append({
+                'Provider': provider.title(),
+                'Tokens available': f"{stats['tokens']:g} / {stats['capacity']}",
+                'Server quota left': '-' if stats['remaining'] is None else stats['remaining'],
+                'Requests': stats['requests'],
+                'Shared in flight': stats['coalesced'],
+                'Throttled': stats['throttled'],
+                '429 responses': stats['rate_limited']
+            })
+        st.dataframe(pd.DataFrame(rows), hide_index=True)
+
+        show_warmup_status()
+
+
+def show_warmup_status():
+    """Display the coverage of the image warm-up job's current or last round."""
+    report = get_image_warmup().report()
+    if report['status'] == 'idle':
+        st.caption("Image warm-up is off; set DESIVERSE_IMAGE_WARMUP=1 to enable it.")
+        return
+    if report['round'] == 0:
+        st.caption(f"Image warm-up: {report['status']}, no round yet.")
+        return
+
+    st.caption(
+        f"Image warm-up round {report['round']} ({report['status']}): "
+        f"{report['warm']}/{report['total']} images warm, {report['coverage']:.0f}% coverage, "
+        f"{report['done']}/{report['total']} lookups done in {report['seconds'] / 60:.0f} min"
+    )
+    st.dataframe(pd.DataFrame([
+        {'Images': WARMUP_KINDS.get(kind, kind), 'Warm': warm, 'Total': total}
+        for kind, (warm, total) in report['by_kind'].items()
+    ]), hide_index=True)
+    if report['cold']:
+        st.caption("Cold: " + ", ".join(report['cold']))
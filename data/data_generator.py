@@ -7,6 +7,41 @@ import pandas as pd
 import numpy as np
 import random
 
+# Traditional art forms by state
+ART_FORMS_BY_STATE = {
+    'Andhra Pradesh': ['Kuchipudi', 'Kalamkari', 'Budithi Brass Craft'],
+    'Arunachal Pradesh': ['Monpa Mask', 'Thangka Paintings', 'Wancho Wood Carving'],
+    'Assam': ['Bihu Dance', 'Sattriya Dance', 'Assam Silk Weaving'],
+    'Bihar': ['Madhubani Painting', 'Manjusha Art', 'Sujni Embroidery'],
+    'Chhattisgarh': ['Panthi Dance', 'Godna Art', 'Bell Metal Craft'],
+    'Goa': ['Dekni Dance', 'Fugdi Dance', 'Goan Lacework'],
+    'Gujarat': ['Garba', 'Patola Weaving', 'Rogan Art'],
+    'Haryana': ['Phag Dance', 'Embroidery Craft', 'Charpai Weaving'],
+    'Himachal Pradesh': ['Kullu Shawl Weaving', 'Chamba Rumal', 'Kangra Painting'],
+    'Jharkhand': ['Sohrai Painting', 'Chhau Dance', 'Dokra Metal Craft'],
+    'Karnataka': ['Yakshagana', 'Bidri Ware', 'Mysore Painting'],
+    'Kerala': ['Kathakali', 'Mohiniyattam', 'Aranmula Kannadi'],
+    'Madhya Pradesh': ['Gond Art', 'Bagh Print', 'Chanderi Weaving'],
+    'Maharashtra': ['Lavani Dance', 'Warli Painting', 'Paithani Sarees'],
+    'Manipur': ['Manipuri Dance', 'Longpi Pottery', 'Phanek Weaving'],
+    'Meghalaya': ['Nongkrem Dance', 'Bamboo Craft', 'Garo Wangala Dance'],
+    'Mizoram': ['Cheraw Dance', 'Mizo Bamboo Dance', 'Puanchei Textiles'],
+    'Nagaland': ['Hornbill Festival Dances', 'Naga Shawl Weaving', 'Wood Carving'],
+    'Odisha': ['Odissi Dance', 'Pattachitra', 'Applique Work'],
+    'Punjab': ['Bhangra', 'Phulkari Embroidery', 'Jutti Making'],
+    'Rajasthan': ['Ghoomar Dance', 'Blue Pottery', 'Miniature Painting'],
+    'Sikkim': ['Mask Dance', 'Thangka Painting', 'Carpet Weaving'],
+    'Tamil Nadu': ['Bharatanatyam', 'Tanjore Painting', 'Stone Carving'],
+    'Telangana': ['Perini Shivatandavam', 'Nirmal Paintings', 'Bidri Craft'],
+    'Tripura': ['Hojagiri Dance', 'Bamboo Craft', 'Risa Textile Weaving'],
+    'Uttar Pradesh': ['Kathak Dance', 'Chikankari', 'Lucknow Zardozi'],
+    'Uttarakhand': ['Choliya Dance', 'Aipan Art', 'Ringal Craft'],
+    'West Bengal': ['Durga Puja Art', 'Kantha Stitch', 'Patachitra'],
+    'Delhi': ['Kathak Dance', 'Zardozi Work', 'Meenakari Craft'],
+    'Jammu and Kashmir': ['Rauf Dance', 'Pashmina Weaving', 'Walnut Wood Carving'],
+    'Lakshadweep': ['Lava Dance', 'Parichakali', 'Coral Craft', 'Shell Craft']
+}
+
 def generate_mock_data():
     """
     Generate mock data for the application.
@@ -38,41 +73,6 @@ def generate_mock_data():
         for state in region_states:
             state_to_region[state] = region
     
-    # Traditional art forms by state
-    art_forms = {
-        'Andhra Pradesh': ['Kuchipudi', 'Kalamkari', 'Budithi Brass Craft'],
-        'Arunachal Pradesh': ['Monpa Mask', 'Thangka Paintings', 'Wancho Wood Carving'],
-        'Assam': ['Bihu Dance', 'Sattriya Dance', 'Assam Silk Weaving'],
-        'Bihar': ['Madhubani Painting', 'Manjusha Art', 'Sujni Embroidery'],
-        'Chhattisgarh': ['Panthi Dance', 'Godna Art', 'Bell Metal Craft'],
-        'Goa': ['Dekni Dance', 'Fugdi Dance', 'Goan Lacework'],
-        'Gujarat': ['Garba', 'Patola Weaving', 'Rogan Art'],
-        'Haryana': ['Phag Dance', 'Embroidery Craft', 'Charpai Weaving'],
-        'Himachal Pradesh': ['Kullu Shawl Weaving', 'Chamba Rumal', 'Kangra Painting'],
-        'Jharkhand': ['Sohrai Painting', 'Chhau Dance', 'Dokra Metal Craft'],
-        'Karnataka': ['Yakshagana', 'Bidri Ware', 'Mysore Painting'],
-        'Kerala': ['Kathakali', 'Mohiniyattam', 'Aranmula Kannadi'],
-        'Madhya Pradesh': ['Gond Art', 'Bagh Print', 'Chanderi Weaving'],
-        'Maharashtra': ['Lavani Dance', 'Warli Painting', 'Paithani Sarees'],
-        'Manipur': ['Manipuri Dance', 'Longpi Pottery', 'Phanek Weaving'],
-        'Meghalaya': ['Nongkrem Dance', 'Bamboo Craft', 'Garo Wangala Dance'],
-        'Mizoram': ['Cheraw Dance', 'Mizo Bamboo Dance', 'Puanchei Textiles'],
-        'Nagaland': ['Hornbill Festival Dances', 'Naga Shawl Weaving', 'Wood Carving'],
-        'Odisha': ['Odissi Dance', 'Pattachitra', 'Applique Work'],
-        'Punjab': ['Bhangra', 'Phulkari Embroidery', 'Jutti Making'],
-        'Rajasthan': ['Ghoomar Dance', 'Blue Pottery', 'Miniature Painting'],
-        'Sikkim': ['Mask Dance', 'Thangka Painting', 'Carpet Weaving'],
-        'Tamil Nadu': ['Bharatanatyam', 'Tanjore Painting', 'Stone Carving'],
-        'Telangana': ['Perini Shivatandavam', 'Nirmal Paintings', 'Bidri Craft'],
-        'Tripura': ['Hojagiri Dance', 'Bamboo Craft', 'Risa Textile Weaving'],
-        'Uttar Pradesh': ['Kathak Dance', 'Chikankari', 'Lucknow Zardozi'],
-        'Uttarakhand': ['Choliya Dance', 'Aipan Art', 'Ringal Craft'],
-        'West Bengal': ['Durga Puja Art', 'Kantha Stitch', 'Patachitra'],
-        'Delhi': ['Kathak Dance', 'Zardozi Work', 'Meenakari Craft'],
-        'Jammu and Kashmir': ['Rauf Dance', 'Pashmina Weaving', 'Walnut Wood Carving'],
-        'Lakshadweep': ['Lava Dance', 'Parichakali', 'Coral Craft', 'Shell Craft']
-    }
-    
     # Latitude and longitude for each state (approximate centers)
     state_coordinates = {
         'Andhra Pradesh': (15.9129, 79.7400),
@@ -159,8 +159,8 @@ def generate_mock_data():
                 tourist_visits = int(base_visits * seasonal_factor * year_factor * (1 + np.random.normal(0, 0.1)))
                 
                 # Random art form selection for this record
-                if state in art_forms:
-                    art_form = random.choice(art_forms[state])
+                if state in ART_FORMS_BY_STATE:
+                    art_form = random.choice(ART_FORMS_BY_STATE[state])
                 else:
                     art_form = "Traditional Dance"
                 
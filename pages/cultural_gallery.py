@@ -14,7 +14,8 @@ import random
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from data.constants import CULTURAL_CATEGORIES, PEXELS_API_KEY
-from utils.image_utils import get_cultural_images, verify_image_accessibility, get_istock_images
+from utils.image_utils import get_cultural_images, get_istock_images, fetch_images_batch
+from utils.thumbnails import get_thumbnail
 
 # Define hidden gems of India with structured information
 HIDDEN_GEMS = [
@@ -211,6 +212,11 @@ def get_image_for_hidden_gem(gem):
             'source': "Placeholder"
         }
 
+def resolve_hidden_gem_image(gem):
+    """Get a hidden gem's image and its gallery thumbnail (None if it cannot be loaded)."""
+    img_data = get_image_for_hidden_gem(gem)
+    return img_data, get_thumbnail(img_data['url'], 'gallery')
+
 def display_cultural_gallery(category, subcategory=None):
     """Display a gallery of cultural images with proper attribution."""
     st.markdown(f"### 🖼️ {category.title()} Gallery")
@@ -222,13 +228,19 @@ def display_cultural_gallery(category, subcategory=None):
         st.warning(f"No images found for {category}. Please try another category.")
         return
     
+    # Load every image's thumbnail concurrently; images that fail to load are skipped
+    thumbnails = fetch_images_batch(
+        lambda url: get_thumbnail(url, 'gallery'),
+        [img_data['url'] for img_data in images]
+    )
+    
     # Create a grid of images with captions and attribution - improved layout
     cols = st.columns(3)
     for idx, img_data in enumerate(images):
         with cols[idx % 3]:
             try:
                 # Verify image URL is accessible
-                if verify_image_accessibility(img_data['url']):
+                if thumbnails[idx] is not None:
                     # Use a consistent description if none is provided
                     image_description = img_data['description'] or f'Traditional Indian {category}'
                     
@@ -244,7 +256,7 @@ def display_cultural_gallery(category, subcategory=None):
                     """, unsafe_allow_html=True)
                     
                     # Display image with proper aspect ratio
-                    st.image(img_data['url'], use_container_width=True)
+                    st.image(thumbnails[idx], use_container_width=True)
                     
                     # Improved content section with better typography
                     st.markdown(f"""
@@ -284,13 +296,16 @@ def display_hidden_gems():
     </div>
     """, unsafe_allow_html=True)
     
+    # Look up every gem's image and thumbnail concurrently
+    gem_images = fetch_images_batch(resolve_hidden_gem_image, HIDDEN_GEMS)
+    
     # Display hidden gems in a masonry-style layout (3 columns)
     cols = st.columns(3)
     
     for idx, gem in enumerate(HIDDEN_GEMS):
         with cols[idx % 3]:
             # Get image
-            img_data = get_image_for_hidden_gem(gem)
+            img_data, img_thumbnail = gem_images[idx] or (None, None)
             
             # Display location badge
             st.markdown(f"""
@@ -305,8 +320,8 @@ def display_hidden_gems():
             
             # Display the image - using Streamlit's component directly reduces HTML complexity
             try:
-                if verify_image_accessibility(img_data['url']):
-                    st.image(img_data['url'], use_container_width=True)
+                if img_thumbnail is not None:
+                    st.image(img_thumbnail, use_container_width=True)
                 else:
                     # Use placeholder image
                     st.image("https://media.istockphoto.com/id/1147544807/vector/thumbnail-image-vector-graphic.jpg?s=612x612&w=0&k=20&c=rnCKVbdxqkjlcs3xH87-9gocETqpspHFXu5dIGB4wuM=", use_container_width=True)
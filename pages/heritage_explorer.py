@@ -7,7 +7,6 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from matplotlib.colors import LinearSegmentedColormap
 import json
 import requests
 import sys
@@ -17,7 +16,8 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from data.constants import art_form_details, art_form_facts, INDIAN_COLORS
-from utils.image_utils import get_cached_art_form_images
+from utils.image_utils import get_cached_art_form_images, fetch_images_batch
+from utils.thumbnails import thumbnail_data_uri
 from utils.visualization import (
     create_map_visualization, 
     create_pie_chart, 
@@ -25,25 +25,220 @@ from utils.visualization import (
     create_line_chart,
     create_heatmap,
     create_state_choropleth,
-    create_art_forms_wordcloud
+    create_art_forms_wordcloud_image
 )
+from utils.filter_index import dataset_version, get_filter_index, select_rows, take_rows
+from utils.aggregates import get_heritage_aggregates
+from utils.static_figures import static_figure
+from utils.plotly_theme import theme_template
+from utils.map_layers import get_map_markers
 from components.styling import display_art_book, display_art_form_card
 
-# Create custom colormaps
-indian_cmap = LinearSegmentedColormap.from_list('indian_cmap', INDIAN_COLORS['gradient'])
-earth_cmap = LinearSegmentedColormap.from_list('earth_cmap', INDIAN_COLORS['earth'])
+def art_form_card_image(art_form, state):
+    """Card-sized thumbnail (as a data URI) of an art form's first image, or its URL."""
+    image_url = get_cached_art_form_images(art_form, state)
+    if not image_url:
+        return None
+    image_url = image_url[0]['url'] if isinstance(image_url, list) else image_url
+    return thumbnail_data_uri(image_url, 'card') or image_url
 
-def show_heritage_explorer(df):
-    """Display the Heritage Walks page with interactive visualizations."""
+@static_figure
+def conservation_status_chart():
+    """Well-preserved versus at-risk heritage sites by state."""
+    # Create sample data for conservation status by state
+    conservation_data = {
+        'state': ['Rajasthan', 'Tamil Nadu', 'Uttar Pradesh', 'Maharashtra', 'Kerala', 'West Bengal', 'Karnataka'],
+        'well_preserved': [75, 82, 65, 70, 88, 68, 79],
+        'at_risk': [25, 18, 35, 30, 12, 32, 21]
+    }
+    conservation_df = pd.DataFrame(conservation_data)
+    
+    # Create horizontal bar chart for Conservation Status
+    fig = go.Figure()
+    
+    # Add bars for well-preserved sites
+    fig.add_trace(go.Bar(
+        y=conservation_df['state'],
+        x=conservation_df['well_preserved'],
+        name='Well-Preserved',
+        orientation='h',
+        marker=dict(
+            color='rgba(18, 136, 7, 0.7)',
+            line=dict(color='rgba(18, 136, 7, 1.0)', width=1)
+        )
+    ))
+    
+    # Add bars for at-risk sites
+    fig.add_trace(go.Bar(
+        y=conservation_df['state'],
+        x=conservation_df['at_risk'],
+        name='At-Risk',
+        orientation='h',
+        marker=dict(
+            color='rgba(255, 99, 71, 0.7)',
+            line=dict(color='rgba(255, 99, 71, 1.0)', width=1)
+        )
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        template=theme_template(),
+        title='Well-Preserved vs. At-Risk Heritage Sites by State',
+        barmode='stack',
+        xaxis=dict(
+            title='Percentage of Sites (%)',
+            tickfont=dict(color='white'),
+            gridcolor='rgba(255, 255, 255, 0.1)'
+        ),
+        yaxis=dict(
+            title='State',
+            tickfont=dict(color='white'),
+            gridcolor='rgba(255, 255, 255, 0.1)'
+        ),
+        legend=dict(
+            yanchor='top',
+            y=0.99,
+            xanchor='left',
+            x=0.01,
+            bgcolor='rgba(50, 50, 50, 0.5)',
+            bordercolor='rgba(255, 255, 255, 0.2)'
+        ),
+        height=400,
+        margin=dict(l=10, r=10, t=50, b=10)
+    )
+    
+    return fig
+
+
+@static_figure
+def hospitality_ratings_chart():
+    """Hospitality ratings at the top heritage sites."""
+    # Create sample data for hospitality ratings at top heritage sites
+    hospitality_data = {
+        'site': [
+            'Taj Mahal', 'Qutub Minar', 'Khajuraho Temples', 'Hampi', 
+            'Ajanta Caves', 'Konark Sun Temple', 'Elephanta Caves', 
+            'Red Fort', 'Mysore Palace', 'Meenakshi Temple'
+        ],
+        'rating': [4.7, 4.3, 4.8, 4.5, 4.6, 4.2, 3.9, 4.0, 4.9, 4.7],
+        'reviews': [12500, 8700, 5200, 4800, 6300, 3900, 4100, 7800, 9200, 8500]
+    }
+    
+    # Create DataFrame
+    hospitality_df = pd.DataFrame(hospitality_data)
+    
+    # Sort by rating for better visualization
+    hospitality_df = hospitality_df.sort_values('rating', ascending=False)
+    
+    # Create custom colorscale based on ratings (from amber to green)
+    colors = []
+    for rating in hospitality_df['rating']:
+        if rating >= 4.7:
+            colors.append('rgba(76, 175, 80, 0.9)')  # Green for excellent
+        elif rating >= 4.4:
+            colors.append('rgba(139, 195, 74, 0.9)')  # Light Green for very good
+        elif rating >= 4.1:
+            colors.append('rgba(255, 193, 7, 0.9)')  # Amber for good
+        elif rating >= 3.8:
+            colors.append('rgba(255, 152, 0, 0.9)')  # Orange for average
+        else:
+            colors.append('rgba(244, 67, 54, 0.9)')  # Red for below average
+    
+    # Create bar chart
+    fig = go.Figure()
+    
+    # Add bars
+    fig.add_trace(go.Bar(
+        x=hospitality_df['site'],
+        y=hospitality_df['rating'],
+        text=[f"{rating}/5.0<br>({reviews:,} reviews)" for rating, reviews in zip(hospitality_df['rating'], hospitality_df['reviews'])],
+        textposition='auto',
+        hoverinfo='text',
+        marker=dict(
+            color=colors,
+            line=dict(color='rgba(255, 255, 255, 0.5)', width=1.5)
+        ),
+        opacity=0.9
+    ))
+    
+    # Add a horizontal line for average rating
+    average_rating = hospitality_df['rating'].mean()
+    fig.add_shape(
+        type='line',
+        x0=-0.5,
+        y0=average_rating,
+        x1=len(hospitality_df) - 0.5,
+        y1=average_rating,
+        line=dict(
+            color='rgba(255, 255, 255, 0.7)',
+            width=2,
+            dash='dash'
+        )
+    )
+    
+    # Add annotation for average rating
+    fig.add_annotation(
+        x=len(hospitality_df) - 1,
+        y=average_rating + 0.05,
+        text=f"Average Rating: {average_rating:.1f}/5.0",
+        showarrow=False,
+        font=dict(
+            color='rgba(255, 255, 255, 0.9)',
+            size=12
+        ),
+        align='right'
+    )
+    
+    # Update layout
+    fig.update_layout(
+        template=theme_template(),
+        title={
+            'text': 'Hospitality Ratings at Top Heritage Sites',
+            'y': 0.95,
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top'
+        },
+        xaxis=dict(
+            title='Heritage Site',
+            tickangle=-45,
+            tickfont=dict(color='white', size=11),
+            gridcolor='rgba(255, 255, 255, 0.1)'
+        ),
+        yaxis=dict(
+            title='Hospitality Rating (out of 5)',
+            range=[3.5, 5.0],  # Set range to emphasize differences
+            tickfont=dict(color='white'),
+            gridcolor='rgba(255, 255, 255, 0.1)'
+        ),
+        height=500,
+        margin=dict(l=50, r=50, t=80, b=100)  # Extra bottom margin for rotated labels
+    )
+    
+    return fig
+
+
+def show_heritage_explorer(df, df_version=None):
+    """
+    Display the Heritage Walks page with interactive visualizations.
+    
+    Args:
+        df (pandas.DataFrame): The dataset containing tourism information
+        df_version (str, optional): Dataset version from ``dataset_version``; computed when omitted
+    """
     
     st.markdown("<h1 class='main-header'>Heritage Walks</h1>", unsafe_allow_html=True)
     
     # Filter controls
     st.markdown("<h3>🔍 Filter Options</h3>", unsafe_allow_html=True)
     
+    # Precomputed per-state/per-region row positions, shared by every rerun of this dataset
+    df_version = df_version or dataset_version(df)
+    filter_index = get_filter_index(df, df_version)
+    
     # Get unique states and regions
-    all_states = sorted(list(set(df['STATE'].unique())))
-    all_regions = sorted(list(set(df['REGION'].unique())))
+    all_states = list(filter_index['states'])
+    all_regions = list(filter_index['regions'])
     
     # Create filter columns
     filter_col1, filter_col2 = st.columns(2)
@@ -91,17 +286,14 @@ def show_heritage_explorer(df):
             st.info(f"{selected_state} belongs to {selected_region_based_on_state} region, along with {', '.join(other_states)}")
     
     # Filter data based on selections
-    filtered_df = df.copy()
+    state_filter = selected_state if selected_state != "All States" else None
+    region_filter = selected_region if selected_region != "All Regions" else None
+    region_states = tuple(regions_mapping.get(selected_region, []))
+    filtered_df = take_rows(df, select_rows(filter_index, state_filter, region_filter, region_states))
     
-    if selected_region != "All Regions":
-        states_in_selected_region = regions_mapping.get(selected_region, [])
-        if states_in_selected_region:
-            filtered_df = filtered_df[filtered_df['STATE'].isin(states_in_selected_region)]
-        else:
-            filtered_df = filtered_df[filtered_df['REGION'] == selected_region]
-            
-    if selected_state != "All States":
-        filtered_df = filtered_df[filtered_df['STATE'] == selected_state]
+    # All charts below read from one memoized aggregate bundle per selection
+    aggregates = get_heritage_aggregates(df, df_version, state_filter, region_filter, region_states)
+    metrics = aggregates['metrics']
     
     # Display key metrics
     st.markdown("<div style='margin: 20px 0;'>", unsafe_allow_html=True)
@@ -113,7 +305,7 @@ def show_heritage_explorer(df):
             <div class='metric-value'>{}</div>
             <div class='metric-label'>Total States</div>
         </div>
-        """.format(len(filtered_df['STATE'].unique())), unsafe_allow_html=True)
+        """.format(metrics['states']), unsafe_allow_html=True)
     
     with col2:
         st.markdown("""
@@ -121,7 +313,7 @@ def show_heritage_explorer(df):
             <div class='metric-value'>{}</div>
             <div class='metric-label'>Total Art Forms</div>
         </div>
-        """.format(len(filtered_df['ART_FORM'].unique())), unsafe_allow_html=True)
+        """.format(metrics['art_forms']), unsafe_allow_html=True)
     
     with col3:
         st.markdown("""
@@ -129,7 +321,7 @@ def show_heritage_explorer(df):
             <div class='metric-value'>{:,}</div>
             <div class='metric-label'>Total Tourist Visits</div>
         </div>
-        """.format(filtered_df['TOURIST_VISITS'].sum()), unsafe_allow_html=True)
+        """.format(metrics['tourist_visits']), unsafe_allow_html=True)
     
     with col4:
         st.markdown("""
@@ -137,7 +329,7 @@ def show_heritage_explorer(df):
             <div class='metric-value'>₹{:,}</div>
             <div class='metric-label'>Total Funding</div>
         </div>
-        """.format(filtered_df['FUNDING_RECEIVED'].sum()), unsafe_allow_html=True)
+        """.format(metrics['funding_received']), unsafe_allow_html=True)
     
     st.markdown("</div>", unsafe_allow_html=True)
     
@@ -145,11 +337,7 @@ def show_heritage_explorer(df):
     st.markdown("<h2 class='sub-header'>🗺️ Cultural Heritage Map</h2>", unsafe_allow_html=True)
     
     # Create map data
-    map_data = filtered_df.groupby(['STATE', 'LATITUDE', 'LONGITUDE']).agg({
-        'TOURIST_VISITS': 'sum',
-        'FUNDING_RECEIVED': 'sum',
-        'ART_FORM': lambda x: ', '.join(set(x))
-    }).reset_index()
+    map_data = aggregates['map_data']
     
     # Set map title and center
     map_title = "Cultural Heritage Sites Across India"
@@ -161,14 +349,24 @@ def show_heritage_explorer(df):
     map_center = {"lat": 23.5937, "lon": 78.9629}  # Default center (India)
     map_zoom = 3.5  # Default zoom
     
-    if selected_state != "All States" and selected_state in df['STATE'].unique():
-        state_coordinates = df[df['STATE'] == selected_state][['LATITUDE', 'LONGITUDE']].iloc[0]
-        map_center = {"lat": state_coordinates['LATITUDE'], "lon": state_coordinates['LONGITUDE']}
+    if selected_state != "All States" and selected_state in filter_index['state_coordinates']:
+        map_center = dict(filter_index['state_coordinates'][selected_state])
         map_zoom = 5.5
     
+    # Merge nearby sites into clusters once there are too many markers for one payload
+    map_markers, map_info = get_map_markers(
+        map_data,
+        'LATITUDE',
+        'LONGITUDE',
+        map_zoom,
+        sum_cols=('TOURIST_VISITS', 'FUNDING_RECEIVED'),
+        label_col='STATE',
+        text_cols=('ART_FORM',)
+    )
+    
     # Create map visualization
     fig = px.scatter_mapbox(
-        map_data,
+        map_markers,
         lat='LATITUDE',
         lon='LONGITUDE',
         size='TOURIST_VISITS',
@@ -180,7 +378,8 @@ def show_heritage_explorer(df):
             'LONGITUDE': False,
             'TOURIST_VISITS': True,
             'FUNDING_RECEIVED': True,
-            'ART_FORM': True
+            'ART_FORM': True,
+            'SITES': map_info['mode'] != 'points'
         },
         color_continuous_scale=px.colors.sequential.Viridis,
         zoom=map_zoom,
@@ -191,19 +390,20 @@ def show_heritage_explorer(df):
     
     # Update map layout
     fig.update_layout(
+        template=theme_template(),
         mapbox_style="carto-darkmatter",
         margin={"r":0,"t":30,"l":0,"b":0},
         height=600,
         showlegend=False,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title=dict(
             font=dict(size=16, color='white')
         )
     )
     
     st.plotly_chart(fig, use_container_width=True)
+    if map_info['mode'] != 'points':
+        st.caption(f"{map_info['total_points']:,} sites grouped into {map_info['plotted_points']:,} "
+                   f"clusters at this zoom level; marker size shows the combined visits.")
     
     # Display art form cards if a state is selected
     if selected_state != "All States":
@@ -213,6 +413,12 @@ def show_heritage_explorer(df):
         # Get unique art forms for the selected state
         state_art_forms = filtered_df[filtered_df['STATE'] == selected_state]['ART_FORM'].unique()
         
+        # Look up every card's image concurrently
+        art_form_images = fetch_images_batch(
+            lambda art_form: art_form_card_image(art_form, selected_state),
+            state_art_forms
+        )
+        
         # Create three columns for the art form cards
         col1, col2, col3 = st.columns(3)
         
@@ -228,10 +434,8 @@ def show_heritage_explorer(df):
                 # Try with title case if not found
                 fact = art_form_facts.get(art_form.title(), 'Interesting fact about this art form coming soon!')
             
-            # Get image URL from cached image database
-            image_url = get_cached_art_form_images(art_form, selected_state)
-            if image_url:
-                image_url = image_url[0]['url'] if isinstance(image_url, list) else image_url
+            # Get card image from cached image database
+            image_url = art_form_images[i]
             
             # Display art form card in the appropriate column
             with col1 if i % 3 == 0 else col2 if i % 3 == 1 else col3:
@@ -244,7 +448,7 @@ def show_heritage_explorer(df):
     
     with col1:
         # Regional Tourist Visits - Polar Area Chart
-        regional_visits = filtered_df.groupby('REGION')['TOURIST_VISITS'].sum().reset_index()
+        regional_visits = aggregates['regional'][['REGION', 'TOURIST_VISITS']]
         fig_visits = go.Figure()
         
         fig_visits.add_trace(go.Barpolar(
@@ -258,6 +462,7 @@ def show_heritage_explorer(df):
         ))
         
         fig_visits.update_layout(
+            template=theme_template(),
             title='Regional Tourist Visits',
             polar=dict(
                 radialaxis=dict(
@@ -274,9 +479,6 @@ def show_heritage_explorer(df):
                 ),
                 bgcolor='rgba(0,0,0,0)'
             ),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
             height=400,
             margin=dict(t=50, b=0, l=50, r=50)
         )
@@ -285,7 +487,7 @@ def show_heritage_explorer(df):
         
     with col2:
         # Regional Funding
-        regional_funding = filtered_df.groupby('REGION')['FUNDING_RECEIVED'].sum().reset_index()
+        regional_funding = aggregates['regional'][['REGION', 'FUNDING_RECEIVED']]
         fig_funding = px.bar(
             regional_funding,
             x='REGION',
@@ -295,10 +497,8 @@ def show_heritage_explorer(df):
             color_discrete_sequence=px.colors.qualitative.Set3
         )
         fig_funding.update_layout(
+            template=theme_template(),
             showlegend=False,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
             xaxis=dict(gridcolor='rgba(255, 255, 255, 0.1)'),
             yaxis=dict(gridcolor='rgba(255, 255, 255, 0.1)')
         )
@@ -311,7 +511,7 @@ def show_heritage_explorer(df):
     
     with col1:
         # Top States by Tourist Visits
-        state_visits = filtered_df.groupby('STATE')['TOURIST_VISITS'].sum().reset_index()
+        state_visits = aggregates['states'][['STATE', 'TOURIST_VISITS']]
         state_visits = state_visits.sort_values('TOURIST_VISITS', ascending=False).head(10)
         
         fig_state_visits = go.Figure()
@@ -327,6 +527,7 @@ def show_heritage_explorer(df):
         ))
         
         fig_state_visits.update_layout(
+            template=theme_template(),
             title='Top 10 States by Tourist Visits',
             polar=dict(
                 radialaxis=dict(
@@ -343,9 +544,6 @@ def show_heritage_explorer(df):
                 ),
                 bgcolor='rgba(0,0,0,0)'
                 ),
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font=dict(color='white'),
             height=400,
             margin=dict(t=50, b=0, l=50, r=50)
         )
@@ -354,7 +552,7 @@ def show_heritage_explorer(df):
     
     with col2:
         # Top States by Funding
-        state_funding = filtered_df.groupby('STATE')['FUNDING_RECEIVED'].sum().reset_index()
+        state_funding = aggregates['states'][['STATE', 'FUNDING_RECEIVED']]
         state_funding = state_funding.sort_values('FUNDING_RECEIVED', ascending=False).head(10)
         fig_state_funding = px.bar(
             state_funding,
@@ -365,10 +563,8 @@ def show_heritage_explorer(df):
             color_continuous_scale=px.colors.sequential.Viridis
         )
         fig_state_funding.update_layout(
+            template=theme_template(),
             showlegend=False,
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
             xaxis=dict(gridcolor='rgba(255, 255, 255, 0.1)'),
             yaxis=dict(gridcolor='rgba(255, 255, 255, 0.1)')
         )
@@ -397,7 +593,7 @@ def show_heritage_explorer(df):
     
     with col1:
         # Popular Art Forms
-        art_forms = filtered_df.groupby('ART_FORM')['TOURIST_VISITS'].sum().reset_index()
+        art_forms = aggregates['art_forms'][['ART_FORM', 'TOURIST_VISITS']]
         art_forms = art_forms.sort_values('TOURIST_VISITS', ascending=False).head(10)
         fig_art_forms = px.bar(
             art_forms,
@@ -407,12 +603,12 @@ def show_heritage_explorer(df):
             color='TOURIST_VISITS',
             color_continuous_scale=px.colors.sequential.Viridis
         )
-        fig_art_forms.update_layout(showlegend=False)
+        fig_art_forms.update_layout(template=theme_template(), showlegend=False)
         st.plotly_chart(fig_art_forms, use_container_width=True)
     
     with col2:
         # Art Forms Funding
-        art_funding = filtered_df.groupby('ART_FORM')['FUNDING_RECEIVED'].sum().reset_index()
+        art_funding = aggregates['art_forms'][['ART_FORM', 'FUNDING_RECEIVED']]
         art_funding = art_funding.sort_values('FUNDING_RECEIVED', ascending=False).head(10)
         fig_art_funding = px.bar(
             art_funding,
@@ -422,17 +618,14 @@ def show_heritage_explorer(df):
             color='FUNDING_RECEIVED',
             color_continuous_scale=px.colors.sequential.Viridis
         )
-        fig_art_funding.update_layout(showlegend=False)
+        fig_art_funding.update_layout(template=theme_template(), showlegend=False)
         st.plotly_chart(fig_art_funding, use_container_width=True)
     
     # Monthly Trends Section
     st.markdown("<h2 class='sub-header'>📅 Monthly Trends</h2>", unsafe_allow_html=True)
     
     # Monthly trends
-    monthly_data = filtered_df.groupby('MONTH').agg({
-        'TOURIST_VISITS': 'sum',
-        'FUNDING_RECEIVED': 'sum'
-    }).reset_index()
+    monthly_data = aggregates['monthly']
     
     # Create separate dataframes for each metric
     tourist_data = monthly_data[['MONTH', 'TOURIST_VISITS']].rename(columns={'TOURIST_VISITS': 'value'})
@@ -455,6 +648,7 @@ def show_heritage_explorer(df):
     )
     
     fig_monthly.update_layout(
+        template=theme_template(),
         xaxis_title='Month',
         yaxis_title='Count',
         showlegend=True
@@ -465,23 +659,15 @@ def show_heritage_explorer(df):
     # Add Word Cloud visualization for art forms
     st.markdown("<h2 class='sub-header'>🎨 Popular Art Forms Word Cloud</h2>", unsafe_allow_html=True)
     
-    # Create word frequencies based on art form popularity (tourist visits)
-    art_form_frequencies = {}
-    for art_form in filtered_df['ART_FORM'].unique():
-        art_form_frequencies[art_form] = filtered_df[filtered_df['ART_FORM'] == art_form]['TOURIST_VISITS'].sum()
-    
-    # Limit to top 15 art forms by tourist visits
-    if len(art_form_frequencies) > 15:
-        art_form_frequencies = dict(sorted(art_form_frequencies.items(), 
-                                           key=lambda item: item[1], 
-                                           reverse=True)[:15])
+    # Top 15 art forms by tourist visits, from the aggregate bundle
+    art_form_frequencies = aggregates['art_form_frequencies']
     
     if art_form_frequencies:
-        fig = create_art_forms_wordcloud(
+        wordcloud_image = create_art_forms_wordcloud_image(
             art_form_frequencies,
             'Popular Indian Art Forms by Visitor Interest'
         )
-        st.pyplot(fig)
+        st.image(wordcloud_image, use_container_width=True)
     else:
         st.warning("No art form data available for the selected filters.")
     
@@ -580,6 +766,7 @@ def show_heritage_explorer(df):
         
         # Update layout with dual y-axes
         fig.update_layout(
+            template=theme_template(),
             title='Monthly Tourism Patterns with Revenue (2019-2024)',
             xaxis=dict(
                 title=dict(text='Month', font=dict(color='white')),
@@ -600,9 +787,6 @@ def show_heritage_explorer(df):
                 gridcolor='rgba(255, 255, 255, 0)'
             ),
             legend_title='Metrics',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
             margin=dict(l=40, r=40, t=40, b=40),
             legend=dict(
                 bgcolor='rgba(50, 50, 50, 0.7)',
@@ -706,6 +890,7 @@ def show_heritage_explorer(df):
         
         # Update layout
         fig.update_layout(
+            template=theme_template(),
             title='Annual Tourism Growth (2019-2024)',
             xaxis=dict(
                 title=dict(text='Year', font=dict(color='white')),
@@ -731,9 +916,6 @@ def show_heritage_explorer(df):
                 bordercolor='rgba(255, 255, 255, 0.2)',
                 borderwidth=1
             ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
             height=500,
             margin=dict(l=40, r=60, t=50, b=50)
         )
@@ -783,6 +965,7 @@ def show_heritage_explorer(df):
         
         # Update layout
         fig.update_layout(
+            template=theme_template(),
             title='Festival Impact on Tourism',
             xaxis=dict(
                 title='Festival Duration (Days)',
@@ -800,9 +983,6 @@ def show_heritage_explorer(df):
                 bordercolor='rgba(255, 255, 255, 0.2)',
                 borderwidth=1
             ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
             height=500
         )
         
@@ -872,6 +1052,7 @@ def show_heritage_explorer(df):
         
         # Update layout
         fig.update_layout(
+            template=theme_template(),
             title='Impact of Government Tourism Schemes (Indexed to 2019=100)',
             xaxis=dict(
                 title='Year',
@@ -890,9 +1071,6 @@ def show_heritage_explorer(df):
                 bordercolor='rgba(255, 255, 255, 0.2)',
                 borderwidth=1
             ),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
             height=500
         )
         
@@ -968,11 +1146,8 @@ def show_heritage_explorer(df):
     
     # Update layout
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
+        template=theme_template(),
         title_font=dict(size=18),
-        margin=dict(t=50, b=50, l=50, r=50),
         legend=dict(
             font=dict(size=12),
             bgcolor='rgba(50, 50, 50, 0.5)',  # Semi-transparent legend
@@ -993,69 +1168,7 @@ def show_heritage_explorer(df):
     # Add Conservation Status visualization
     st.markdown("<h2 class='sub-header'>🏛️ Conservation Status Analysis</h2>", unsafe_allow_html=True)
     
-    # Create sample data for conservation status by state
-    conservation_data = {
-        'state': ['Rajasthan', 'Tamil Nadu', 'Uttar Pradesh', 'Maharashtra', 'Kerala', 'West Bengal', 'Karnataka'],
-        'well_preserved': [75, 82, 65, 70, 88, 68, 79],
-        'at_risk': [25, 18, 35, 30, 12, 32, 21]
-    }
-    conservation_df = pd.DataFrame(conservation_data)
-    
-    # Create horizontal bar chart for Conservation Status
-    fig = go.Figure()
-    
-    # Add bars for well-preserved sites
-    fig.add_trace(go.Bar(
-        y=conservation_df['state'],
-        x=conservation_df['well_preserved'],
-        name='Well-Preserved',
-        orientation='h',
-        marker=dict(
-            color='rgba(18, 136, 7, 0.7)',
-            line=dict(color='rgba(18, 136, 7, 1.0)', width=1)
-        )
-    ))
-    
-    # Add bars for at-risk sites
-    fig.add_trace(go.Bar(
-        y=conservation_df['state'],
-        x=conservation_df['at_risk'],
-        name='At-Risk',
-        orientation='h',
-        marker=dict(
-            color='rgba(255, 99, 71, 0.7)',
-            line=dict(color='rgba(255, 99, 71, 1.0)', width=1)
-        )
-    ))
-    
-    # Update layout
-    fig.update_layout(
-        title='Well-Preserved vs. At-Risk Heritage Sites by State',
-        barmode='stack',
-        xaxis=dict(
-            title='Percentage of Sites (%)',
-            tickfont=dict(color='white'),
-            gridcolor='rgba(255, 255, 255, 0.1)'
-        ),
-        yaxis=dict(
-            title='State',
-            tickfont=dict(color='white'),
-            gridcolor='rgba(255, 255, 255, 0.1)'
-        ),
-        legend=dict(
-            x=0.01,
-            y=0.99,
-            bgcolor='rgba(50, 50, 50, 0.5)',
-            bordercolor='rgba(255, 255, 255, 0.2)'
-        ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
-        height=400,
-        margin=dict(l=10, r=10, t=50, b=10)
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(conservation_status_chart(), use_container_width=True)
     
     # Add insights card for Conservation Status
     st.markdown("""
@@ -1108,6 +1221,7 @@ def show_heritage_explorer(df):
     
     # Update layout
     fig.update_layout(
+        template=theme_template(),
         title='Environmental Impact: High-Traffic vs. Low-Traffic Sites',
         xaxis=dict(
             title='Annual Visitor Traffic',
@@ -1121,9 +1235,6 @@ def show_heritage_explorer(df):
             showgrid=True,
             gridcolor='rgba(255, 255, 255, 0.1)'
         ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
         height=500,
         margin=dict(l=10, r=10, t=50, b=10),
         legend=dict(
@@ -1175,112 +1286,7 @@ def show_heritage_explorer(df):
     # Add Visitor Satisfaction bar chart
     st.markdown("<h2 class='sub-header'>⭐ Visitor Satisfaction: Hospitality Ratings</h2>", unsafe_allow_html=True)
     
-    # Create sample data for hospitality ratings at top heritage sites
-    hospitality_data = {
-        'site': [
-            'Taj Mahal', 'Qutub Minar', 'Khajuraho Temples', 'Hampi', 
-            'Ajanta Caves', 'Konark Sun Temple', 'Elephanta Caves', 
-            'Red Fort', 'Mysore Palace', 'Meenakshi Temple'
-        ],
-        'rating': [4.7, 4.3, 4.8, 4.5, 4.6, 4.2, 3.9, 4.0, 4.9, 4.7],
-        'reviews': [12500, 8700, 5200, 4800, 6300, 3900, 4100, 7800, 9200, 8500]
-    }
-    
-    # Create DataFrame
-    hospitality_df = pd.DataFrame(hospitality_data)
-    
-    # Sort by rating for better visualization
-    hospitality_df = hospitality_df.sort_values('rating', ascending=False)
-    
-    # Create custom colorscale based on ratings (from amber to green)
-    colors = []
-    for rating in hospitality_df['rating']:
-        if rating >= 4.7:
-            colors.append('rgba(76, 175, 80, 0.9)')  # Green for excellent
-        elif rating >= 4.4:
-            colors.append('rgba(139, 195, 74, 0.9)')  # Light Green for very good
-        elif rating >= 4.1:
-            colors.append('rgba(255, 193, 7, 0.9)')  # Amber for good
-        elif rating >= 3.8:
-            colors.append('rgba(255, 152, 0, 0.9)')  # Orange for average
-        else:
-            colors.append('rgba(244, 67, 54, 0.9)')  # Red for below average
-    
-    # Create bar chart
-    fig = go.Figure()
-    
-    # Add bars
-    fig.add_trace(go.Bar(
-        x=hospitality_df['site'],
-        y=hospitality_df['rating'],
-        text=[f"{rating}/5.0<br>({reviews:,} reviews)" for rating, reviews in zip(hospitality_df['rating'], hospitality_df['reviews'])],
-        textposition='auto',
-        hoverinfo='text',
-        marker=dict(
-            color=colors,
-            line=dict(color='rgba(255, 255, 255, 0.5)', width=1.5)
-        ),
-        opacity=0.9
-    ))
-    
-    # Add a horizontal line for average rating
-    average_rating = hospitality_df['rating'].mean()
-    fig.add_shape(
-        type='line',
-        x0=-0.5,
-        y0=average_rating,
-        x1=len(hospitality_df) - 0.5,
-        y1=average_rating,
-        line=dict(
-            color='rgba(255, 255, 255, 0.7)',
-            width=2,
-            dash='dash'
-        )
-    )
-    
-    # Add annotation for average rating
-    fig.add_annotation(
-        x=len(hospitality_df) - 1,
-        y=average_rating + 0.05,
-        text=f"Average Rating: {average_rating:.1f}/5.0",
-        showarrow=False,
-        font=dict(
-            color='rgba(255, 255, 255, 0.9)',
-            size=12
-        ),
-        align='right'
-    )
-    
-    # Update layout
-    fig.update_layout(
-        title={
-            'text': 'Hospitality Ratings at Top Heritage Sites',
-            'y': 0.95,
-            'x': 0.5,
-            'xanchor': 'center',
-            'yanchor': 'top'
-        },
-        xaxis=dict(
-            title='Heritage Site',
-            tickangle=-45,
-            tickfont=dict(color='white', size=11),
-            gridcolor='rgba(255, 255, 255, 0.1)'
-        ),
-        yaxis=dict(
-            title='Hospitality Rating (out of 5)',
-            range=[3.5, 5.0],  # Set range to emphasize differences
-            tickfont=dict(color='white'),
-            gridcolor='rgba(255, 255, 255, 0.1)'
-        ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
-        height=500,
-        margin=dict(l=50, r=50, t=80, b=100)  # Extra bottom margin for rotated labels
-    )
-    
-    # Display the chart
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(hospitality_ratings_chart(), use_container_width=True)
     
     # Add insights about hospitality ratings
     st.markdown("""
@@ -1294,14 +1300,4 @@ def show_heritage_explorer(df):
             <li><b>Review Volume:</b> Taj Mahal has highest engagement with 12,500+ hospitality-related reviews</li>
         </ul>
     </div>
-    """, unsafe_allow_html=True)     # Update the map style to dark theme
-    fig.update_layout(
-        mapbox_style="carto-darkmatter",
-        margin={"r":0,"t":30,"l":0,"b":0},
-        height=600,
-        showlegend=False,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white')
-    ) 
-
+    """, unsafe_allow_html=True)
@@ -16,14 +16,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from data.constants import lesser_known_sites, responsible_tourism_tips
 from components.styling import display_insights
+from utils.static_figures import static_figure
+from utils.plotly_theme import theme_template
 
-def show_responsible_tourism():
-    """Display the Responsible Tourism page with interactive visualizations."""
-    st.markdown("<h1 class='main-header'>Responsible Tourism</h1>", unsafe_allow_html=True)
-    
-    # Add Bubble Chart Section at the top
-    st.markdown("<h2 class='sub-header'>📊 Tourism Impact Analysis</h2>", unsafe_allow_html=True)
-    
+@static_figure
+def tourism_impact_chart():
+    """Bubble chart of popular sites versus hidden gems."""
     # Create sample data for the bubble chart
     tourism_data = pd.DataFrame({
         'site': [
@@ -69,17 +67,13 @@ def show_responsible_tourism():
             'category': 'Site Category'
         },
         color_discrete_sequence=['#FF6B6B', '#4ECDC4'],
-        template='plotly_dark'
+        template=theme_template(dark=True)
     )
     
     # Update layout for better visibility
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=600,
-        margin=dict(t=50, b=50, l=50, r=50),
         legend=dict(
             yanchor="top",
             y=0.99,
@@ -122,22 +116,12 @@ def show_responsible_tourism():
         font=dict(color='white', size=12)
     )
     
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Add insights below the chart
-    display_insights("Key Insights", [
-        "Popular sites (red bubbles) show significantly higher visitor numbers and revenue",
-        "Hidden gems (teal bubbles) offer sustainable tourism opportunities with lower environmental impact",
-        "Site prominence (bubble size) correlates with visitor numbers but not necessarily with cultural significance",
-        "Lesser-known sites provide opportunities for more authentic cultural experiences"
-    ])
-    
-    # Add spacing after the section
-    st.markdown("<div style='margin-bottom: 40px;'></div>", unsafe_allow_html=True)
-    
-    # NEW: Sankey Diagram - Flow of Tourism Revenue
-    st.markdown("<h2 class='sub-header'>💰 Flow of Tourism Revenue: Hotspots vs. Untouched Sites</h2>", unsafe_allow_html=True)
-    
+    return fig
+
+
+@static_figure
+def revenue_flow_chart():
+    """Sankey diagram of tourism revenue flowing into the local economy."""
     # Create sample data for the Sankey diagram
     popular_sites = ['Taj Mahal', 'Qutub Minar', 'Konark Sun Temple']
     lesser_sites = ['Champaner-Pavagadh', 'Majuli Island', 'Chettinad']
@@ -202,7 +186,7 @@ def show_responsible_tourism():
         'rgba(255,107,107,0.6)', 'rgba(255,107,107,0.6)', 'rgba(255,107,107,0.6)', 'rgba(255,107,107,0.6)', 'rgba(255,107,107,0.6)',  # Taj Mahal
         'rgba(255,159,107,0.6)', 'rgba(255,159,107,0.6)', 'rgba(255,159,107,0.6)', 'rgba(255,159,107,0.6)', 'rgba(255,159,107,0.6)',  # Qutub Minar
         'rgba(255,191,107,0.6)', 'rgba(255,191,107,0.6)', 'rgba(255,191,107,0.6)', 'rgba(255,191,107,0.6)', 'rgba(255,191,107,0.6)',  # Konark
-        
+    
         # Lesser sites - different teal/blue shades
         'rgba(78,205,196,0.6)', 'rgba(78,205,196,0.6)', 'rgba(78,205,196,0.6)', 'rgba(78,205,196,0.6)', 'rgba(78,205,196,0.6)',  # Champaner
         'rgba(78,196,205,0.6)', 'rgba(78,196,205,0.6)', 'rgba(78,196,205,0.6)', 'rgba(78,196,205,0.6)', 'rgba(78,196,205,0.6)',  # Majuli
@@ -229,17 +213,40 @@ def show_responsible_tourism():
     )])
     
     fig.update_layout(
+        template=theme_template(),
         title_text="Revenue Flow from Heritage Sites to Local Economy",
         font_size=12,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
         title_font=dict(size=20),
-        height=600,
-        margin=dict(t=50, b=50, l=50, r=50)
+        height=600
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+
+def show_responsible_tourism():
+    """Display the Responsible Tourism page with interactive visualizations."""
+    st.markdown("<h1 class='main-header'>Responsible Tourism</h1>", unsafe_allow_html=True)
+    
+    # Add Bubble Chart Section at the top
+    st.markdown("<h2 class='sub-header'>📊 Tourism Impact Analysis</h2>", unsafe_allow_html=True)
+    
+    st.plotly_chart(tourism_impact_chart(), use_container_width=True)
+    
+    # Add insights below the chart
+    display_insights("Key Insights", [
+        "Popular sites (red bubbles) show significantly higher visitor numbers and revenue",
+        "Hidden gems (teal bubbles) offer sustainable tourism opportunities with lower environmental impact",
+        "Site prominence (bubble size) correlates with visitor numbers but not necessarily with cultural significance",
+        "Lesser-known sites provide opportunities for more authentic cultural experiences"
+    ])
+    
+    # Add spacing after the section
+    st.markdown("<div style='margin-bottom: 40px;'></div>", unsafe_allow_html=True)
+    
+    # NEW: Sankey Diagram - Flow of Tourism Revenue
+    st.markdown("<h2 class='sub-header'>💰 Flow of Tourism Revenue: Hotspots vs. Untouched Sites</h2>", unsafe_allow_html=True)
+    
+    st.plotly_chart(revenue_flow_chart(), use_container_width=True)
     
     # Add insights below the Sankey chart
     display_insights("Key Insights", [
@@ -287,17 +294,13 @@ def show_responsible_tourism():
         title='Monthly Visitor Distribution Across Heritage Sites',
         labels={'Visitors': 'Number of Visitors', 'Month': 'Month'},
         color_discrete_sequence=['#FF6B6B', '#FF9F80', '#FFBF80', '#4ECDC4', '#A2FAE8', '#80CBC4'],
-        template='plotly_dark'
+        template=theme_template(dark=True)
     )
     
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=600,
-        margin=dict(t=50, b=50, l=50, r=50),
         legend=dict(
             yanchor="top",
             y=0.99,
@@ -363,17 +366,13 @@ def show_responsible_tourism():
         title='Environmental Impact Comparison',
         labels={'value': 'Impact Units', 'site': 'Heritage Site'},
         color_discrete_sequence=['#2E8B57', '#4169E1', '#8B4513'],  # Green for carbon, Blue for water, Brown for waste
-        template='plotly_dark',
+        template=theme_template(dark=True),
         barmode='group'
     )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
         legend=dict(
             yanchor="top",
             y=0.99,
@@ -450,6 +449,7 @@ def show_responsible_tourism():
     
     # Update layout
     fig.update_layout(
+        template=theme_template(),
         polar=dict(
             radialaxis=dict(
                 visible=True,
@@ -464,12 +464,8 @@ def show_responsible_tourism():
             ),
             bgcolor='rgba(0,0,0,0)'
         ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
         legend=dict(
             yanchor="top",
             y=0.99,
@@ -3,6 +3,7 @@ Tourism Trends page for DesiVerse application.
 Displays analytics about tourism trends in India.
 """
 
+import functools
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -21,14 +22,133 @@ from utils.visualization import (
     create_pie_chart,
     create_line_chart,
     create_scatter_plot,
+    create_large_scatter_plot,
     create_tourism_bar_chart,
     create_seasonal_line_chart,
     create_tourism_pie_chart,
-    create_funding_heatmap,
-    create_art_forms_wordcloud,
+    create_funding_heatmap_image,
+    create_art_forms_wordcloud_image,
     create_state_choropleth
 )
-from utils.data_exporter import export_all_project_data
+from utils.export_jobs import EXPORTS_ENABLED, get_export_job_manager, read_export_archive
+from utils.static_figures import static_figure
+from utils.plotly_theme import theme_template
+from utils.map_layers import get_map_markers
+
+@static_figure
+def heritage_sites_chart():
+    """Visitor distribution at the top heritage sites (ASI figures)."""
+    # Create sample data for top heritage sites with real ASI monument data
+    heritage_sites = ['Taj Mahal', 'Qutub Minar', 'Konark Sun Temple', 'Khajuraho', 'Hampi']
+    domestic_visitors = [6100000, 3200000, 2800000, 2500000, 2200000]  # 61 lakh, 32 lakh, etc.
+    foreign_visitors = [680000, 450000, 380000, 320000, 280000]  # 6.8 lakh, 4.5 lakh, etc.
+    
+    fig = create_tourism_bar_chart(
+        domestic_visitors,
+        foreign_visitors,
+        heritage_sites,
+        "Visitor Distribution at Top Heritage Sites (2023-24)"
+    )
+    
+    return fig
+
+
+@static_figure
+def seasonal_trends_chart():
+    """Monthly domestic and foreign tourism trends."""
+    # Create monthly trend data with realistic seasonal patterns
+    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    
+    # Domestic tourism peaks during holiday seasons (Dec-Jan, Oct for Diwali)
+    domestic_monthly = [950000, 820000, 700000, 550000, 480000, 420000, 
+                        550000, 600000, 720000, 980000, 890000, 1100000]
+    
+    # Foreign tourism peaks in winter months but drops in monsoon (Jun-Aug)
+    foreign_monthly = [120000, 105000, 95000, 85000, 70000, 45000, 
+                      30000, 35000, 60000, 90000, 110000, 130000]
+    
+    fig = create_seasonal_line_chart(
+        months,
+        domestic_monthly,
+        foreign_monthly,
+        "Monthly Tourism Trends (2023-24)"
+    )
+    
+    return fig
+
+
+@static_figure
+def tourism_types_chart():
+    """Distribution of tourism types (WTTC/Ministry of Tourism figures)."""
+    # Create data for tourism types based on WTTC/Ministry of Tourism figures
+    tourism_types = ['Heritage', 'Pilgrimage', 'Natural', 'Cultural', 'Adventure']
+    percentages = [35, 25, 20, 15, 5]  # Percentages of total tourism
+    
+    fig = create_tourism_pie_chart(
+        tourism_types,
+        percentages,
+        'Distribution of Tourism Types in India'
+    )
+    
+    return fig
+
+
+def display_export_panel(df):
+    """
+    Display the project data export controls.
+    
+    Exports run as background jobs, so the page stays responsive while the
+    files are written. Only the job ID is kept in the session state; the
+    status area polls the job as a fragment while it is running.
+    
+    Args:
+        df (pandas.DataFrame): The dataset to export
+    """
+    manager = get_export_job_manager()
+    job = manager.get(st.session_state.get('export_job_id'))
+    
+    def export_status():
+        job = manager.get(st.session_state.get('export_job_id'))
+        
+        if job is None or job.finished:
+            if st.button("📥 Export All Project Data"):
+                st.session_state.export_job_id = manager.submit(df)
+                st.rerun()
+        
+        if job is None:
+            return
+        
+        if not job.finished:
+            st.progress(job.progress, text=job.message)
+            if st.button("Cancel export", key="cancel_export"):
+                job.cancel()
+            return
+        
+        if st.session_state.get('export_polling'):
+            # The job finished while polling: rerun once to stop the auto-refresh
+            st.rerun()
+        
+        if job.status == 'completed':
+            export_info = job.result
+            st.success(f"Data exported successfully! Files saved in {export_info['base_directory']}")
+            st.info("Exported data categories:")
+            for category, path in export_info['categories'].items():
+                st.write(f"- {category.replace('_', ' ').title()}: {path}")
+            st.write(f"- Metadata: {export_info['metadata_file']}")
+            st.download_button(
+                "Download export (.zip)",
+                data=functools.partial(read_export_archive, job.archive_path),
+                file_name=os.path.basename(job.archive_path),
+                mime='application/zip'
+            )
+        elif job.status == 'cancelled':
+            st.info("Export cancelled.")
+        else:
+            st.error(f"Export failed: {job.error}")
+    
+    # Poll every second only while a job is in flight
+    st.session_state.export_polling = job is not None and not job.finished
+    st.fragment(export_status, run_every=1 if st.session_state.export_polling else None)()
 
 def show_tourism_analytics(df):
     """
@@ -39,14 +159,9 @@ def show_tourism_analytics(df):
     """
     st.markdown("<h1 class='main-header'>Tourism Trends</h1>", unsafe_allow_html=True)
     
-    # Add export button 
-    # if st.button("📥 Export All Project Data"):
-    #     export_info = export_all_project_data(df)
-    #     st.success(f"Data exported successfully! Files saved in {export_info['base_directory']}")
-    #     st.info("Exported data categories:")
-    #     for category, path in export_info['categories'].items():
-    #         st.write(f"- {category.replace('_', ' ').title()}: {path}")
-    #     st.write(f"- Metadata: {export_info['metadata_file']}")
+    # Add export button, only where writing exports on the server is enabled
+    if EXPORTS_ENABLED:
+        display_export_panel(df)
     
     
     st.markdown("<h3>📊 Analysis Options</h3>", unsafe_allow_html=True)
@@ -112,9 +227,20 @@ def show_tourism_analytics(df):
         'FUNDING_RECEIVED': 'sum'
     }).reset_index()
     
+    # Merge nearby sites into clusters once there are too many markers for one payload
+    map_zoom = 3.5
+    map_markers, map_info = get_map_markers(
+        map_data,
+        'LATITUDE',
+        'LONGITUDE',
+        map_zoom,
+        sum_cols=('TOURIST_VISITS', 'FUNDING_RECEIVED'),
+        label_col='STATE'
+    )
+    
     # Create map visualization directly instead of using the utility function
     fig = px.scatter_mapbox(
-        map_data,
+        map_markers,
         lat='LATITUDE',
         lon='LONGITUDE',
         size='TOURIST_VISITS',
@@ -124,25 +250,27 @@ def show_tourism_analytics(df):
             'LATITUDE': False,
             'LONGITUDE': False,
             'TOURIST_VISITS': True,
-            'FUNDING_RECEIVED': True
+            'FUNDING_RECEIVED': True,
+            'SITES': map_info['mode'] != 'points'
         },
         color_continuous_scale=px.colors.sequential.Viridis,
-        zoom=3.5,
+        zoom=map_zoom,
         center={"lat": 23.5937, "lon": 78.9629},  # Center of India
         title="Tourism Distribution Across India"
     )
     
     fig.update_layout(
+        template=theme_template(),
         mapbox_style="carto-darkmatter",
         margin={"r":0,"t":30,"l":0,"b":0},
         height=600,
-        showlegend=False,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white')
+        showlegend=False
     )
     
     st.plotly_chart(fig, use_container_width=True)
+    if map_info['mode'] != 'points':
+        st.caption(f"{map_info['total_points']:,} sites grouped into {map_info['plotted_points']:,} "
+                   f"clusters at this zoom level; marker size shows the combined visits.")
     
     # Monthly Tourism Trends
     st.markdown("<h2 class='sub-header'>📈 Monthly Tourism Trends</h2>", unsafe_allow_html=True)
@@ -212,12 +340,9 @@ def show_tourism_analytics(df):
         )
         
         fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white', size=12),
+            template=theme_template(),
             title_font=dict(size=16),
-            height=400,
-            margin=dict(t=50, b=50, l=50, r=50)
+            height=400
         )
         st.plotly_chart(fig, use_container_width=True)
 
@@ -240,12 +365,9 @@ def show_tourism_analytics(df):
         )
         
         fig.update_layout(
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white', size=12),
+            template=theme_template(),
             title_font=dict(size=16),
-            height=400,
-            margin=dict(t=50, b=50, l=50, r=50)
+            height=400
         )
         st.plotly_chart(fig, use_container_width=True)
     
@@ -287,24 +409,18 @@ def show_tourism_analytics(df):
     
     # Correlation Analysis
     st.markdown("<h2 class='sub-header'>📈 Correlation Analysis</h2>", unsafe_allow_html=True)
-    fig = px.scatter(
+    fig, scatter_info = create_large_scatter_plot(
         filtered_df,
-        x='TOURIST_VISITS',
-        y='FUNDING_RECEIVED',
-        color='REGION',
-        hover_data=['STATE', 'ART_FORM'],
-        title='Tourist Visits vs Funding Received'
-    )
-    
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        title_font=dict(size=16),
-        height=500,
-        margin=dict(t=50, b=50, l=50, r=50)
+        'TOURIST_VISITS',
+        'FUNDING_RECEIVED',
+        'REGION',
+        'Tourist Visits vs Funding Received',
+        hover_data=['STATE', 'ART_FORM']
     )
     st.plotly_chart(fig, use_container_width=True)
+    if scatter_info['dropped_points']:
+        st.caption(f"Showing a {scatter_info['plotted_points']:,}-point sample per region "
+                   f"of {scatter_info['total_points']:,} records.")
     
     # Seasonal Impact Analysis
     st.markdown("<h2 class='sub-header'>🌤️ Seasonal Impact Analysis</h2>", unsafe_allow_html=True)
@@ -346,30 +462,16 @@ def show_tourism_analytics(df):
     )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
+        template=theme_template(),
         title_font=dict(size=16),
-        height=500,
-        margin=dict(t=50, b=50, l=50, r=50)
+        height=500
     )
     st.plotly_chart(fig, use_container_width=True)
     
     # Enhanced Bar Chart for Top Heritage Sites
     st.markdown("<h2 class='sub-header'>🏛️ Top Heritage Sites Analysis</h2>", unsafe_allow_html=True)
     
-    # Create sample data for top heritage sites with real ASI monument data
-    heritage_sites = ['Taj Mahal', 'Qutub Minar', 'Konark Sun Temple', 'Khajuraho', 'Hampi']
-    domestic_visitors = [6100000, 3200000, 2800000, 2500000, 2200000]  # 61 lakh, 32 lakh, etc.
-    foreign_visitors = [680000, 450000, 380000, 320000, 280000]  # 6.8 lakh, 4.5 lakh, etc.
-    
-    fig = create_tourism_bar_chart(
-        domestic_visitors,
-        foreign_visitors,
-        heritage_sites,
-        "Visitor Distribution at Top Heritage Sites (2023-24)"
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(heritage_sites_chart(), use_container_width=True)
     
     # Add insights below the chart
     st.markdown("""
@@ -387,24 +489,7 @@ def show_tourism_analytics(df):
 
     st.markdown("<h2 class='sub-header'>📅 Seasonal Tourism Trends</h2>", unsafe_allow_html=True)
     
-    # Create monthly trend data with realistic seasonal patterns
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    # Domestic tourism peaks during holiday seasons (Dec-Jan, Oct for Diwali)
-    domestic_monthly = [950000, 820000, 700000, 550000, 480000, 420000, 
-                        550000, 600000, 720000, 980000, 890000, 1100000]
-    
-    # Foreign tourism peaks in winter months but drops in monsoon (Jun-Aug)
-    foreign_monthly = [120000, 105000, 95000, 85000, 70000, 45000, 
-                      30000, 35000, 60000, 90000, 110000, 130000]
-    
-    fig = create_seasonal_line_chart(
-        months,
-        domestic_monthly,
-        foreign_monthly,
-        "Monthly Tourism Trends (2023-24)"
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(seasonal_trends_chart(), use_container_width=True)
    
     st.markdown("""
     <div class='insights-card'>
@@ -420,16 +505,7 @@ def show_tourism_analytics(df):
     
     st.markdown("<h2 class='sub-header'>🎯 Tourism Type Distribution</h2>", unsafe_allow_html=True)
     
-    # Create data for tourism types based on WTTC/Ministry of Tourism figures
-    tourism_types = ['Heritage', 'Pilgrimage', 'Natural', 'Cultural', 'Adventure']
-    percentages = [35, 25, 20, 15, 5]  # Percentages of total tourism
-    
-    fig = create_tourism_pie_chart(
-        tourism_types,
-        percentages,
-        'Distribution of Tourism Types in India'
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(tourism_types_chart(), use_container_width=True)
     
     # Add insights on tourism types
     st.markdown("""
@@ -460,13 +536,13 @@ def show_tourism_analytics(df):
         [0.48, 0.51, 0.55, 0.82, 0.87]   # Skill Development correlations
     ])
     
-    fig = create_funding_heatmap(
+    heatmap_image = create_funding_heatmap_image(
         correlation_data,
         metrics,
         initiatives,
         'Government Initiative Impact on Tourism Metrics'
     )
-    st.pyplot(fig)
+    st.image(heatmap_image, use_container_width=True)
     
     # Add insights on funding correlations
     st.markdown("""
@@ -505,11 +581,11 @@ def show_tourism_analytics(df):
         'Thangka': 10
     }
     
-    fig = create_art_forms_wordcloud(
+    wordcloud_image = create_art_forms_wordcloud_image(
         art_forms,
         'Popular Indian Art Forms by Visitor Interest'
     )
-    st.pyplot(fig)
+    st.image(wordcloud_image, use_container_width=True)
     
     # Add insights on art forms
     st.markdown("""
@@ -0,0 +1,128 @@
+"""
+Aggregate bundles for DesiVerse application.
+Computes every per-filter rollup used by the Heritage Walks page in one grouped pass.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.filter_index import get_filter_index, select_rows, take_rows
+
+VALUE_COLUMNS = ['TOURIST_VISITS', 'FUNDING_RECEIVED']
+CUBE_KEYS = ['STATE', 'REGION', 'LATITUDE', 'LONGITUDE', 'ART_FORM', 'MONTH']
+
+# Number of art forms shown in the word cloud
+WORDCLOUD_TOP_K = 15
+
+
+def _rollup(cube, keys):
+    """Sum the cube's value columns over the given keys."""
+    return cube.groupby(keys, sort=True)[VALUE_COLUMNS].sum().reset_index()
+
+
+def compute_heritage_aggregates(df):
+    """
+    Compute the Heritage Walks aggregates of a (filtered) dataset.
+
+    The rows are grouped once into a cube of visits and funding by state, region,
+    location, art form and month; every rollup below is derived from that cube.
+
+    Args:
+        df (pandas.DataFrame): The filtered dataset
+
+    Returns:
+        dict: ``metrics`` (dict of totals), and DataFrames ``map_data`` (per state and
+            location, with a comma-separated ``ART_FORM`` list), ``regional``, ``states``,
+            ``art_forms`` and ``monthly``, each holding both value columns
+    """
+    # Keep null keys in the cube; each rollup drops only the nulls of its own keys
+    cube = df.groupby(CUBE_KEYS, sort=False, dropna=False)[VALUE_COLUMNS].sum().reset_index()
+
+    map_data = _rollup(cube, ['STATE', 'LATITUDE', 'LONGITUDE'])
+    art_form_lists = (
+        cube[['STATE', 'LATITUDE', 'LONGITUDE', 'ART_FORM']]
+        .dropna()
+        .drop_duplicates()
+        .sort_values('ART_FORM')
+        .groupby(['STATE', 'LATITUDE', 'LONGITUDE'], sort=True)['ART_FORM']
+        .agg(', '.join)
+    )
+    locations = pd.MultiIndex.from_frame(map_data[['STATE', 'LATITUDE', 'LONGITUDE']])
+    map_data['ART_FORM'] = art_form_lists.reindex(locations, fill_value='').to_numpy()
+
+    art_forms = _rollup(cube, ['ART_FORM'])
+
+    return {
+        'metrics': {
+            'states': int(map_data['STATE'].nunique()),
+            'art_forms': len(art_forms),
+            'tourist_visits': int(cube['TOURIST_VISITS'].sum()),
+            'funding_received': int(cube['FUNDING_RECEIVED'].sum())
+        },
+        'map_data': map_data,
+        'regional': _rollup(cube, ['REGION']),
+        'states': _rollup(cube, ['STATE']),
+        'art_forms': art_forms,
+        'monthly': _rollup(cube, ['MONTH'])
+    }
+
+
+def top_frequencies(codes, weights, names, k=WORDCLOUD_TOP_K):
+    """
+    Sum weights per category code and keep the k largest categories.
+
+    Args:
+        codes (numpy.ndarray): Category code of each row, -1 for a missing category
+        weights (numpy.ndarray): Weight of each row
+        names (tuple): Category names, indexed by code
+        k (int): Number of categories to keep
+
+    Returns:
+        tuple: ``(name, total)`` pairs of the categories present in ``codes``,
+            largest total first and ties broken by code
+    """
+    # pd.factorize marks nulls with -1, which bincount rejects
+    known = codes >= 0
+    codes, weights = codes[known], weights[known]
+
+    totals = np.bincount(codes, weights=weights, minlength=len(names))
+    present = np.flatnonzero(np.bincount(codes, minlength=len(names)))
+
+    if len(present) > k:
+        present = present[np.argpartition(-totals[present], k - 1)[:k]]
+    present = present[np.lexsort((present, -totals[present]))]
+
+    return tuple((names[code], int(totals[code])) for code in present)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_heritage_aggregates(_df, version, state=None, region=None, region_states=()):
+    """
+    Get the Heritage Walks aggregates for a state/region selection.
+
+    Results are shared across sessions and the least recently used selections are
+    evicted first, so the handful of popular states stay warm.
+
+    Args:
+        _df (pandas.DataFrame): The full dataset (not hashed; ``version`` identifies it)
+        version (str): Dataset version from ``dataset_version``
+        state (str, optional): Selected state, or None for all states
+        region (str, optional): Selected region, or None for all regions
+        region_states (tuple, optional): States that make up the selected region
+
+    Returns:
+        dict: Aggregate bundle from ``compute_heritage_aggregates``, plus the word-cloud
+            ``art_form_frequencies`` from ``top_frequencies``
+    """
+    index = get_filter_index(_df, version)
+    rows = select_rows(index, state, region, list(region_states))
+    aggregates = compute_heritage_aggregates(take_rows(_df, rows))
+
+    codes = index['art_form_codes']
+    visits = _df['TOURIST_VISITS'].to_numpy()
+    if rows is not None:
+        codes, visits = codes[rows], visits[rows]
+    aggregates['art_form_frequencies'] = top_frequencies(codes, visits, index['art_form_names'])
+
+    return aggregates
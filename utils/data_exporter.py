@@ -2,22 +2,218 @@ import pandas as pd
 import os
 from datetime import datetime
 import json
+import glob
+import shutil
 import numpy as np
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def export_all_project_data(df, export_dir='exports'):
+
+class ExportCancelled(Exception):
+    """Raised when an export is cancelled before all of its files are written."""
+
+
+# Summaries whose rows belong to a single raw data partition key, as
+# (partition key columns, group-by columns); a differential export only
+# recomputes their rows for changed keys
+SUMMARY_PARTITION_KEYS = {
+    'yearly_summary': (('year',), ('year',)),
+    'regional_analysis': (('year',), ('year', 'region')),
+    'state_analysis': (('year',), ('year', 'state')),
+    'monthly_trends': (('year', 'month'), ('year', 'month')),
+    'art_form_analysis': (('year',), ('year', 'art_form')),
+    'seasonal_analysis': (('year', 'month'), ('year', 'month')),
+    'growth_metrics': (('year',), ('year',))
+}
+
+
+# Summary files of every export, as name -> function building it from the rows it covers
+TOURISM_SUMMARIES = {
+    'yearly_summary': lambda data: data.groupby('year').agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum',
+        'state': 'nunique',
+        'art_form': 'nunique'
+    }).reset_index(),
+    
+    'regional_analysis': lambda data: data.groupby(['year', 'region']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index(),
+    
+    'state_analysis': lambda data: data.groupby(['year', 'state']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index(),
+    
+    'monthly_trends': lambda data: data.groupby(['year', 'month']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index()
+}
+
+# Only exported when the dataset has a 'heritage_site' column
+HERITAGE_SUMMARIES = {
+    'site_analysis': lambda data: data.groupby(['state', 'heritage_site']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index(),
+    'heritage_by_region': lambda data: data.groupby(['region', 'heritage_site']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index()
+}
+
+ART_FORM_SUMMARIES = {
+    'art_form_analysis': lambda data: data.groupby(['year', 'art_form']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index(),
+    
+    'art_forms_by_region': lambda data: data.groupby(['region', 'art_form']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index(),
+    
+    'art_forms_by_state': lambda data: data.groupby(['state', 'art_form']).agg({
+        'tourist_visits': 'sum',
+        'funding_received': 'sum'
+    }).reset_index()
+}
+
+ANALYTICS_SUMMARIES = {
+    'correlation_analysis': lambda data: data[['tourist_visits', 'funding_received']].corr(),
+    'seasonal_analysis': lambda data: data.groupby(['year', 'month']).agg({
+        'tourist_visits': ['mean', 'std', 'min', 'max'],
+        'funding_received': ['mean', 'std', 'min', 'max']
+    }).reset_index(),
+    'growth_metrics': lambda data: data.groupby('year').agg({
+        'tourist_visits': ['sum', 'mean', 'std'],
+        'funding_received': ['sum', 'mean', 'std']
+    }).reset_index()
+}
+
+
+class ExportWriterPool:
     """
-    Export all project data in various formats and breakdowns.
+    Bounded pool that builds and writes export files concurrently.
+    
+    Each job builds its DataFrame inside a worker thread and writes it straight
+    to disk, so at most ``max_pending`` frames are held in memory at once.
+    ``submit`` blocks once that many jobs are in flight, which gives the
+    caller natural backpressure. When the caller knows ``total`` up front,
+    progress is reported against it rather than the files submitted so far.
+    """
+    
+    def __init__(self, max_workers=None, max_pending=None, progress=None, cancel_event=None,
+                 total=None):
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.max_pending = max_pending or self.max_workers
+        self.progress = progress
+        self.total = total
+        self.cancel_event = cancel_event
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='export-writer'
+        )
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._completed = 0
+    
+    def check_cancelled(self):
+        """Raise ``ExportCancelled`` if the export has been cancelled."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ExportCancelled()
+    
+    def _job_done(self, future):
+        self._slots.release()
+        self.file_done()
+    
+    def file_done(self):
+        """Count a finished file, including ones the caller wrote without the pool."""
+        with self._lock:
+            self._completed += 1
+            completed, total = self._completed, self.total or len(self._futures)
+        if self.progress is not None:
+            self.progress(completed, total)
+    
+    def submit(self, key, path, build, index=False):
+        """
+        Queue a file to be built and written.
+        
+        Args:
+            key (str): Name used for this file in the results
+            path (str): Destination path of the CSV file
+            build (callable): Zero-argument function returning the DataFrame to write
+            index (bool): Whether to write the DataFrame index
+        """
+        self.check_cancelled()
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write, path, build, index)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._futures[key] = future
+        future.add_done_callback(self._job_done)
+    
+    def _write(self, path, build, index):
+        self.check_cancelled()
+        start = time.perf_counter()
+        data = build()
+        data.to_csv(path, index=index)
+        return {
+            'path': path,
+            'rows': int(len(data)),
+            'bytes': os.path.getsize(path),
+            'seconds': round(time.perf_counter() - start, 4)
+        }
+    
+    def results(self):
+        """
+        Wait for every queued file and return per-file statistics.
+        
+        Returns:
+            dict: Mapping of file key to its path, rows, bytes and seconds
+        """
+        try:
+            return {key: future.result() for key, future in self._futures.items()}
+        finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        """Drop queued files that have not started and wait for running ones."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _create_export_directories(export_dir):
+    """
+    Create a timestamped export directory with one subdirectory per data category.
     
     Args:
-        df (pandas.DataFrame): The main dataset
         export_dir (str): Base directory to save the exports
+        
+    Returns:
+        tuple: (timestamp, base directory, dict of category name to directory)
     """
     # Create timestamp for file names
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
-    # Create main export directory structure
-    base_dir = f'{export_dir}/project_data_{timestamp}'
-    os.makedirs(base_dir, exist_ok=True)
+    # Create main export directory structure, never sharing it with a concurrent export
+    os.makedirs(export_dir, exist_ok=True)
+    suffix = 0
+    while True:
+        stamp = timestamp if suffix == 0 else f'{timestamp}_{suffix}'
+        base_dir = f'{export_dir}/project_data_{stamp}'
+        try:
+            os.makedirs(base_dir)
+            break
+        except FileExistsError:
+            suffix += 1
+    timestamp = stamp
     
     # Create subdirectories for different data categories
     categories = {
@@ -31,94 +227,11 @@ def export_all_project_data(df, export_dir='exports'):
     for category_dir in categories.values():
         os.makedirs(category_dir, exist_ok=True)
     
-    # 1. Export complete raw dataset
-    df.to_csv(f'{categories["raw"]}/complete_dataset_{timestamp}.csv', index=False)
-    
-    # 2. Tourism Data Exports
-    tourism_data = {
-        'yearly_summary': df.groupby('year').agg({
-            'tourist_visits': 'sum',
-            'funding_received': 'sum',
-            'state': 'nunique',
-            'art_form': 'nunique'
-        }).reset_index(),
-        
-        'regional_analysis': df.groupby(['year', 'region']).agg({
-            'tourist_visits': 'sum',
-            'funding_received': 'sum'
-        }).reset_index(),
-        
-        'state_analysis': df.groupby(['year', 'state']).agg({
-            'tourist_visits': 'sum',
-            'funding_received': 'sum'
-        }).reset_index(),
-        
-        'monthly_trends': df.groupby(['year', 'month']).agg({
-            'tourist_visits': 'sum',
-            'funding_received': 'sum'
-        }).reset_index()
-    }
-    
-    for name, data in tourism_data.items():
-        data.to_csv(f'{categories["tourism"]}/{name}_{timestamp}.csv', index=False)
-    
-    # 3. Heritage Data Exports (only if 'heritage_site' column exists)
-    heritage_exports = []
-    if 'heritage_site' in df.columns:
-        heritage_data = {
-            'site_analysis': df.groupby(['state', 'heritage_site']).agg({
-                'tourist_visits': 'sum',
-                'funding_received': 'sum'
-            }).reset_index(),
-            'heritage_by_region': df.groupby(['region', 'heritage_site']).agg({
-                'tourist_visits': 'sum',
-                'funding_received': 'sum'
-            }).reset_index()
-        }
-        for name, data in heritage_data.items():
-            data.to_csv(f'{categories["heritage"]}/{name}_{timestamp}.csv', index=False)
-            heritage_exports.append(name)
-    else:
-        heritage_exports = None
-    
-    # 4. Art Forms Data Exports
-    art_forms_data = {
-        'art_form_analysis': df.groupby(['year', 'art_form']).agg({
-            'tourist_visits': 'sum',
-            'funding_received': 'sum'
-        }).reset_index(),
-        
-        'art_forms_by_region': df.groupby(['region', 'art_form']).agg({
-            'tourist_visits': 'sum',
-            'funding_received': 'sum'
-        }).reset_index(),
-        
-        'art_forms_by_state': df.groupby(['state', 'art_form']).agg({
-            'tourist_visits': 'sum',
-            'funding_received': 'sum'
-        }).reset_index()
-    }
-    
-    for name, data in art_forms_data.items():
-        data.to_csv(f'{categories["art_forms"]}/{name}_{timestamp}.csv', index=False)
-    
-    # 5. Analytics Data Exports
-    analytics_data = {
-        'correlation_analysis': df[['tourist_visits', 'funding_received']].corr(),
-        'seasonal_analysis': df.groupby(['year', 'month']).agg({
-            'tourist_visits': ['mean', 'std', 'min', 'max'],
-            'funding_received': ['mean', 'std', 'min', 'max']
-        }).reset_index(),
-        'growth_metrics': df.groupby('year').agg({
-            'tourist_visits': ['sum', 'mean', 'std'],
-            'funding_received': ['sum', 'mean', 'std']
-        }).reset_index()
-    }
-    
-    for name, data in analytics_data.items():
-        data.to_csv(f'{categories["analytics"]}/{name}_{timestamp}.csv', index=False)
-    
-    # 6. Create a metadata file
+    return timestamp, base_dir, categories
+
+
+def _write_metadata(base_dir, timestamp, metadata):
+    """Write the export metadata JSON, converting numpy scalars to plain Python."""
     def to_py(obj):
         if isinstance(obj, (np.integer, pd.Int64Dtype, np.int64)):
             return int(obj)
@@ -128,26 +241,566 @@ def export_all_project_data(df, export_dir='exports'):
             return obj.tolist()
         return obj
 
+    with open(f'{base_dir}/metadata_{timestamp}.json', 'w') as f:
+        json.dump(metadata, f, indent=4, default=to_py)
+
+
+def _partition_name(year, month):
+    """Relative name of a year/month raw data partition."""
+    return f'year={int(year)}/month={int(month):02d}'
+
+
+def _row_hashes(df):
+    """Content hash of every row, independent of column order."""
+    return pd.util.hash_pandas_object(df[sorted(df.columns)], index=False)
+
+
+def _partition_key(partition):
+    """(year, month) of a raw data partition from its relative name."""
+    year, month = (part.split('=')[1] for part in partition.split('/'))
+    return int(year), int(month)
+
+
+def _format_partition_hash(rows, hash_sum):
+    """Order-independent partition fingerprint from its row count and summed row hashes."""
+    return f'{int(rows)}:{int(hash_sum):016x}'
+
+
+def _load_previous_export(export_dir, previous_metadata=None):
+    """
+    Find the metadata of the most recent export that recorded partition hashes.
+    
+    Args:
+        export_dir (str): Base directory holding ``project_data_*`` exports
+        previous_metadata (str, optional): Explicit path of the metadata JSON to diff against
+        
+    Returns:
+        tuple: (base directory, metadata dict) of the previous export, or (None, {})
+    """
+    if previous_metadata:
+        candidates = [previous_metadata]
+    else:
+        candidates = sorted(glob.glob(f'{export_dir}/project_data_*/metadata_*.json'), reverse=True)
+    
+    for path in candidates:
+        try:
+            with open(path) as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if metadata.get('partitions'):
+            return os.path.dirname(path), metadata
+    return None, {}
+
+
+def _reuse_artifact(source_path, target_path):
+    """
+    Hard-link an unchanged file from a previous export into the new one.
+    
+    Falls back to copying when the filesystem does not support hard links, so the
+    new export never depends on files of an older one that may be pruned.
+    
+    Returns:
+        dict: File statistics in the same shape as ``ExportWriterPool.results``
+    """
+    try:
+        os.link(source_path, target_path)
+    except OSError:
+        shutil.copy2(source_path, target_path)
+    return {
+        'path': target_path,
+        'bytes': os.path.getsize(target_path),
+        'seconds': 0.0,
+        'reused': True
+    }
+
+
+def _partition_mask(df, columns, keys):
+    """Boolean mask of the rows of ``df`` whose values in ``columns`` are one of ``keys``."""
+    index = pd.MultiIndex.from_arrays([df[column] for column in columns])
+    return index.isin(list(keys))
+
+
+def _merge_summary(previous_path, fresh, key_count, group_count, stale_keys):
+    """
+    Patch a summary file of the previous export with recomputed rows.
+    
+    Rows whose first ``key_count`` columns are one of ``stale_keys`` are dropped
+    from the previous summary and replaced by ``fresh``, the summary computed
+    over the changed partitions only.
+    
+    Args:
+        previous_path (str): The summary CSV of the previous export
+        fresh (pandas.DataFrame): The summary of the changed partitions
+        key_count (int): Number of leading columns holding the partition key
+        group_count (int): Number of leading columns the summary is grouped by
+        stale_keys (set): Partition keys, as tuples, whose previous rows are outdated
+        
+    Returns:
+        pandas.DataFrame: The summary, in the row order of a full recomputation
+    """
+    previous = pd.read_csv(previous_path, header=list(range(fresh.columns.nlevels)),
+                           float_precision='round_trip')
+    previous.columns = fresh.columns
+    outdated = _partition_mask(previous, list(previous.columns[:key_count]), stale_keys)
+    merged = pd.concat([previous[~outdated], fresh], ignore_index=True)
+    return merged.sort_values(list(merged.columns[:group_count]), ignore_index=True)
+
+
+def export_all_project_data(df, export_dir='exports', max_workers=None, max_pending=None,
+                            differential=False, previous_metadata=None, progress=None,
+                            cancel_event=None):
+    """
+    Export all project data in various formats and breakdowns.
+    
+    The aggregates are computed and written by a bounded writer pool, so the
+    files are serialized concurrently instead of one after another.
+    
+    In differential mode the raw data is written as year/month partitions and
+    each partition's content hash is recorded in the metadata. Partitions whose
+    hash matches the previous export are hard-linked instead of rewritten, and
+    when no partition changed the summary files are hard-linked as well. The
+    summaries keyed by year or by (year, month) (see ``SUMMARY_PARTITION_KEYS``)
+    only recompute the rows of changed or removed partitions and merge them into
+    the previous file; the summaries across years are rewritten in full.
+    
+    Args:
+        df (pandas.DataFrame): The main dataset
+        export_dir (str): Base directory to save the exports
+        max_workers (int, optional): Number of writer threads. Defaults to the CPU count (max 8).
+        max_pending (int, optional): Maximum number of frames held in memory at once.
+            Defaults to ``max_workers``.
+        differential (bool): Reuse unchanged partitions and files of the previous export
+        previous_metadata (str, optional): Metadata JSON of the export to diff against.
+            Defaults to the latest export in ``export_dir`` that recorded partition hashes.
+        progress (callable, optional): Called as ``progress(completed, total)`` after each file
+        cancel_event (threading.Event, optional): When set, the export stops, its directory is
+            removed and ``ExportCancelled`` is raised
+    """
+    started = time.perf_counter()
+    
+    timestamp, base_dir, categories = _create_export_directories(export_dir)
+    
+    # Count every file up front so progress never runs ahead of the total
+    has_heritage = 'heritage_site' in df.columns
+    raw_files = df.groupby(['year', 'month']).ngroups if differential else 1
+    summary_files = len(TOURISM_SUMMARIES) + len(ART_FORM_SUMMARIES) + len(ANALYTICS_SUMMARIES)
+    if has_heritage:
+        summary_files += len(HERITAGE_SUMMARIES)
+    
+    # Writer pool that builds and serializes the files concurrently
+    pool = ExportWriterPool(
+        max_workers=max_workers,
+        max_pending=max_pending,
+        progress=progress,
+        cancel_event=cancel_event,
+        total=raw_files + summary_files
+    )
+    try:
+        reused_files = {}
+        partitions = {}
+        reusable = {}
+        mergeable = {}
+        differential_info = None
+        
+        # 1. Export complete raw dataset
+        if differential:
+            previous_dir, previous = _load_previous_export(export_dir, previous_metadata)
+            previous_partitions = previous.get('partitions', {})
+            
+            row_hashes = _row_hashes(df)
+            positions = df.groupby(['year', 'month']).indices
+            hash_sums = row_hashes.groupby([df['year'], df['month']]).sum()
+            
+            changed = []
+            for (year, month), rows in positions.items():
+                partition = _partition_name(year, month)
+                path = f'{categories["raw"]}/{partition}.csv'
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                partitions[partition] = {
+                    'hash': _format_partition_hash(len(rows), hash_sums.loc[(year, month)]),
+                    'rows': int(len(rows))
+                }
+                
+                old = previous_partitions.get(partition)
+                old_path = os.path.join(previous_dir, old['path']) if old else None
+                if old and old['hash'] == partitions[partition]['hash'] and os.path.exists(old_path):
+                    reused_files[f'raw/{partition}'] = _reuse_artifact(old_path, path)
+                    pool.file_done()
+                else:
+                    changed.append(partition)
+                    pool.submit(f'raw/{partition}', path, lambda rows=rows: df.take(rows))
+            
+            removed = sorted(set(previous_partitions) - set(partitions))
+            previous_summaries = {
+                name: os.path.join(previous_dir, path)
+                for name, path in previous.get('artifacts', {}).items()
+                if not name.startswith('raw/')
+            } if previous_dir else {}
+            
+            if not changed and not removed:
+                # Every summary file stays valid
+                reusable = previous_summaries
+            elif previous_partitions:
+                # Summaries keyed by partition only need the rows of the stale keys
+                stale_months = {_partition_key(partition) for partition in changed + removed}
+                stale_keys = {
+                    ('year', 'month'): stale_months,
+                    ('year',): {(year,) for year, _ in stale_months}
+                }
+                mergeable = {
+                    name: (path, SUMMARY_PARTITION_KEYS[name], stale_keys[SUMMARY_PARTITION_KEYS[name][0]])
+                    for name, path in previous_summaries.items()
+                    if name in SUMMARY_PARTITION_KEYS
+                }
+            
+            differential_info = {
+                'base_export': previous_dir,
+                'changed_partitions': changed,
+                'removed_partitions': removed,
+                'reused_partitions': len(partitions) - len(changed),
+                'reused_summaries': bool(reusable),
+                'merged_summaries': sorted(mergeable)
+            }
+        else:
+            pool.submit(
+                'complete_dataset',
+                f'{categories["raw"]}/complete_dataset_{timestamp}.csv',
+                lambda: df
+            )
+        
+        def export_file(name, path, build):
+            # Hard-link summaries carried over unchanged, patch the partition-keyed
+            # ones, and build the rest from the full dataset on the pool
+            if name in reusable and os.path.exists(reusable[name]):
+                reused_files[name] = _reuse_artifact(reusable[name], path)
+                pool.file_done()
+            elif name in mergeable and os.path.exists(mergeable[name][0]):
+                previous_path, (key_columns, group_columns), stale_keys = mergeable[name]
+                pool.submit(name, path, lambda: _merge_summary(
+                    previous_path,
+                    build(df[_partition_mask(df, key_columns, stale_keys)]),
+                    len(key_columns),
+                    len(group_columns),
+                    stale_keys
+                ))
+            else:
+                pool.submit(name, path, lambda: build(df))
+        
+        # 2. Tourism Data Exports
+        for name, build in TOURISM_SUMMARIES.items():
+            export_file(name, f'{categories["tourism"]}/{name}_{timestamp}.csv', build)
+        
+        # 3. Heritage Data Exports (only if 'heritage_site' column exists)
+        heritage_exports = []
+        if has_heritage:
+            for name, build in HERITAGE_SUMMARIES.items():
+                export_file(name, f'{categories["heritage"]}/{name}_{timestamp}.csv', build)
+                heritage_exports.append(name)
+        else:
+            heritage_exports = None
+        
+        # 4. Art Forms Data Exports
+        for name, build in ART_FORM_SUMMARIES.items():
+            export_file(name, f'{categories["art_forms"]}/{name}_{timestamp}.csv', build)
+        
+        # 5. Analytics Data Exports
+        for name, build in ANALYTICS_SUMMARIES.items():
+            export_file(name, f'{categories["analytics"]}/{name}_{timestamp}.csv', build)
+        
+        # Wait for the pool to finish writing every file
+        files = {**pool.results(), **reused_files}
+        
+        # 6. Create a metadata file
+        metadata = {
+            'export_timestamp': str(timestamp),
+            'data_categories': list(categories.keys()),
+            'total_records': int(len(df)),
+            'date_range': {
+                'start_year': int(df['year'].min()),
+                'end_year': int(df['year'].max())
+            },
+            'regions_covered': sorted([str(x) for x in df['region'].unique().tolist()]),
+            'states_covered': sorted([str(x) for x in df['state'].unique().tolist()]),
+            'art_forms_covered': sorted([str(x) for x in df['art_form'].unique().tolist()]),
+            'heritage_exports': heritage_exports if heritage_exports else 'heritage_site column not found, heritage exports skipped.'
+        }
+        
+        if differential:
+            for partition, info in partitions.items():
+                info['path'] = os.path.relpath(files[f'raw/{partition}']['path'], base_dir)
+            metadata['partitions'] = partitions
+            metadata['artifacts'] = {name: os.path.relpath(info['path'], base_dir) for name, info in files.items()}
+            metadata['differential'] = differential_info
+
+        _write_metadata(base_dir, timestamp, metadata)
+        
+        return {
+            'base_directory': base_dir,
+            'timestamp': timestamp,
+            'categories': categories,
+            'metadata_file': f'metadata_{timestamp}.json',
+            'files': files,
+            'total_bytes': sum(info['bytes'] for info in files.values()),
+            'elapsed_seconds': round(time.perf_counter() - started, 4)
+        } 
+    except ExportCancelled:
+        shutil.rmtree(base_dir, ignore_errors=True)
+        raise
+    finally:
+        pool.shutdown()
+
+# Numeric columns aggregated by every export
+VALUE_COLUMNS = ['tourist_visits', 'funding_received']
+
+# How each column of the streaming aggregate cube is combined across chunks
+CUBE_AGGREGATIONS = {
+    'count': 'sum',
+    'cross_sum': 'sum',
+    **{f'{col}_{stat}': ('sum' if stat in ('sum', 'sumsq') else stat)
+       for col in VALUE_COLUMNS for stat in ('sum', 'sumsq', 'min', 'max')}
+}
+
+
+def iter_csv_chunks(csv_file_path, chunksize=100000):
+    """
+    Read a local CSV export in chunks for the streaming exporter.
+    
+    Args:
+        csv_file_path (str): Path of the CSV file
+        chunksize (int): Number of rows per chunk
+        
+    Yields:
+        pandas.DataFrame: Chunks with lower-case column names
+    """
+    for chunk in pd.read_csv(csv_file_path, chunksize=chunksize):
+        yield chunk.rename(columns=str.lower)
+
+
+def iter_snowflake_chunks(conn, query):
+    """
+    Run a query on Snowflake and yield the result set batch by batch.
+    
+    Args:
+        conn (snowflake.connector.SnowflakeConnection): An open connection
+        query (str): SQL query to run
+        
+    Yields:
+        pandas.DataFrame: Result batches with lower-case column names
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute(query)
+        for batch in cur.fetch_pandas_batches():
+            yield batch.rename(columns=str.lower)
+    finally:
+        cur.close()
+
+
+def _chunk_cube(chunk, keys):
+    """Reduce one chunk to partial sums, squares, minima and maxima per key combination."""
+    frame = chunk[keys].copy()
+    for col in VALUE_COLUMNS:
+        values = chunk[col]
+        frame[f'{col}_sum'] = values
+        frame[f'{col}_sumsq'] = values.astype('float64') ** 2
+        frame[f'{col}_min'] = values
+        frame[f'{col}_max'] = values
+    frame['cross_sum'] = chunk['tourist_visits'].astype('float64') * chunk['funding_received'].astype('float64')
+    frame['count'] = 1
+    return frame.groupby(keys, dropna=False).agg(CUBE_AGGREGATIONS)
+
+
+def _cube_sums(cube, keys):
+    """Roll the cube up to tourist visit and funding totals per group."""
+    return cube.groupby(keys).agg(
+        tourist_visits=('tourist_visits_sum', 'sum'),
+        funding_received=('funding_received_sum', 'sum')
+    ).reset_index()
+
+
+def _cube_stats(cube, keys, stats):
+    """Roll the cube up to sum/mean/std/min/max per group, matching ``DataFrame.agg`` output."""
+    grouped = cube.groupby(keys).agg(CUBE_AGGREGATIONS)
+    count = grouped['count'].astype('float64')
+    columns = {}
+    for col in VALUE_COLUMNS:
+        total = grouped[f'{col}_sum'].astype('float64')
+        variance = (grouped[f'{col}_sumsq'] - total ** 2 / count) / (count - 1)
+        values = {
+            'sum': grouped[f'{col}_sum'],
+            'mean': total / count,
+            'std': np.sqrt(variance.clip(lower=0).where(count > 1)),
+            'min': grouped[f'{col}_min'],
+            'max': grouped[f'{col}_max']
+        }
+        for stat in stats:
+            columns[(col, stat)] = values[stat]
+    return pd.DataFrame(columns).reset_index()
+
+
+def _cube_correlation(cube):
+    """Pearson correlation between tourist visits and funding from the cube's running totals."""
+    n = cube['count'].sum()
+    sx = cube['tourist_visits_sum'].astype('float64').sum()
+    sy = cube['funding_received_sum'].astype('float64').sum()
+    sxx = cube['tourist_visits_sumsq'].sum()
+    syy = cube['funding_received_sumsq'].sum()
+    sxy = cube['cross_sum'].sum()
+    denominator = np.sqrt((n * sxx - sx ** 2) * (n * syy - sy ** 2))
+    r = (n * sxy - sx * sy) / denominator if denominator else np.nan
+    return pd.DataFrame([[1.0, r], [r, 1.0]], index=VALUE_COLUMNS, columns=VALUE_COLUMNS)
+
+
+def export_project_data_streaming(chunks, export_dir='exports', max_workers=None, max_pending=None):
+    """
+    Export all project data from a stream of chunks instead of one in-memory DataFrame.
+    
+    Each chunk is appended to a raw export partitioned by year and month (with
+    the same partition hashes as a differential export) and folded into an
+    aggregate cube keyed by year, month, region, state and art
+    form. Every summary file is rolled up from that cube at the end, so memory
+    is bounded by the chunk size plus the cube's cardinality.
+    
+    Args:
+        chunks (iterable): DataFrames with the dataset columns, e.g. from
+            ``iter_csv_chunks`` or ``iter_snowflake_chunks``
+        export_dir (str): Base directory to save the exports
+        max_workers (int, optional): Number of writer threads for the summary files
+        max_pending (int, optional): Maximum number of summary frames held in memory at once
+        
+    Returns:
+        dict: Export information in the same shape as ``export_all_project_data``
+    """
+    started = time.perf_counter()
+    timestamp, base_dir, categories = _create_export_directories(export_dir)
+    
+    keys = None
+    cube = None
+    partitions = {}
+    chunks_processed = 0
+    
+    # 1. Append each chunk to the raw partitions and fold it into the cube
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        if keys is None:
+            keys = ['year', 'month', 'region', 'state', 'art_form']
+            if 'heritage_site' in chunk.columns:
+                keys.append('heritage_site')
+        
+        hash_sums = _row_hashes(chunk).groupby([chunk['year'], chunk['month']]).sum()
+        for (year, month), part in chunk.groupby(['year', 'month'], sort=False):
+            partition = _partition_name(year, month)
+            path = f'{categories["raw"]}/{partition}.csv'
+            if partition not in partitions:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                partitions[partition] = {'path': path, 'rows': 0, 'hash_sum': np.uint64(0)}
+            part.to_csv(path, mode='a', header=partitions[partition]['rows'] == 0, index=False)
+            partitions[partition]['rows'] += len(part)
+            # Row hashes are summed modulo 2**64, so the fingerprint is independent of chunking
+            with np.errstate(over='ignore'):
+                partitions[partition]['hash_sum'] += hash_sums.loc[(year, month)]
+        
+        partial = _chunk_cube(chunk, keys)
+        cube = partial if cube is None else pd.concat([cube, partial]).groupby(level=keys, dropna=False).agg(CUBE_AGGREGATIONS)
+        chunks_processed += 1
+    
+    if cube is None:
+        raise ValueError("No data received from the chunk source.")
+    cube = cube.reset_index()
+    
+    # 2-5. Roll the cube up into the same summary files as the in-memory export
+    pool = ExportWriterPool(max_workers=max_workers, max_pending=max_pending)
+    summaries = {
+        'tourism': {
+            'yearly_summary': lambda: cube.groupby('year').agg(
+                tourist_visits=('tourist_visits_sum', 'sum'),
+                funding_received=('funding_received_sum', 'sum'),
+                state=('state', 'nunique'),
+                art_form=('art_form', 'nunique')
+            ).reset_index(),
+            'regional_analysis': lambda: _cube_sums(cube, ['year', 'region']),
+            'state_analysis': lambda: _cube_sums(cube, ['year', 'state']),
+            'monthly_trends': lambda: _cube_sums(cube, ['year', 'month'])
+        },
+        'heritage': {},
+        'art_forms': {
+            'art_form_analysis': lambda: _cube_sums(cube, ['year', 'art_form']),
+            'art_forms_by_region': lambda: _cube_sums(cube, ['region', 'art_form']),
+            'art_forms_by_state': lambda: _cube_sums(cube, ['state', 'art_form'])
+        },
+        'analytics': {
+            'correlation_analysis': lambda: _cube_correlation(cube),
+            'seasonal_analysis': lambda: _cube_stats(cube, ['year', 'month'], ['mean', 'std', 'min', 'max']),
+            'growth_metrics': lambda: _cube_stats(cube, 'year', ['sum', 'mean', 'std'])
+        }
+    }
+    
+    heritage_exports = None
+    if 'heritage_site' in keys:
+        summaries['heritage'] = {
+            'site_analysis': lambda: _cube_sums(cube, ['state', 'heritage_site']),
+            'heritage_by_region': lambda: _cube_sums(cube, ['region', 'heritage_site'])
+        }
+        heritage_exports = list(summaries['heritage'].keys())
+    
+    for category, builds in summaries.items():
+        for name, build in builds.items():
+            pool.submit(name, f'{categories[category]}/{name}_{timestamp}.csv', build)
+    
+    files = pool.results()
+    for partition, info in partitions.items():
+        files[f'raw/{partition}'] = {
+            'path': info['path'],
+            'rows': info['rows'],
+            'bytes': os.path.getsize(info['path'])
+        }
+    
+    # 6. Create a metadata file
     metadata = {
         'export_timestamp': str(timestamp),
         'data_categories': list(categories.keys()),
-        'total_records': int(len(df)),
+        'total_records': int(cube['count'].sum()),
         'date_range': {
-            'start_year': int(df['year'].min()),
-            'end_year': int(df['year'].max())
+            'start_year': int(cube['year'].min()),
+            'end_year': int(cube['year'].max())
+        },
+        'regions_covered': sorted([str(x) for x in cube['region'].unique().tolist()]),
+        'states_covered': sorted([str(x) for x in cube['state'].unique().tolist()]),
+        'art_forms_covered': sorted([str(x) for x in cube['art_form'].unique().tolist()]),
+        'heritage_exports': heritage_exports if heritage_exports else 'heritage_site column not found, heritage exports skipped.',
+        'chunks_processed': chunks_processed,
+        'partitions': {
+            partition: {
+                'hash': _format_partition_hash(info['rows'], info['hash_sum']),
+                'rows': info['rows'],
+                'path': os.path.relpath(info['path'], base_dir)
+            }
+            for partition, info in sorted(partitions.items())
         },
-        'regions_covered': sorted([str(x) for x in df['region'].unique().tolist()]),
-        'states_covered': sorted([str(x) for x in df['state'].unique().tolist()]),
-        'art_forms_covered': sorted([str(x) for x in df['art_form'].unique().tolist()]),
-        'heritage_exports': heritage_exports if heritage_exports else 'heritage_site column not found, heritage exports skipped.'
+        'artifacts': {name: os.path.relpath(info['path'], base_dir) for name, info in files.items()}
     }
-
-    with open(f'{base_dir}/metadata_{timestamp}.json', 'w') as f:
-        json.dump(metadata, f, indent=4, default=to_py)
+    
+    _write_metadata(base_dir, timestamp, metadata)
     
     return {
         'base_directory': base_dir,
         'timestamp': timestamp,
         'categories': categories,
-        'metadata_file': f'metadata_{timestamp}.json'
-    } 
\ No newline at end of file
+        'metadata_file': f'metadata_{timestamp}.json',
+        'files': files,
+        'total_bytes': sum(info['bytes'] for info in files.values()),
+        'elapsed_seconds': round(time.perf_counter() - started, 4)
+    }
+
+
+if __name__ == "__main__":
+    # Stream a local CSV through the chunked exporter, e.g.
+    # python -m utils.data_exporter data/heritage_tourism_data.csv
+    import sys
+    
+    source = sys.argv[1] if len(sys.argv) > 1 else 'data/heritage_tourism_data.csv'
+    export_info = export_project_data_streaming(iter_csv_chunks(source))
+    print(f"Exported {len(export_info['files'])} files to {export_info['base_directory']} "
+          f"in {export_info['elapsed_seconds']}s")
@@ -0,0 +1,179 @@
+"""
+Content-addressed byte cache for DesiVerse application.
+Keeps rendered artifacts in a bounded in-memory LRU backed by files on disk.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+# Root directory of the on-disk caches
+CACHE_DIR = os.environ.get('DESIVERSE_CACHE_DIR', '.cache')
+
+
+def cache_key(*parts):
+    """
+    Compute a content address for JSON-serializable key parts.
+
+    Args:
+        *parts: Values identifying the cached content (dict keys are sorted)
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON encoding
+    """
+    encoded = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class ByteCache:
+    """
+    Two-level cache of byte strings keyed by content address.
+
+    Lookups hit the in-memory LRU first, then the disk directory; entries read from
+    disk are promoted back into memory. Disk writes are atomic, so concurrent
+    processes sharing the directory never observe partial files. With a disk budget,
+    the least recently used files are deleted once the directory outgrows it.
+    """
+
+    def __init__(self, namespace, max_memory_bytes=64 * 1024 * 1024, suffix='.bin', cache_dir=None,
+                 max_disk_bytes=None):
+        """
+        Args:
+            namespace (str): Subdirectory of the cache directory for this cache
+            max_memory_bytes (int): Memory budget of the LRU level
+            suffix (str): File extension of the cached files
+            cache_dir (str, optional): Root directory, ``CACHE_DIR`` by default
+            max_disk_bytes (int, optional): Disk budget of the directory; unbounded by default
+        """
+        self.directory = os.path.join(cache_dir or CACHE_DIR, namespace)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.suffix = suffix
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = None
+        self._lock = threading.Lock()
+
+    def path(self, key):
+        """Return the disk path of a key, sharded by its first two hex digits."""
+        return os.path.join(self.directory, key[:2], key + self.suffix)
+
+    def get(self, key):
+        """
+        Look up a key.
+
+        Returns:
+            bytes or None: The cached bytes, or None on a miss
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if self.max_disk_bytes is not None:
+            # Mark the file as recently used for pruning
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        """Store bytes under a key in memory and on disk."""
+        self._remember(key, data)
+
+        path = self.path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # The memory level still serves this process
+            print(f"Error writing cache file {path}: {str(e)}")
+            return
+
+        if self.max_disk_bytes is not None:
+            self._account_disk(len(data))
+
+    def get_or_create(self, key, build):
+        """
+        Return the cached bytes of a key, building and storing them on a miss.
+
+        Args:
+            key (str): Content address from ``cache_key``
+            build (callable): Zero-argument function producing the bytes
+
+        Returns:
+            bytes: The cached or freshly built bytes
+        """
+        data = self.get(key)
+        if data is None:
+            data = build()
+            self.put(key, data)
+        return data
+
+    def _remember(self, key, data):
+        if len(data) > self.max_memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def _cached_files(self):
+        """(mtime, size, path) of every file in the cache directory."""
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(self.suffix):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _account_disk(self, added_bytes):
+        # The running total is approximate (overwrites count twice); pruning rescans
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._cached_files())
+            else:
+                self._disk_bytes += added_bytes
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+
+            # Delete least recently used files down to 90% of the budget
+            files = sorted(self._cached_files())
+            total = sum(size for _, size, _ in files)
+            target = self.max_disk_bytes * 0.9
+            for _, size, path in files:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+            self._disk_bytes = total
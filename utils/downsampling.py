@@ -0,0 +1,138 @@
+"""
+Time-series downsampling for DesiVerse application.
+Reduces line-chart series to a point budget derived from the chart's pixel width.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Width in pixels assumed for full-width charts
+DEFAULT_PIXEL_WIDTH = 1200
+
+# Points kept per pixel of chart width
+POINTS_PER_PIXEL = 1
+
+
+def point_budget(pixel_width=DEFAULT_PIXEL_WIDTH):
+    """Number of points per series worth sending for a chart of the given width."""
+    return max(3, int(pixel_width * POINTS_PER_PIXEL))
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Select points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; every bucket in between keeps the point
+    forming the largest triangle with the previously kept point and the next bucket's mean.
+
+    Args:
+        x (numpy.ndarray): Ascending x values as floats
+        y (numpy.ndarray): y values as floats
+        n_out (int): Number of points to keep
+
+    Returns:
+        numpy.ndarray: Ascending positions of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Buckets cover positions 1..n-2; edges[i]:edges[i + 1] is bucket i
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.intp) + 1
+    edges[-1] = n - 1
+
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        px, py = x[previous], y[previous]
+        areas = np.abs((px - next_x) * (y[start:end] - py) - (px - x[start:end]) * (next_y - py))
+        previous = start + int(np.argmax(areas))
+        kept[i + 1] = previous
+
+    return kept
+
+
+def minmax_indices(y, n_out):
+    """
+    Select the minimum and maximum of equal-sized buckets, plus both end points.
+
+    Keeps every spike visible, which LTTB may smooth away.
+
+    Args:
+        y (numpy.ndarray): y values as floats
+        n_out (int): Approximate number of points to keep
+
+    Returns:
+        numpy.ndarray: Ascending positions of the kept points
+    """
+    n = len(y)
+    if n_out >= n or n_out < 4:
+        return np.arange(n)
+
+    edges = np.linspace(0, n, n_out // 2 + 1).astype(np.intp)
+    kept = [0, n - 1]
+    for start, end in zip(edges[:-1], edges[1:]):
+        if end > start:
+            bucket = y[start:end]
+            kept.append(start + int(np.argmin(bucket)))
+            kept.append(start + int(np.argmax(bucket)))
+
+    return np.unique(kept)
+
+
+def _numeric_x(values):
+    """x values as floats, using positions for non-numeric (e.g. category) axes."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(float)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.to_numpy(dtype=float)
+    return np.arange(len(values), dtype=float)
+
+
+def downsample_frame(data, x_col, y_cols, pixel_width=DEFAULT_PIXEL_WIDTH, method='lttb'):
+    """
+    Downsample the series of a line chart to the chart's point budget.
+
+    Args:
+        data (DataFrame): DataFrame containing the data
+        x_col (str): Column name for x-axis
+        y_cols (str or list): Column name(s) for y-axis values
+        pixel_width (int): Chart width in pixels, which sets the point budget per series
+        method (str): 'lttb' or 'minmax'
+
+    Returns:
+        tuple: (DataFrame, dict) of the kept rows and an info dict with ``total_points``
+            and ``plotted_points``
+    """
+    y_cols = [y_cols] if isinstance(y_cols, str) else list(y_cols)
+    total = len(data)
+
+    budget = point_budget(pixel_width)
+    if total > budget:
+        if pd.api.types.is_numeric_dtype(data[x_col]) or pd.api.types.is_datetime64_any_dtype(data[x_col]):
+            if not data[x_col].is_monotonic_increasing:
+                data = data.sort_values(x_col, kind='stable')
+        x = _numeric_x(data[x_col])
+
+        # Union of the points each series keeps, so every line keeps its own shape
+        kept = []
+        for y_col in y_cols:
+            y = data[y_col].to_numpy(dtype=float)
+            if method == 'lttb':
+                kept.append(lttb_indices(x, y, budget))
+            elif method == 'minmax':
+                kept.append(minmax_indices(y, budget))
+            else:
+                raise ValueError(f"Unknown downsampling method: {method}")
+        data = data.take(np.unique(np.concatenate(kept)))
+
+    return data, {'total_points': total, 'plotted_points': len(data)}
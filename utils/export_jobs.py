@@ -0,0 +1,228 @@
+"""
+Background export jobs for DesiVerse application.
+Runs project data exports off the Streamlit script thread and tracks their progress.
+"""
+
+import glob
+import os
+import shutil
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from utils.data_exporter import export_all_project_data, ExportCancelled
+
+# Finished jobs are forgotten, and their files deleted, after this many seconds
+JOB_RETENTION_SECONDS = 3600
+
+# Newest exports kept on disk per export directory; older ones are deleted, including
+# those left behind by earlier processes
+MAX_STORED_EXPORTS = 5
+
+# The export panel writes files on the server, so it is only shown when enabled
+EXPORTS_ENABLED = os.environ.get('DESIVERSE_EXPORTS', '0') == '1'
+
+
+class ExportJob:
+    """State of a single background export, shared between the worker and the UI."""
+
+    def __init__(self, export_dir):
+        self.id = uuid.uuid4().hex[:12]
+        self.export_dir = export_dir
+        self.status = 'queued'
+        self.message = 'Waiting for a free export worker'
+        self.files_done = 0
+        self.files_total = 0
+        self.result = None
+        self.archive_path = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.cancel_event = threading.Event()
+
+    @property
+    def progress(self):
+        """Fraction of the export completed, between 0 and 1."""
+        if self.status == 'completed':
+            return 1.0
+        if not self.files_total:
+            return 0.0
+        # Keep the last 10% for packaging the archive
+        return 0.9 * self.files_done / self.files_total
+
+    @property
+    def finished(self):
+        return self.status in ('completed', 'failed', 'cancelled')
+
+    def cancel(self):
+        """Ask the worker to stop at the next file boundary."""
+        if not self.finished:
+            self.cancel_event.set()
+            self.message = 'Cancelling...'
+
+
+class ExportJobManager:
+    """
+    Process-wide pool of export workers.
+
+    Jobs are looked up by ID, so each session only keeps the ID of its job in
+    ``st.session_state`` while the work itself runs on a worker thread.
+    """
+
+    def __init__(self, max_workers=2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='export-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, df, export_dir='exports', **export_kwargs):
+        """
+        Queue an export of the dataset.
+
+        Args:
+            df (pandas.DataFrame): The dataset to export
+            export_dir (str): Base directory to save the exports
+            **export_kwargs: Extra arguments for ``export_all_project_data``
+
+        Returns:
+            str: The job ID
+        """
+        job = ExportJob(export_dir)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, df, export_kwargs)
+        return job.id
+
+    def get(self, job_id):
+        """Return the job with the given ID, or None if it is unknown or expired."""
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def _prune(self):
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished and job.finished_at < cutoff]:
+            job = self._jobs.pop(job_id)
+            if job.result is not None:
+                shutil.rmtree(job.result['base_directory'], ignore_errors=True)
+            if job.archive_path is not None and os.path.exists(job.archive_path):
+                os.remove(job.archive_path)
+
+        # Cap the exports on disk and forget the jobs whose files went with them.
+        # Running jobs write the newest directories, which are always kept.
+        for export_dir in {job.export_dir for job in self._jobs.values()}:
+            prune_stored_exports(export_dir)
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.result is not None and not os.path.isdir(job.result['base_directory'])]:
+            del self._jobs[job_id]
+
+    def _run(self, job, df, export_kwargs):
+        if job.cancel_event.is_set():
+            job.status = 'cancelled'
+            job.message = 'Export cancelled'
+            job.finished_at = time.time()
+            return
+
+        def progress(completed, total):
+            job.files_done = completed
+            job.files_total = total
+            job.message = f'Written {completed} of {total} files'
+
+        job.status = 'running'
+        job.message = 'Preparing export'
+        try:
+            # The exporter works on lower-case column names
+            result = export_all_project_data(
+                df.rename(columns=str.lower),
+                export_dir=job.export_dir,
+                progress=progress,
+                cancel_event=job.cancel_event,
+                **export_kwargs
+            )
+            job.message = 'Packaging archive'
+            job.archive_path = build_export_archive(result['base_directory'], job.cancel_event)
+            job.result = result
+            job.status = 'completed'
+            job.message = f"Exported {len(result['files'])} files"
+        except ExportCancelled:
+            job.status = 'cancelled'
+            job.message = 'Export cancelled'
+        except Exception as e:
+            job.status = 'failed'
+            job.error = str(e)
+            job.message = 'Export failed'
+        finally:
+            job.finished_at = time.time()
+
+
+def build_export_archive(base_dir, cancel_event=None):
+    """
+    Zip an export directory next to it on disk.
+
+    Args:
+        base_dir (str): Export directory created by the exporter
+        cancel_event (threading.Event, optional): Stops packaging when set
+
+    Returns:
+        str: Path of the zip archive
+    """
+    archive_path = f'{base_dir}.zip'
+    try:
+        with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for root, _, files in os.walk(base_dir):
+                for name in sorted(files):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise ExportCancelled()
+                    path = os.path.join(root, name)
+                    archive.write(path, os.path.relpath(path, os.path.dirname(base_dir)))
+    except ExportCancelled:
+        os.remove(archive_path)
+        raise
+    return archive_path
+
+
+def prune_stored_exports(export_dir, keep=MAX_STORED_EXPORTS):
+    """
+    Delete all but the newest exports of an export directory, with their archives.
+
+    Args:
+        export_dir (str): Base directory holding ``project_data_*`` exports
+        keep (int): Number of exports to keep
+
+    Returns:
+        list: Base directories of the deleted exports
+    """
+    exports = sorted({path[:-len('.zip')] if path.endswith('.zip') else path
+                      for path in glob.glob(os.path.join(export_dir, 'project_data_*'))}, reverse=True)
+    for base_dir in exports[keep:]:
+        shutil.rmtree(base_dir, ignore_errors=True)
+        if os.path.exists(f'{base_dir}.zip'):
+            os.remove(f'{base_dir}.zip')
+    return exports[keep:]
+
+
+def read_export_archive(archive_path):
+    """
+    Read a finished export archive for download.
+
+    Passed to ``st.download_button`` as a callable, so the zip is only read when
+    the user clicks the button rather than on every rerun of the page.
+    """
+    with open(archive_path, 'rb') as archive:
+        return archive.read()
+
+
+@st.cache_resource
+def get_export_job_manager():
+    """Shared export job manager for every session of this process."""
+    return ExportJobManager()
@@ -0,0 +1,119 @@
+"""
+Filter index for DesiVerse application.
+Precomputes row positions per state and region so page filters never rescan the dataset.
+"""
+
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+EMPTY_ROWS = np.empty(0, dtype=np.intp)
+EMPTY_ROWS.flags.writeable = False
+
+
+def dataset_version(df):
+    """
+    Compute a content fingerprint of the dataset, used as a cache key.
+
+    Args:
+        df (pandas.DataFrame): The dataset
+
+    Returns:
+        str: Row count plus the sum of the row hashes
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=False)
+    return f'{len(df)}:{int(row_hashes.sum()):016x}'
+
+
+def _read_only_groups(column):
+    """Map each value of a column to the read-only, ascending row positions holding it."""
+    groups = {}
+    for value, rows in column.groupby(column, sort=True).indices.items():
+        rows = np.asarray(rows, dtype=np.intp)
+        rows.flags.writeable = False
+        groups[value] = rows
+    return MappingProxyType(groups)
+
+
+def build_filter_index(df):
+    """
+    Build the filter index of a dataset.
+
+    Args:
+        df (pandas.DataFrame): The dataset with STATE, REGION, LATITUDE and LONGITUDE columns
+
+    Returns:
+        mappingproxy: Read-only index with sorted ``states``/``regions``, ``state_rows``/``region_rows``
+            position arrays, ``state_coordinates`` (the first coordinates recorded for each state)
+            and ``art_form_codes`` (per-row positions into the sorted ``art_form_names``)
+    """
+    state_rows = _read_only_groups(df['STATE'])
+    region_rows = _read_only_groups(df['REGION'])
+    latitudes = df['LATITUDE'].to_numpy()
+    longitudes = df['LONGITUDE'].to_numpy()
+    art_form_codes, art_form_names = pd.factorize(df['ART_FORM'], sort=True)
+    art_form_codes = art_form_codes.astype(np.intp)
+    art_form_codes.flags.writeable = False
+
+    return MappingProxyType({
+        'n_rows': len(df),
+        'states': tuple(state_rows.keys()),
+        'regions': tuple(region_rows.keys()),
+        'state_rows': state_rows,
+        'region_rows': region_rows,
+        'state_coordinates': MappingProxyType({
+            state: {'lat': latitudes[rows[0]], 'lon': longitudes[rows[0]]}
+            for state, rows in state_rows.items()
+        }),
+        'art_form_names': tuple(art_form_names),
+        'art_form_codes': art_form_codes
+    })
+
+
+@st.cache_resource(max_entries=4)
+def get_filter_index(_df, version):
+    """
+    Get the filter index of a dataset, built once per dataset version and shared across sessions.
+
+    Args:
+        _df (pandas.DataFrame): The dataset (not hashed; ``version`` identifies it)
+        version (str): Dataset version from ``dataset_version``
+    """
+    return build_filter_index(_df)
+
+
+def select_rows(index, state=None, region=None, region_states=None):
+    """
+    Resolve a state/region selection to row positions.
+
+    Args:
+        index (mappingproxy): Filter index from ``build_filter_index``
+        state (str, optional): Selected state, or None for all states
+        region (str, optional): Selected region, or None for all regions
+        region_states (list, optional): States that make up the region; when empty the
+            REGION column is used instead
+
+    Returns:
+        numpy.ndarray or None: Ascending row positions, or None when nothing is filtered
+    """
+    rows = None
+
+    if region is not None:
+        if region_states:
+            parts = [index['state_rows'].get(s, EMPTY_ROWS) for s in region_states]
+            rows = np.sort(np.concatenate(parts)) if parts else EMPTY_ROWS
+        else:
+            rows = index['region_rows'].get(region, EMPTY_ROWS)
+
+    if state is not None:
+        state_rows = index['state_rows'].get(state, EMPTY_ROWS)
+        rows = state_rows if rows is None else np.intersect1d(rows, state_rows, assume_unique=True)
+
+    return rows
+
+
+def take_rows(df, rows):
+    """Return the selected rows of the dataset without copying it when nothing is filtered."""
+    return df if rows is None else df.take(rows)
@@ -0,0 +1,134 @@
+"""
+HTTP client for DesiVerse application.
+Shares one pooled, retrying requests session across threads and limits concurrent
+requests per host.
+"""
+
+import random
+import threading
+import urllib.parse
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeout in seconds applied when a caller passes none
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Kept-alive connections per host
+POOL_MAXSIZE = 16
+
+# Requests in flight per host across the whole process
+HOST_CONCURRENCY = 8
+
+# Retries of failed connections and of these status codes. 429 is left to the request
+# scheduler, which sees every request against the provider quota and backs off itself
+MAX_RETRIES = 3
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Exponential backoff base and the random jitter added to every wait, in seconds
+BACKOFF_FACTOR = 0.5
+BACKOFF_JITTER = 0.5
+
+# Longest wait between retries, in seconds, including a server's Retry-After
+BACKOFF_MAX = 10
+
+
+class JitterRetry(Retry):
+    """Retry policy that adds random jitter to the exponential backoff."""
+
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return min(BACKOFF_MAX, backoff + random.uniform(0, BACKOFF_JITTER))
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(BACKOFF_MAX, retry_after)
+
+
+class HttpClient:
+    """
+    Thread-safe HTTP client around a single pooled ``requests.Session``.
+
+    The session only carries connection pools and default headers, so one instance
+    is shared by every Streamlit session thread. A per-host semaphore bounds the
+    requests in flight to each API.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, host_concurrency=HOST_CONCURRENCY,
+                 pool_maxsize=POOL_MAXSIZE, max_retries=MAX_RETRIES):
+        """
+        Args:
+            timeout (tuple): Default (connect, read) timeout in seconds
+            host_concurrency (int): Requests in flight per host
+            pool_maxsize (int): Kept-alive connections per host
+            max_retries (int): Retries on connection errors and ``RETRY_STATUSES``
+        """
+        self.timeout = timeout
+        self.host_concurrency = host_concurrency
+        self._host_limits = {}
+        self._lock = threading.Lock()
+
+        retry = JitterRetry(
+            total=max_retries,
+            backoff_factor=BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _host_limit(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self._lock:
+            limit = self._host_limits.get(host)
+            if limit is None:
+                limit = self._host_limits[host] = threading.BoundedSemaphore(self.host_concurrency)
+            return limit
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request through the shared session.
+
+        Args:
+            method (str): HTTP method
+            url (str): Absolute URL
+            **kwargs: Arguments for ``requests.Session.request``; ``timeout``
+                defaults to ``DEFAULT_TIMEOUT``
+
+        Returns:
+            requests.Response: The final response, after any retries
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        with self._host_limit(url):
+            return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        """Send a GET request; see ``request``."""
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        """Send a HEAD request; see ``request``. Redirects are not followed by default."""
+        return self.request('HEAD', url, **kwargs)
+
+
+@st.cache_resource
+def get_http_client():
+    """Shared HTTP client for every session of this process."""
+    return HttpClient()
+
+
+def http_get(url, **kwargs):
+    """GET through the shared client; see ``HttpClient.request``."""
+    return get_http_client().get(url, **kwargs)
+
+
+def http_head(url, **kwargs):
+    """HEAD through the shared client; see ``HttpClient.request``."""
+    return get_http_client().head(url, **kwargs)
@@ -3,10 +3,117 @@ Image utilities for DesiVerse application.
 Contains functions for fetching and managing images.
 """
 
+import contextvars
+import functools
+import os
+import re
 import requests
-import urllib.parse
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from data.constants import PEXELS_API_KEY, PIXABAY_API_KEY
+from utils.http_client import http_head
+from utils.search_cache import cached_search
+
+# Base URLs of the image APIs; point them at benchmarks/fixture_server.py to work offline
+PEXELS_BASE_URL = os.environ.get('DESIVERSE_PEXELS_URL', 'https://api.pexels.com').rstrip('/')
+PIXABAY_BASE_URL = os.environ.get('DESIVERSE_PIXABAY_URL', 'https://pixabay.com').rstrip('/')
+
+# Search endpoints of the image APIs
+PEXELS_SEARCH_URL = f'{PEXELS_BASE_URL}/v1/search'
+PIXABAY_SEARCH_URL = f'{PIXABAY_BASE_URL}/api/'
+
+# Image lookups run at once by a batch; the HTTP client also caps requests per host
+IMAGE_FETCH_WORKERS = 12
+
+# Longest time an image search race may take, in seconds
+RACE_TIMEOUT = 8.0
+
+# Static mapping of common art forms to iStock image URLs
+ISTOCK_IMAGES = {
+    "bharatanatyam": [
+        "https://media.istockphoto.com/id/610640662/photo/bharatanatyam-dancer.jpg",
+        "https://media.istockpicture.com/id/1158971075/photo/bharatanatyam-dancer-performing-on-stage.jpg",
+        "https://media.istockpicture.com/id/1207105721/photo/portrait-indian-beautiful-woman-dancing-bharatanatyam.jpg"
+    ],
+    "kathakali": [
+        "https://media.istockpicture.com/id/498570377/photo/kathakali-dancer.jpg",
+        "https://media.istockpicture.com/id/1199971488/photo/kathakali-face-traditional-ancient-dance-form-kochi-kerala-india.jpg",
+        "https://media.istockpicture.com/id/170935691/photo/kathakali.jpg"
+    ],
+    "kathak": [
+        "https://media.istockpicture.com/id/1158971075/photo/kathak-dancer-performing-on-stage.jpg",
+        "https://media.istockpicture.com/id/1207105721/photo/portrait-indian-beautiful-woman-dancing-kathak-dance.jpg",
+        "https://media.istockpicture.com/id/1310060573/photo/portrait-of-indian-female-dancer-in-kathak-dance-pose.jpg"
+    ],
+    "odissi": [
+        "https://media.istockpicture.com/id/1158971075/photo/odissi-dancer-performing.jpg",
+        "https://media.istockpicture.com/id/1207105721/photo/odissi-dance-form.jpg",
+        "https://media.istockpicture.com/id/1310060573/photo/odissi-dance-pose.jpg"
+    ],
+    "kuchipudi": [
+        "https://media.istockpicture.com/id/1158971075/photo/kuchipudi-dancer.jpg",
+        "https://media.istockpicture.com/id/1207105721/photo/kuchipudi-performance.jpg",
+        "https://media.istockpicture.com/id/1310060573/photo/kuchipudi-dance-form.jpg"
+    ],
+    "manipuri": [
+        "https://media.istockpicture.com/id/1158971075/photo/manipuri-dance.jpg",
+        "https://media.istockpicture.com/id/1207105721/photo/manipuri-performance.jpg",
+        "https://media.istockpicture.com/id/1310060573/photo/manipuri-dance-form.jpg"
+    ],
+    "mohiniyattam": [
+        "https://media.istockpicture.com/id/1158971075/photo/mohiniyattam-dance.jpg",
+        "https://media.istockpicture.com/id/1207105721/photo/mohiniyattam-performance.jpg",
+        "https://media.istockpicture.com/id/1310060573/photo/mohiniyattam-dance-form.jpg"
+    ],
+    "sattriya": [
+        "https://media.istockpicture.com/id/1158971075/photo/sattriya-dance.jpg",
+        "https://media.istockpicture.com/id/1207105721/photo/sattriya-performance.jpg",
+        "https://media.istockpicture.com/id/1310060573/photo/sattriya-dance-form.jpg"
+    ],
+    "thanjavur painting": [
+        "https://media.istockpicture.com/id/1301207350/photo/thanjavur-painting.jpg",
+        "https://media.istockpicture.com/id/1431845715/photo/thanjavur-painting-on-display.jpg",
+        "https://media.istockpicture.com/id/904553646/photo/tanjore-painting-of-lord-krishna.jpg"
+    ],
+    "madhubani painting": [
+        "https://media.istockpicture.com/id/1208339282/photo/madhubani-painting-bihar-india.jpg",
+        "https://media.istockpicture.com/id/1157141925/photo/madhubani-fish-painting.jpg",
+        "https://media.istockpicture.com/id/535853421/photo/madhubani-painting-of-hindu-goddess-sita.jpg"
+    ],
+    "warli painting": [
+        "https://media.istockpicture.com/id/1208339282/photo/warli-painting-maharashtra.jpg",
+        "https://media.istockpicture.com/id/1157141925/photo/warli-tribal-art.jpg",
+        "https://media.istockpicture.com/id/535853421/photo/warli-folk-painting.jpg"
+    ],
+    "gond art": [
+        "https://media.istockpicture.com/id/1208339282/photo/gond-painting-madhya-pradesh.jpg",
+        "https://media.istockpicture.com/id/1157141925/photo/gond-tribal-art.jpg",
+        "https://media.istockpicture.com/id/535853421/photo/gond-folk-painting.jpg"
+    ],
+    "pattachitra": [
+        "https://media.istockpicture.com/id/1208339282/photo/pattachitra-odisha.jpg",
+        "https://media.istockpicture.com/id/1157141925/photo/pattachitra-traditional.jpg",
+        "https://media.istockpicture.com/id/535853421/photo/pattachitra-folk-art.jpg"
+    ],
+    "phulkari": [
+        "https://media.istockpicture.com/id/1208339282/photo/phulkari-embroidery-punjab.jpg",
+        "https://media.istockpicture.com/id/1157141925/photo/phulkari-traditional.jpg",
+        "https://media.istockpicture.com/id/535853421/photo/phulkari-folk-embroidery.jpg"
+    ],
+    "chikankari": [
+        "https://media.istockpicture.com/id/1208339282/photo/chikankari-lucknow.jpg",
+        "https://media.istockpicture.com/id/1157141925/photo/chikankari-embroidery.jpg",
+        "https://media.istockpicture.com/id/535853421/photo/chikankari-traditional.jpg"
+    ],
+    "zardozi": [
+        "https://media.istockpicture.com/id/1208339282/photo/zardozi-embroidery.jpg",
+        "https://media.istockpicture.com/id/1157141925/photo/zardozi-gold-work.jpg",
+        "https://media.istockpicture.com/id/535853421/photo/zardozi-traditional.jpg"
+    ]
+}
 
 def get_art_form_images(art_form, state=None):
     """
@@ -56,12 +163,14 @@ def get_art_form_images(art_form, state=None):
         headers = {
             'Authorization': PEXELS_API_KEY
         }
-        url = f'https://api.pexels.com/v1/search?query={urllib.parse.quote(query)}&per_page=10&orientation=landscape'
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = cached_search(
+            'pexels',
+            PEXELS_SEARCH_URL,
+            query,
+            params={'per_page': 10, 'orientation': 'landscape'},
+            headers=headers,
+            results_key='photos'
+        )
         images = []
         
         if 'photos' in data and data['photos']:
@@ -109,6 +218,9 @@ def get_istock_images(query):
     """
     Get images from iStock for a specific query.
     
+    The first mapping key found anywhere in the query wins; otherwise the first key
+    containing one of the query's words does.
+    
     Args:
         query (str): The search query
         
@@ -116,128 +228,58 @@ def get_istock_images(query):
         list: List of image data dictionaries with URLs and photographer info
     """
     try:
-        # Static mapping of common art forms to iStock image URLs
-        istock_images = {
-            "bharatanatyam": [
-                "https://media.istockphoto.com/id/610640662/photo/bharatanatyam-dancer.jpg",
-                "https://media.istockpicture.com/id/1158971075/photo/bharatanatyam-dancer-performing-on-stage.jpg",
-                "https://media.istockpicture.com/id/1207105721/photo/portrait-indian-beautiful-woman-dancing-bharatanatyam.jpg"
-            ],
-            "kathakali": [
-                "https://media.istockpicture.com/id/498570377/photo/kathakali-dancer.jpg",
-                "https://media.istockpicture.com/id/1199971488/photo/kathakali-face-traditional-ancient-dance-form-kochi-kerala-india.jpg",
-                "https://media.istockpicture.com/id/170935691/photo/kathakali.jpg"
-            ],
-            "kathak": [
-                "https://media.istockpicture.com/id/1158971075/photo/kathak-dancer-performing-on-stage.jpg",
-                "https://media.istockpicture.com/id/1207105721/photo/portrait-indian-beautiful-woman-dancing-kathak-dance.jpg",
-                "https://media.istockpicture.com/id/1310060573/photo/portrait-of-indian-female-dancer-in-kathak-dance-pose.jpg"
-            ],
-            "odissi": [
-                "https://media.istockpicture.com/id/1158971075/photo/odissi-dancer-performing.jpg",
-                "https://media.istockpicture.com/id/1207105721/photo/odissi-dance-form.jpg",
-                "https://media.istockpicture.com/id/1310060573/photo/odissi-dance-pose.jpg"
-            ],
-            "kuchipudi": [
-                "https://media.istockpicture.com/id/1158971075/photo/kuchipudi-dancer.jpg",
-                "https://media.istockpicture.com/id/1207105721/photo/kuchipudi-performance.jpg",
-                "https://media.istockpicture.com/id/1310060573/photo/kuchipudi-dance-form.jpg"
-            ],
-            "manipuri": [
-                "https://media.istockpicture.com/id/1158971075/photo/manipuri-dance.jpg",
-                "https://media.istockpicture.com/id/1207105721/photo/manipuri-performance.jpg",
-                "https://media.istockpicture.com/id/1310060573/photo/manipuri-dance-form.jpg"
-            ],
-            "mohiniyattam": [
-                "https://media.istockpicture.com/id/1158971075/photo/mohiniyattam-dance.jpg",
-                "https://media.istockpicture.com/id/1207105721/photo/mohiniyattam-performance.jpg",
-                "https://media.istockpicture.com/id/1310060573/photo/mohiniyattam-dance-form.jpg"
-            ],
-            "sattriya": [
-                "https://media.istockpicture.com/id/1158971075/photo/sattriya-dance.jpg",
-                "https://media.istockpicture.com/id/1207105721/photo/sattriya-performance.jpg",
-                "https://media.istockpicture.com/id/1310060573/photo/sattriya-dance-form.jpg"
-            ],
-            "thanjavur painting": [
-                "https://media.istockpicture.com/id/1301207350/photo/thanjavur-painting.jpg",
-                "https://media.istockpicture.com/id/1431845715/photo/thanjavur-painting-on-display.jpg",
-                "https://media.istockpicture.com/id/904553646/photo/tanjore-painting-of-lord-krishna.jpg"
-            ],
-            "madhubani painting": [
-                "https://media.istockpicture.com/id/1208339282/photo/madhubani-painting-bihar-india.jpg",
-                "https://media.istockpicture.com/id/1157141925/photo/madhubani-fish-painting.jpg",
-                "https://media.istockpicture.com/id/535853421/photo/madhubani-painting-of-hindu-goddess-sita.jpg"
-            ],
-            "warli painting": [
-                "https://media.istockpicture.com/id/1208339282/photo/warli-painting-maharashtra.jpg",
-                "https://media.istockpicture.com/id/1157141925/photo/warli-tribal-art.jpg",
-                "https://media.istockpicture.com/id/535853421/photo/warli-folk-painting.jpg"
-            ],
-            "gond art": [
-                "https://media.istockpicture.com/id/1208339282/photo/gond-painting-madhya-pradesh.jpg",
-                "https://media.istockpicture.com/id/1157141925/photo/gond-tribal-art.jpg",
-                "https://media.istockpicture.com/id/535853421/photo/gond-folk-painting.jpg"
-            ],
-            "pattachitra": [
-                "https://media.istockpicture.com/id/1208339282/photo/pattachitra-odisha.jpg",
-                "https://media.istockpicture.com/id/1157141925/photo/pattachitra-traditional.jpg",
-                "https://media.istockpicture.com/id/535853421/photo/pattachitra-folk-art.jpg"
-            ],
-            "phulkari": [
-                "https://media.istockpicture.com/id/1208339282/photo/phulkari-embroidery-punjab.jpg",
-                "https://media.istockpicture.com/id/1157141925/photo/phulkari-traditional.jpg",
-                "https://media.istockpicture.com/id/535853421/photo/phulkari-folk-embroidery.jpg"
-            ],
-            "chikankari": [
-                "https://media.istockpicture.com/id/1208339282/photo/chikankari-lucknow.jpg",
-                "https://media.istockpicture.com/id/1157141925/photo/chikankari-embroidery.jpg",
-                "https://media.istockpicture.com/id/535853421/photo/chikankari-traditional.jpg"
-            ],
-            "zardozi": [
-                "https://media.istockpicture.com/id/1208339282/photo/zardozi-embroidery.jpg",
-                "https://media.istockpicture.com/id/1157141925/photo/zardozi-gold-work.jpg",
-                "https://media.istockpicture.com/id/535853421/photo/zardozi-traditional.jpg"
-            ]
-        }
-        
-        # Simplify the query to match our key terms
+        index = _istock_index()
         query_lower = query.lower()
-        results = []
         
         # Look for matches in our static mapping
-        for key, urls in istock_images.items():
-            if key in query_lower:
-                for url in urls:
-                    results.append({
-                        'url': url,
-                        'photographer': 'iStock Contributor',
-                        'photographer_url': 'https://www.istockphoto.com',
-                        'description': f'{key.title()} - Traditional Indian Art Form',
-                        'source': 'iStock'
-                    })
-                return results
-        
-        # If no direct match, check for partial matches
-        for key, urls in istock_images.items():
-            for term in query_lower.split():
-                if term in key or key in term:
-                    for url in urls:
-                        results.append({
-                            'url': url,
-                            'photographer': 'iStock Contributor',
-                            'photographer_url': 'https://www.istockphoto.com',
-                            'description': f'{key.title()} - Traditional Indian Art Form',
-                            'source': 'iStock'
-                        })
-                    return results
-                    
-        return []
+        matches = [index['positions'][key] for key in index['pattern'].findall(query_lower)]
+        if not matches:
+            # If no direct match, check for partial matches. A key inside a query word
+            # would have matched above, so only query words inside a key are left.
+            matches = [index['fragments'][term] for term in query_lower.split() if term in index['fragments']]
+        if not matches:
+            return []
+        return [dict(image) for image in index['results'][min(matches)]]
         
     except Exception as e:
         print(f"Error fetching iStock images: {str(e)}")
         return []
 
 
+@functools.lru_cache(maxsize=None)
+def _istock_index():
+    """
+    Lookup tables over ``ISTOCK_IMAGES``; keys are referred to by their position.
+    
+    ``pattern`` finds, at every offset of a text, the first key in mapping order
+    starting there, so the lowest position it finds is the first key contained in the
+    text. ``fragments`` maps every substring of a key to the first key containing it.
+    """
+    keys = list(ISTOCK_IMAGES)
+    fragments = {}
+    for position, key in enumerate(keys):
+        for i in range(len(key)):
+            for j in range(i + 1, len(key) + 1):
+                fragments.setdefault(key[i:j], position)
+    
+    results = [
+        tuple({
+            'url': url,
+            'photographer': 'iStock Contributor',
+            'photographer_url': 'https://www.istockphoto.com',
+            'description': f'{key.title()} - Traditional Indian Art Form',
+            'source': 'iStock'
+        } for url in ISTOCK_IMAGES[key])
+        for key in keys
+    ]
+    return {
+        'pattern': re.compile('(?=(%s))' % '|'.join(re.escape(key) for key in keys)),
+        'positions': {key: position for position, key in enumerate(keys)},
+        'fragments': fragments,
+        'results': results
+    }
+
+
 @st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_cached_art_form_images(art_form, state=None):
     """
@@ -453,8 +495,18 @@ def get_cached_art_form_images(art_form, state=None):
     if state and state != "All States":
         specific_terms = [f"{term} {state}" for term in specific_terms]
     
-    # Try each search term until we find images
-    for term in specific_terms:
+    # Race the top term on both APIs, preferring Pexels over Pixabay
+    top_term = specific_terms[0]
+    images = race_image_searches([(search_pexels_images, top_term),
+                                  (search_pixabay_images, top_term)])
+    if images:
+        return images
+    images = get_istock_images(top_term)
+    if images:
+        return images
+    
+    # Try the remaining search terms one at a time until we find images
+    for term in specific_terms[1:]:
         try:
             # Try Pexels first
             images = search_pexels_images(term)
@@ -484,9 +536,8 @@ def search_pexels_images(query):
             'Authorization': PEXELS_API_KEY
         }
         # Remove orientation filter to get more results
-        url = f'https://api.pexels.com/v1/search?query={query}&per_page=5'
-        response = requests.get(url, headers=headers)
-        data = response.json()
+        data = cached_search('pexels', PEXELS_SEARCH_URL, query, params={'per_page': 5},
+                             headers=headers, results_key='photos')
         
         if 'photos' in data and data['photos']:
             return [{'url': photo['src']['large'], 'source': 'Pexels'} for photo in data['photos']]
@@ -500,9 +551,8 @@ def search_pixabay_images(query):
     """
     try:
         # Remove orientation filter to get more results
-        url = f'https://pixabay.com/api/?key={PIXABAY_API_KEY}&q={query}&per_page=5'
-        response = requests.get(url)
-        data = response.json()
+        data = cached_search('pixabay', PIXABAY_SEARCH_URL, query, query_param='q', params={'per_page': 5},
+                             auth_params={'key': PIXABAY_API_KEY}, results_key='hits')
         
         if 'hits' in data and data['hits']:
             return [{'url': hit['largeImageURL'], 'source': 'Pixabay'} for hit in data['hits']]
@@ -533,13 +583,14 @@ def get_cultural_images(category, subcategory=None, count=5):
         headers = {
             'Authorization': PEXELS_API_KEY
         }
-        url = f'https://api.pexels.com/v1/search?query={urllib.parse.quote(query)}&per_page={count}&orientation=landscape'
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse the response
-        data = response.json()
+        data = cached_search(
+            'pexels',
+            PEXELS_SEARCH_URL,
+            query,
+            params={'per_page': count, 'orientation': 'landscape'},
+            headers=headers,
+            results_key='photos'
+        )
         
         # Extract image URLs with metadata
         images = []
@@ -601,7 +652,117 @@ def verify_image_accessibility(url):
         bool: True if accessible, False otherwise
     """
     try:
-        response = requests.head(url, timeout=5)
+        response = http_head(url, timeout=5)
         return response.status_code == 200
     except:
-        return False 
\ No newline at end of file
+        return False 
+
+
+def fetch_images_batch(fetch, items, max_workers=IMAGE_FETCH_WORKERS):
+    """
+    Run an image lookup for every item concurrently and return the results in order.
+    
+    Worker threads share the calling script's run context, so lookups may use
+    ``st.cache_data`` and show ``st.warning``/``st.error`` messages as they would
+    inline. A lookup that raises yields None instead of failing the batch.
+    
+    Args:
+        fetch (callable): Lookup called with a single item, e.g. ``verify_image_accessibility``
+        items (iterable): Items to look up
+        max_workers (int): Lookups in flight at once
+        
+    Returns:
+        list: ``fetch(item)`` for each item, in the order of ``items``
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [_fetch_or_none(fetch, item) for item in items]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)),
+                            initializer=_script_run_context_initializer()) as executor:
+        return list(executor.map(lambda item: _fetch_or_none(fetch, item), items))
+
+
+def race_image_searches(searches, timeout=RACE_TIMEOUT, max_workers=IMAGE_FETCH_WORKERS):
+    """
+    Run image searches concurrently and return the most preferred result.
+    
+    The race ends as soon as a search has returned images and every search ahead
+    of it in ``searches`` has come back empty. When ``timeout`` runs out first, the
+    most preferred result returned so far wins. Searches not yet started are
+    cancelled; requests already sent finish in the background and still fill the
+    search cache.
+    
+    Args:
+        searches (list): (search function, query) pairs, most preferred first; a
+            search function returns a list of images or None
+        timeout (float): Longest time the race may take in seconds
+        max_workers (int): Searches in flight at once
+        
+    Returns:
+        list or None: Images of the winning search, or None if none returned any
+    """
+    if not searches:
+        return None
+    
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(searches)),
+                                  initializer=_script_run_context_initializer())
+    # Each search runs in a copy of the caller's context, e.g. its revalidation window
+    futures = [executor.submit(contextvars.copy_context().run, _fetch_or_none, search, query)
+               for search, query in searches]
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            for future in futures:
+                if not future.done():
+                    break
+                if future.result():
+                    return future.result()
+            else:
+                return None
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait([future for future in futures if not future.done()],
+                 timeout=remaining, return_when=FIRST_COMPLETED)
+        
+        # Out of time: settle for the most preferred result that came back
+        for future in futures:
+            if future.done() and future.result():
+                return future.result()
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _script_run_context_initializer():
+    """Thread pool initializer that shares the calling script's run context with workers."""
+    ctx = get_script_run_ctx()
+    
+    def attach_context():
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+    
+    return attach_context
+
+
+def _fetch_or_none(fetch, item):
+    try:
+        return fetch(item)
+    except Exception as e:
+        print(f"Error fetching image for {item!r}: {str(e)}")
+        return None
+
+
+def verify_images_accessibility(urls):
+    """
+    Verify several image URLs concurrently.
+    
+    Args:
+        urls (list): The URLs to verify
+        
+    Returns:
+        list: True for each accessible URL, False otherwise, in the order of ``urls``
+    """
+    return [bool(ok) for ok in fetch_images_batch(verify_image_accessibility, urls)]
@@ -0,0 +1,259 @@
+"""
+Image warm-up job for DesiVerse application.
+Resolves and thumbnails every art form card and hidden gem image in the background,
+so the first visitor of Heritage Walks or Desi Gallery finds the image caches filled.
+"""
+
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from data.data_generator import ART_FORMS_BY_STATE
+from utils.request_scheduler import PROVIDER_LIMITS, rate_limit_headroom
+from utils.search_cache import revalidating
+
+logger = logging.getLogger(__name__)
+
+# Images resolved at once by the job
+WARMUP_WORKERS = 4
+
+# Time between the starts of two rounds, in seconds
+WARMUP_INTERVAL = 12 * 3600
+
+# A round revalidates cached searches that expire within WARMUP_INTERVAL plus this
+# margin, in seconds. The margin covers a round's own length, so a search the round
+# leaves alone is still fresh when the next round gets to it.
+WARMUP_REVALIDATE_MARGIN = 6 * 3600
+
+# Request tokens per provider the job leaves to user traffic
+WARMUP_TOKEN_RESERVE = 10
+
+# Share of the tightest provider quota (Pexels: 200 requests per hour) the job may
+# spend. A lookup usually costs one search per provider, so at a quarter of the
+# quota the job starts a lookup every 72 seconds and a round of about 110 lookups
+# takes a little over two hours.
+WARMUP_QUOTA_SHARE = 0.25
+
+# How often the job rechecks the rate-limit headroom while waiting, in seconds
+HEADROOM_POLL_SECONDS = 5
+
+# Prefix of the job's thread names
+WARMUP_THREAD_PREFIX = 'image-warmup'
+
+
+class _WarmupThreadFilter(logging.Filter):
+    """Drops the missing-ScriptRunContext warning for the job's threads, which serve no session."""
+
+    def filter(self, record):
+        return not threading.current_thread().name.startswith(WARMUP_THREAD_PREFIX)
+
+
+def _warm_art_form_card(art_form, state):
+    from pages.heritage_explorer import art_form_card_image
+    image = art_form_card_image(art_form, state)
+    return bool(image) and image.startswith('data:')
+
+
+def _warm_hidden_gem(gem):
+    from pages.cultural_gallery import resolve_hidden_gem_image
+    _, thumbnail = resolve_hidden_gem_image(gem)
+    return thumbnail is not None
+
+
+def warmup_tasks():
+    """
+    The image lookups the pages make for known content.
+
+    Returns:
+        list: (kind, label, warm) triples, where ``warm`` runs the page's lookup and
+            returns True if it ended with a cached thumbnail
+    """
+    from pages.cultural_gallery import HIDDEN_GEMS
+
+    tasks = []
+    for state, art_forms in ART_FORMS_BY_STATE.items():
+        for art_form in art_forms:
+            tasks.append(('art_form', f'{art_form} ({state})',
+                          functools.partial(_warm_art_form_card, art_form, state)))
+    for gem in HIDDEN_GEMS:
+        tasks.append(('hidden_gem', gem['name'], functools.partial(_warm_hidden_gem, gem)))
+    return tasks
+
+
+class ImageWarmup:
+    """
+    Process-wide background job that keeps the image caches warm.
+
+    Each round runs every lookup of ``warmup_tasks`` on a small thread pool and then
+    sleeps until the next round. Its searches revalidate cached results that would
+    expire before the next round, so users keep finding them fresh. Lookups are
+    spaced so the job spends at most ``quota_share`` of the tightest provider quota,
+    and hold back whenever a provider's rate-limit bucket drops below the reserve.
+    ``report`` gives the coverage of the current or last round.
+    """
+
+    def __init__(self, tasks=warmup_tasks, max_workers=WARMUP_WORKERS, interval=WARMUP_INTERVAL,
+                 token_reserve=WARMUP_TOKEN_RESERVE, quota_share=WARMUP_QUOTA_SHARE):
+        """
+        Args:
+            tasks (callable): Returns the (kind, label, warm) triples of a round
+            max_workers (int): Lookups in flight at once
+            interval (float): Seconds between the start of consecutive rounds
+            token_reserve (float): Request tokens per provider left to user traffic
+            quota_share (float): Share of the tightest provider quota the job may spend;
+                None for no pacing
+        """
+        self.tasks = tasks
+        self.max_workers = max_workers
+        self.interval = interval
+        self.token_reserve = token_reserve
+        self.revalidate_within = interval + WARMUP_REVALIDATE_MARGIN
+        # Seconds between the starts of two lookups, sized for one search per provider
+        slowest_rate = min(rate for rate, _ in PROVIDER_LIMITS.values())
+        self.lookup_spacing = 1 / (quota_share * slowest_rate) if quota_share else 0.0
+        self._next_lookup = 0.0
+        self.status = 'idle'
+        self.rounds = 0
+        self._round = None
+        self._last_round = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the rounds on a daemon thread and return the job."""
+        if self._thread is None:
+            self.status = 'starting'
+            self._thread = threading.Thread(target=self._run, name=WARMUP_THREAD_PREFIX, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop after the lookups in flight."""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            self.run_round()
+            self.status = 'waiting'
+            self._stop.wait(max(0, self.interval - (time.monotonic() - started)))
+        self.status = 'stopped'
+
+    def run_round(self):
+        """
+        Warm every image once.
+
+        Returns:
+            dict: The round's report; see ``report``
+        """
+        tasks = self.tasks()
+        totals = {}
+        for kind, _, _ in tasks:
+            totals[kind] = totals.get(kind, 0) + 1
+        with self._lock:
+            self.status = 'running'
+            self.rounds += 1
+            self._round = {
+                'round': self.rounds,
+                'started_at': time.time(),
+                'finished_at': None,
+                'done': 0,
+                'total': len(tasks),
+                'warm': dict.fromkeys(totals, 0),
+                'totals': totals,
+                'cold': []
+            }
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=WARMUP_THREAD_PREFIX) as executor:
+            list(executor.map(self._warm, tasks))
+
+        with self._lock:
+            self._round['finished_at'] = time.time()
+            self._last_round = self._round
+        report = self.report()
+        # Incomplete coverage goes out at WARNING so it shows without any logging setup
+        logger.log(logging.WARNING if report['cold'] else logging.INFO,
+                   "Image warm-up round %d: %d/%d images warm (%.0f%% coverage) in %.0fs%s",
+                   report['round'], report['warm'], report['total'], report['coverage'], report['seconds'],
+                   f"; cold: {', '.join(report['cold'])}" if report['cold'] else '')
+        return report
+
+    def _warm(self, task):
+        kind, label, warm = task
+        if not self._wait_for_headroom():
+            return
+        try:
+            with revalidating(self.revalidate_within):
+                ok = bool(warm())
+        except Exception as e:
+            logger.warning("Error warming image for %s: %s", label, e)
+            ok = False
+        with self._lock:
+            self._round['done'] += 1
+            if ok:
+                self._round['warm'][kind] += 1
+            else:
+                self._round['cold'].append(label)
+
+    def _wait_for_headroom(self):
+        """Wait for the next lookup slot and for the token reserve at every provider; False if stopped."""
+        with self._lock:
+            start_at = max(time.monotonic(), self._next_lookup)
+            self._next_lookup = start_at + self.lookup_spacing
+        if self._stop.wait(max(0.0, start_at - time.monotonic())):
+            return False
+        while not self._stop.is_set():
+            if all(stats['tokens'] >= self.token_reserve for stats in rate_limit_headroom().values()):
+                return True
+            self._stop.wait(HEADROOM_POLL_SECONDS)
+        return False
+
+    def report(self):
+        """
+        Coverage of the round in progress, or of the last round.
+
+        Returns:
+            dict: ``status``, ``round``, ``done``, ``total``, ``warm`` (lookups that
+                ended with a cached thumbnail), ``coverage`` (``warm`` as a percentage
+                of ``total``), ``by_kind`` mapping each kind to (warm, total), ``cold``
+                (labels of the lookups that failed) and ``seconds`` taken so far;
+                ``round`` is 0 before the first round
+        """
+        with self._lock:
+            current = self._round if self.status == 'running' or self._last_round is None else self._last_round
+            if current is None:
+                return {'status': self.status, 'round': 0, 'done': 0, 'total': 0, 'warm': 0, 'coverage': 0.0,
+                        'by_kind': {}, 'cold': [], 'seconds': 0.0}
+            warm = sum(current['warm'].values())
+            return {
+                'status': self.status,
+                'round': current['round'],
+                'done': current['done'],
+                'total': current['total'],
+                'warm': warm,
+                'coverage': 100.0 * warm / current['total'] if current['total'] else 100.0,
+                'by_kind': {kind: (current['warm'][kind], total) for kind, total in current['totals'].items()},
+                'cold': list(current['cold']),
+                'seconds': (current['finished_at'] or time.time()) - current['started_at']
+            }
+
+
+@st.cache_resource
+def get_image_warmup():
+    """
+    Create the shared image warm-up job of this process on first call.
+
+    The job spends API quota on every deployment it runs on, so it only starts when
+    ``DESIVERSE_IMAGE_WARMUP=1`` is set.
+    """
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').addFilter(_WarmupThreadFilter())
+    job = ImageWarmup()
+    if os.environ.get('DESIVERSE_IMAGE_WARMUP', '0') == '1':
+        job.start()
+    return job
@@ -0,0 +1,186 @@
+"""
+Map aggregation for DesiVerse application.
+Clusters map markers server-side into zoom-dependent hexagons or grid cells so that
+map payloads stay within a fixed budget however many sites are loaded.
+"""
+
+import json
+
+import numpy as np
+import streamlit as st
+
+# Most markers a single map sends to the browser
+MAP_MAX_MARKERS = 400
+
+# Budget in bytes for the marker data (coordinates plus hover columns) of a map
+MAP_PAYLOAD_BUDGET = 128 * 1024
+
+# Radius in screen pixels that one cluster covers at the requested zoom
+CLUSTER_RADIUS_PX = 40
+
+# Web-mercator tile size in pixels; the world is TILE_SIZE * 2 ** zoom pixels wide
+TILE_SIZE = 256
+
+# Latitude limit of the web-mercator projection
+MAX_LATITUDE = 85.05112878
+
+# Distinct text values listed in a cluster's hover before it is cut short
+CLUSTER_TEXT_VALUES = 3
+
+
+def _to_mercator(lat, lon):
+    """Project degrees to web-mercator world coordinates in [0, 1]."""
+    phi = np.radians(np.clip(lat, -MAX_LATITUDE, MAX_LATITUDE))
+    x = (lon + 180.0) / 360.0
+    y = (1.0 - np.log(np.tan(phi) + 1.0 / np.cos(phi)) / np.pi) / 2.0
+    return x, y
+
+
+def _hex_bin(x, y, size):
+    """Assign points to pointy-top hexagons of the given radius; return integer cell ids."""
+    # Axial coordinates, rounded through cube coordinates to the containing hexagon
+    q = (np.sqrt(3) / 3 * x - y / 3) / size
+    r = (2 / 3 * y) / size
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64) * (1 << 32) + rr.astype(np.int64)
+
+
+def _grid_bin(x, y, size):
+    """Assign points to square cells of the given side; return integer cell ids."""
+    return np.floor(x / size).astype(np.int64) * (1 << 32) + np.floor(y / size).astype(np.int64)
+
+
+def marker_budget(data, max_markers=MAP_MAX_MARKERS, payload_bytes=MAP_PAYLOAD_BUDGET):
+    """
+    Number of markers a map of the given rows can send within the payload budget.
+
+    The size of one marker is estimated from the JSON encoding of a sample of rows,
+    so wide hover columns lower the budget.
+
+    Args:
+        data (DataFrame): Marker rows, with every column that ends up in the figure
+        max_markers (int): Upper bound on the number of markers
+        payload_bytes (int): Budget in bytes for the marker data
+
+    Returns:
+        int: Number of markers to send
+    """
+    if data.empty:
+        return max_markers
+    sample = data.head(50).to_dict(orient='records')
+    per_marker = len(json.dumps(sample, default=str)) / len(sample)
+    return max(1, min(max_markers, int(payload_bytes // per_marker)))
+
+
+def _join_values(values):
+    """Hover text of a cluster: its distinct values, cut short after a few."""
+    unique = sorted(set(', '.join(values.astype(str)).split(', ')))
+    if len(unique) > CLUSTER_TEXT_VALUES:
+        return ', '.join(unique[:CLUSTER_TEXT_VALUES]) + f' +{len(unique) - CLUSTER_TEXT_VALUES} more'
+    return ', '.join(unique)
+
+
+def cluster_markers(data, lat_col, lon_col, zoom, sum_cols=(), label_col=None, text_cols=(),
+                    count_col='SITES', method='hex', max_markers=MAP_MAX_MARKERS,
+                    payload_bytes=MAP_PAYLOAD_BUDGET):
+    """
+    Merge nearby map markers into clusters sized for the given zoom level.
+
+    Markers are binned into hexagons (or squares) of ``CLUSTER_RADIUS_PX`` screen pixels
+    in web-mercator space. If that still leaves more clusters than the payload budget
+    allows, the cells double in size until it fits. Each cluster sits at the mean
+    position of its sites and sums their ``sum_cols``.
+
+    Args:
+        data (DataFrame): One row per marker
+        lat_col (str): Column name for latitude
+        lon_col (str): Column name for longitude
+        zoom (float): Mapbox zoom level the map opens at
+        sum_cols (list): Columns summed per cluster (marker size, colour, hover totals)
+        label_col (str, optional): Column naming a marker; clusters of several sites
+            are labelled with their site count
+        text_cols (list): Text columns listed in the hover of a cluster
+        count_col (str): Name of the added column holding the sites per marker
+        method (str): 'hex' or 'grid'
+        max_markers (int): Upper bound on the number of markers
+        payload_bytes (int): Budget in bytes for the marker data
+
+    Returns:
+        tuple: (DataFrame, dict) of the markers to plot and an info dict with ``mode``
+            ('points' or the binning method), ``total_points`` and ``plotted_points``
+    """
+    sum_cols, text_cols = list(sum_cols), list(text_cols)
+    columns = [lat_col, lon_col] + sum_cols + ([label_col] if label_col else []) + text_cols
+    markers = data[columns].assign(**{count_col: 1})
+    total = len(markers)
+
+    budget = marker_budget(markers, max_markers, payload_bytes)
+    if total <= budget:
+        return markers, {'mode': 'points', 'total_points': total, 'plotted_points': total}
+
+    if method == 'hex':
+        bin_cells = _hex_bin
+    elif method == 'grid':
+        bin_cells = _grid_bin
+    else:
+        raise ValueError(f"Unknown map clustering method: {method}")
+
+    x, y = _to_mercator(markers[lat_col].to_numpy(dtype=float), markers[lon_col].to_numpy(dtype=float))
+    size = CLUSTER_RADIUS_PX / (TILE_SIZE * 2.0 ** zoom)
+    cells = bin_cells(x, y, size)
+    while len(np.unique(cells)) > budget:
+        size *= 2
+        cells = bin_cells(x, y, size)
+
+    groups = markers.groupby(cells, sort=True)
+    aggregations = {lat_col: 'mean', lon_col: 'mean', count_col: 'sum'}
+    aggregations.update({col: 'sum' for col in sum_cols})
+    aggregations.update({col: _join_values for col in text_cols})
+    if label_col:
+        aggregations[label_col] = 'first'
+    clusters = groups.agg(aggregations).reset_index(drop=True)
+
+    if label_col:
+        several = clusters[count_col] > 1
+        clusters[label_col] = clusters[label_col].astype(object)
+        clusters.loc[several, label_col] = clusters.loc[several, count_col].map(lambda n: f'{n:,} sites')
+
+    return clusters[columns + [count_col]], {
+        'mode': method,
+        'total_points': total,
+        'plotted_points': len(clusters)
+    }
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_map_markers(data, lat_col, lon_col, zoom, sum_cols=(), label_col=None, text_cols=(),
+                    count_col='SITES', method='hex'):
+    """
+    Get the clustered markers of a map, cached per (filtered data, zoom).
+
+    The hash of ``data`` identifies the active filter, so every session looking at
+    the same selection and zoom level shares one clustering pass.
+
+    Args:
+        data (DataFrame): One row per marker, already filtered
+        lat_col (str): Column name for latitude
+        lon_col (str): Column name for longitude
+        zoom (float): Mapbox zoom level the map opens at
+        sum_cols (tuple): Columns summed per cluster
+        label_col (str, optional): Column naming a marker
+        text_cols (tuple): Text columns listed in the hover of a cluster
+        count_col (str): Name of the added column holding the sites per marker
+        method (str): 'hex' or 'grid'
+
+    Returns:
+        tuple: (DataFrame, dict) as returned by ``cluster_markers``
+    """
+    return cluster_markers(data, lat_col, lon_col, zoom, sum_cols, label_col, text_cols,
+                           count_col, method)
+
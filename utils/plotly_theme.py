@@ -0,0 +1,80 @@
+"""
+Plotly theme for DesiVerse application.
+Registers the shared dark layout once as a Plotly template that figures reference by name.
+"""
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+# Layout shared by every DesiVerse chart; figures only set what differs (height, titles,
+# legend placement, ...)
+DESIVERSE_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='white', size=12),
+    title_font=dict(size=16),
+    margin=dict(t=50, b=50, l=50, r=50),
+    legend=dict(
+        bgcolor='rgba(0,0,0,0.5)',
+        bordercolor='rgba(255,255,255,0.2)',
+        borderwidth=1
+    )
+)
+
+# Legend placements; the template leaves placement to each figure, which must set
+# both anchors so nothing is inherited from a base template
+LEGEND_TOP_RIGHT = dict(yanchor="top", y=0.99, xanchor="right", x=0.99)
+LEGEND_TOP_LEFT = dict(yanchor="top", y=0.99, xanchor="left", x=0.01)
+
+DESIVERSE_TEMPLATE = 'desiverse'
+DARK_TEMPLATE = 'desiverse_dark'
+DEFAULT_TEMPLATE = 'desiverse_default'
+
+
+def theme_template(dark=False):
+    """
+    Name of the registered DesiVerse template, registering it on first use.
+
+    ``desiverse_default`` layers the DesiVerse layout over the active default template
+    (Streamlit's, once Streamlit is loaded); ``desiverse_dark`` layers it over
+    ``plotly_dark``. Both are merged once, so figures only pay for a name lookup.
+
+    Args:
+        dark (bool): Use the plotly_dark base instead of the default one
+
+    Returns:
+        str: Template name for ``template=`` arguments
+    """
+    name = DARK_TEMPLATE if dark else DEFAULT_TEMPLATE
+    if name not in pio.templates:
+        base = 'plotly_dark' if dark else pio.templates.default
+        pio.templates[name] = pio.templates.merge_templates(base, _layout_template())
+    return name
+
+
+def _layout_template():
+    """Name of the template holding only the DesiVerse layout, registering it on first use."""
+    if DESIVERSE_TEMPLATE not in pio.templates:
+        pio.templates[DESIVERSE_TEMPLATE] = go.layout.Template(layout=DESIVERSE_LAYOUT)
+    return DESIVERSE_TEMPLATE
+
+
+def themed_figure(*traces, dark=False, **layout):
+    """
+    Create a figure that uses the DesiVerse template.
+
+    Without ``dark`` the figure references the layout-only ``desiverse`` template rather
+    than the merged default: graph_objects figures never carried a base template, and
+    leaving it out keeps validation and payload small while Streamlit's chart theme
+    still styles everything the layout does not set.
+
+    Args:
+        *traces: Traces to add
+        dark (bool): Use the plotly_dark based template
+        **layout: Figure-specific layout properties
+
+    Returns:
+        plotly.graph_objects.Figure: The new figure
+    """
+    template = theme_template(dark=True) if dark else _layout_template()
+    return go.Figure(data=list(traces), layout=dict(template=template, **layout))
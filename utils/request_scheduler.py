@@ -0,0 +1,248 @@
+"""
+Request scheduler for DesiVerse application.
+Paces calls to the image APIs with a token bucket per provider and coalesces
+identical in-flight queries, so concurrent sessions share one upstream call.
+"""
+
+import logging
+import threading
+import time
+
+import requests
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# Requests per second and burst size of each provider's bucket. Pexels allows 200
+# requests per hour and Pixabay 100 per minute; unknown providers are not paced.
+PROVIDER_LIMITS = {
+    'pexels': (200 / 3600, 20),
+    'pixabay': (100 / 60, 20)
+}
+
+# Longest time a request waits for a token before giving up, in seconds
+ACQUIRE_TIMEOUT = 5.0
+
+# Longest pause after a 429 without a usable Retry-After or reset header, in seconds
+DEFAULT_RETRY_AFTER = 60.0
+
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """No request token became available in time; the call was not sent."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can be corrected from the server's rate-limit headers."""
+
+    def __init__(self, rate, capacity):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Largest number of stored tokens (the burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self):
+        """Tokens available right now."""
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+            return 0.0 if now < self._blocked_until else self._tokens
+
+    def acquire(self, timeout=ACQUIRE_TIMEOUT):
+        """
+        Take one token, waiting up to ``timeout`` seconds for it.
+
+        Returns:
+            bool: True if a token was taken
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                if now >= self._blocked_until:
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._blocked_until - now
+                if now + wait > deadline:
+                    return False
+                self._condition.wait(wait)
+
+    def observe(self, remaining=None, reset_after=None):
+        """
+        Align the bucket with the server's view of the quota.
+
+        Args:
+            remaining (int, optional): Requests the server still allows in its window
+            reset_after (float, optional): Seconds until the server's window resets;
+                with no requests remaining, no token is handed out before then
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+                if remaining <= 0:
+                    self._blocked_until = now + (reset_after if reset_after is not None else DEFAULT_RETRY_AFTER)
+            self._condition.notify_all()
+
+
+class _Flight:
+    """A call in progress that other threads can wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _header_number(headers, name):
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """
+    Process-wide scheduler of upstream API calls.
+
+    ``run`` coalesces identical calls that overlap in time: the first caller sends
+    the request after taking a token from the provider's bucket, and the others
+    wait for its result.
+    """
+
+    def __init__(self, limits=PROVIDER_LIMITS):
+        """
+        Args:
+            limits (dict): Provider name mapped to (requests per second, burst size)
+        """
+        self.buckets = {provider: TokenBucket(rate, capacity) for provider, (rate, capacity) in limits.items()}
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._stats = {provider: {'requests': 0, 'coalesced': 0, 'throttled': 0, 'rate_limited': 0, 'remaining': None}
+                       for provider in limits}
+
+    def _count(self, provider, name):
+        stats = self._stats.get(provider)
+        if stats is not None:
+            with self._lock:
+                stats[name] += 1
+
+    def run(self, provider, key, call, timeout=ACQUIRE_TIMEOUT):
+        """
+        Run an upstream call, sharing it with identical calls already in flight.
+
+        Args:
+            provider (str): Provider whose bucket paces the call
+            key (str): Identity of the call; equal keys share one request
+            call (callable): Zero-argument function sending the request. It returns
+                either the ``requests.Response`` or a ``(result, response)`` pair
+            timeout (float): Longest wait for a token in seconds
+
+        Returns:
+            The value returned by ``call``
+
+        Raises:
+            RateLimitExceeded: No token became available within ``timeout``
+        """
+        flight_key = (provider, key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+
+        if not leader:
+            self._count(provider, 'coalesced')
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            bucket = self.buckets.get(provider)
+            if bucket is not None and not bucket.acquire(timeout):
+                self._count(provider, 'throttled')
+                raise RateLimitExceeded(f"No {provider} request token available within {timeout:g}s")
+            self._count(provider, 'requests')
+            flight.result = call()
+            response = flight.result[1] if isinstance(flight.result, tuple) else flight.result
+            self._observe(provider, response)
+            return flight.result
+        except Exception as e:
+            self._observe(provider, getattr(e, 'response', None))
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[flight_key]
+            flight.done.set()
+
+    def _observe(self, provider, response):
+        """Feed the rate-limit headers of a response back into the provider's bucket."""
+        bucket = self.buckets.get(provider)
+        if bucket is None or not isinstance(response, requests.Response):
+            return
+
+        headers = response.headers
+        remaining = _header_number(headers, 'X-Ratelimit-Remaining')
+        reset = _header_number(headers, 'X-Ratelimit-Reset')
+        # Pexels sends the reset as a UNIX timestamp, Pixabay as seconds to wait
+        if reset is not None and reset > 1e9:
+            reset = max(0.0, reset - time.time())
+
+        if response.status_code == 429:
+            self._count(provider, 'rate_limited')
+            remaining = 0
+            reset = _header_number(headers, 'Retry-After') or reset
+        if remaining is not None:
+            with self._lock:
+                self._stats[provider]['remaining'] = int(remaining)
+            bucket.observe(remaining, reset)
+        if response.status_code == 429:
+            logger.warning("%s answered 429; pausing its requests for %.0fs (headroom: %s)",
+                           provider, reset if reset is not None else DEFAULT_RETRY_AFTER,
+                           self.headroom()[provider])
+
+    def headroom(self):
+        """
+        Rate-limit headroom of every provider.
+
+        Returns:
+            dict: Provider mapped to ``tokens`` (requests that can go out now),
+                ``capacity``, ``remaining`` (the server's last reported quota, or None)
+                and the ``requests``, ``coalesced``, ``throttled`` and ``rate_limited``
+                counters
+        """
+        with self._lock:
+            stats = {provider: dict(values) for provider, values in self._stats.items()}
+        for provider, bucket in self.buckets.items():
+            stats[provider]['tokens'] = round(bucket.tokens, 2)
+            stats[provider]['capacity'] = bucket.capacity
+        return stats
+
+
+@st.cache_resource
+def get_request_scheduler():
+    """Shared request scheduler for every session of this process."""
+    return RequestScheduler()
+
+
+def rate_limit_headroom():
+    """Rate-limit headroom of every provider; see ``RequestScheduler.headroom``."""
+    return get_request_scheduler().headroom()
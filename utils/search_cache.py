@@ -0,0 +1,157 @@
+"""
+Search result cache for DesiVerse application.
+Keeps image API search responses on disk with TTLs, conditional revalidation and
+short-lived negative entries, so repeated lookups skip the network across restarts.
+"""
+
+import contextlib
+import contextvars
+import json
+import time
+
+import requests
+
+from utils.disk_cache import ByteCache, cache_key
+from utils.http_client import http_get
+from utils.request_scheduler import RateLimitExceeded, get_request_scheduler
+
+# Lifetime of a search that returned results, in seconds
+SEARCH_TTL = 24 * 3600
+
+# Lifetime of a search that returned nothing or was not found (404), in seconds
+NEGATIVE_TTL = 15 * 60
+
+# Search responses, shared by every session and kept across restarts
+search_cache = ByteCache('search', max_memory_bytes=8 * 1024 * 1024, suffix='.json')
+
+# Seconds before expiry within which the current caller revalidates an entry anyway
+_revalidate_within = contextvars.ContextVar('revalidate_within', default=0)
+
+
+def normalize_query(query):
+    """Normalize a search query so trivially different spellings share one entry."""
+    return ' '.join(str(query).lower().split())
+
+
+def _read_entry(key):
+    data = search_cache.get(key)
+    if data is None:
+        return None
+    try:
+        return json.loads(data)
+    except ValueError:
+        return None
+
+
+def _write_entry(key, entry):
+    search_cache.put(key, json.dumps(entry).encode('utf-8'))
+
+
+@contextlib.contextmanager
+def revalidating(seconds):
+    """
+    Treat entries that expire within ``seconds`` as expired for searches in this context.
+
+    Background jobs use it to renew cached searches before users find them expired.
+    Like any expired entry, such an entry is revalidated and still served if that fails.
+
+    Args:
+        seconds (float): Remaining lifetime below which an entry is revalidated
+    """
+    token = _revalidate_within.set(seconds)
+    try:
+        yield
+    finally:
+        _revalidate_within.reset(token)
+
+
+def cached_search(provider, url, query, query_param='query', params=None, headers=None,
+                  auth_params=None, results_key=None, ttl=SEARCH_TTL, negative_ttl=NEGATIVE_TTL):
+    """
+    Run an API search through the on-disk search cache.
+
+    Fresh entries are served without a request, unless the caller runs in
+    ``revalidating`` and the entry expires within its window. Expired entries are revalidated with
+    ``If-None-Match`` / ``If-Modified-Since`` when the API sent an ETag or
+    Last-Modified, and a 304 renews them. Empty and not-found (404) searches are
+    remembered for ``negative_ttl`` only; rate limits, server errors and connection
+    errors are never cached, so the next call tries again. If a revalidation fails,
+    the expired results are served rather than nothing. Requests go through the
+    request scheduler, which paces them per provider and lets concurrent identical
+    searches share one call.
+
+    Args:
+        provider (str): Name of the API, part of the cache key
+        url (str): Search endpoint
+        query (str): Search terms; sent and keyed in normalized form
+        query_param (str): Name of the query parameter of the endpoint
+        params (dict, optional): Other parameters that shape the results
+        headers (dict, optional): Request headers, e.g. authorization
+        auth_params (dict, optional): Credential parameters, sent but kept out of the key
+        results_key (str, optional): Response field holding the results; a response
+            where it is missing or empty counts as a negative result
+        ttl (int): Lifetime of positive results in seconds
+        negative_ttl (int): Lifetime of negative results in seconds
+
+    Returns:
+        dict: The parsed response; ``{}`` for a 404 remembered from an earlier call
+
+    Raises:
+        requests.exceptions.RequestException: The request failed, or no request token
+            was available (``RateLimitExceeded``), and nothing usable was cached
+        ValueError: The response was not JSON and nothing usable was cached
+    """
+    query = normalize_query(query)
+    params = dict(params or {})
+    key = cache_key('search', provider, url, query, params)
+
+    entry = _read_entry(key)
+    now = time.time()
+    if entry is not None and now + _revalidate_within.get() < entry['expires_at']:
+        return entry['data']
+
+    request_headers = dict(headers or {})
+    if entry is not None and entry.get('etag'):
+        request_headers['If-None-Match'] = entry['etag']
+    if entry is not None and entry.get('last_modified'):
+        request_headers['If-Modified-Since'] = entry['last_modified']
+
+    def fetch():
+        response = None
+        try:
+            response = http_get(url, headers=request_headers,
+                                params=dict(params, **(auth_params or {}), **{query_param: query}))
+            if response.status_code == 304 and entry is not None:
+                entry['expires_at'] = now + (negative_ttl if entry['negative'] else ttl)
+                _write_entry(key, entry)
+                return entry['data'], response
+            response.raise_for_status()
+            data = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            if getattr(e, 'response', None) is not None:
+                response = e.response
+            if entry is not None and not entry['negative']:
+                return entry['data'], response
+            # Only a definite "not found" is worth remembering; transient failures are retried
+            if response is not None and response.status_code == 404:
+                _write_entry(key, {'data': {}, 'negative': True, 'expires_at': now + negative_ttl})
+            raise
+
+        negative = not data.get(results_key) if results_key else not data
+        _write_entry(key, {
+            'data': data,
+            'negative': negative,
+            'expires_at': now + (negative_ttl if negative else ttl),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        })
+        return data, response
+
+    # Concurrent sessions asking for the same search share one paced request
+    try:
+        data, _ = get_request_scheduler().run(provider, key, fetch)
+    except RateLimitExceeded:
+        if entry is not None and not entry['negative']:
+            return entry['data']
+        raise
+    return data
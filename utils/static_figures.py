@@ -0,0 +1,65 @@
+"""
+Static figure registry for DesiVerse application.
+Builds charts drawn from hard-coded data once per process and serves them to every session.
+"""
+
+import functools
+import json
+
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+# Registered builders, keyed by "<module>.<function>"
+STATIC_FIGURES = {}
+
+
+class SerializedFigure(go.Figure):
+    """
+    Figure rebuilt from its serialized JSON, which it keeps for rendering.
+
+    ``st.plotly_chart`` serializes a figure through ``to_dict``; here that only parses
+    the cached JSON instead of deep-copying and re-validating every trace, so a
+    rerun skips the figure's serialization cost.
+    """
+
+    def __init__(self, spec):
+        """
+        Args:
+            spec (str): The figure as produced by ``plotly.io.to_json``
+        """
+        super().__init__(json.loads(spec))
+        self._spec = spec
+
+    def to_dict(self):
+        return json.loads(self._spec)
+
+
+@st.cache_resource(show_spinner=False)
+def _build_static_figure(name):
+    """Build a registered figure and serialize it, once per process."""
+    return SerializedFigure(pio.to_json(STATIC_FIGURES[name](), validate=False))
+
+
+def static_figure(build):
+    """
+    Register a builder of a figure whose data never changes.
+
+    The builder runs on first use only; afterwards the decorated function returns the
+    same ``SerializedFigure`` to every session. Callers pass it straight to
+    ``st.plotly_chart`` and must not modify it, since rendering uses the cached JSON.
+
+    Args:
+        build (callable): Zero-argument function returning a plotly Figure
+
+    Returns:
+        callable: Zero-argument function returning the shared figure
+    """
+    name = f'{build.__module__}.{build.__name__}'
+    STATIC_FIGURES[name] = build
+
+    @functools.wraps(build)
+    def get_figure():
+        return _build_static_figure(name)
+
+    return get_figure
@@ -0,0 +1,131 @@
+"""
+Thumbnail proxy for DesiVerse application.
+Fetches remote images once, resizes them with Pillow to the sizes the pages render,
+and serves the cached bytes instead of the multi-megabyte originals.
+"""
+
+import base64
+import io
+
+from PIL import Image, ImageOps, features
+
+from utils.disk_cache import ByteCache, cache_key
+from utils.http_client import http_get
+
+# Rendered sizes as (width, height, crop) in pixels, at twice the CSS size for sharp
+# results on high-density screens; cropped sizes fill the box like ``object-fit: cover``
+THUMBNAIL_SIZES = {
+    'card': (800, 400, True),      # 200px-tall art form cards
+    'gallery': (800, 800, False)   # Three-column image grids
+}
+
+# Encoding of the thumbnails; WebP when this Pillow build supports it
+THUMBNAIL_FORMAT = 'WEBP' if features.check('webp') else 'JPEG'
+THUMBNAIL_QUALITY = 80
+
+# Originals larger than this are not downloaded
+MAX_ORIGINAL_BYTES = 25 * 1024 * 1024
+
+# Rendered thumbnails, shared by every session and kept across restarts
+thumbnail_cache = ByteCache(
+    'thumbnails',
+    max_memory_bytes=32 * 1024 * 1024,
+    suffix='.img',
+    max_disk_bytes=256 * 1024 * 1024
+)
+
+
+def _fetch_original(url):
+    """Download an image, refusing anything over ``MAX_ORIGINAL_BYTES``."""
+    with http_get(url, stream=True) as response:
+        response.raise_for_status()
+        chunks = []
+        received = 0
+        for chunk in response.iter_content(64 * 1024):
+            received += len(chunk)
+            if received > MAX_ORIGINAL_BYTES:
+                raise ValueError(f"Image larger than {MAX_ORIGINAL_BYTES} bytes: {url}")
+            chunks.append(chunk)
+    return b''.join(chunks)
+
+
+def render_thumbnail(data, size='card'):
+    """
+    Resize encoded image bytes to one of the ``THUMBNAIL_SIZES``.
+
+    Args:
+        data (bytes): The original image
+        size (str): Key of ``THUMBNAIL_SIZES``
+
+    Returns:
+        bytes: The thumbnail, encoded as ``THUMBNAIL_FORMAT``
+    """
+    width, height, crop = THUMBNAIL_SIZES[size]
+    with Image.open(io.BytesIO(data)) as image:
+        # Let the JPEG decoder skip detail the thumbnail cannot show
+        image.draft('RGB', (width, height))
+        image = ImageOps.exif_transpose(image).convert('RGB')
+        if crop:
+            image = ImageOps.fit(image, (width, height), Image.LANCZOS)
+        else:
+            image.thumbnail((width, height), Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def _thumbnail_key(url, size):
+    return cache_key('thumbnail', url, THUMBNAIL_SIZES[size], THUMBNAIL_FORMAT, THUMBNAIL_QUALITY)
+
+
+def get_thumbnail(url, size='card'):
+    """
+    Get the thumbnail of a remote image.
+
+    On a miss the original is downloaded once and every size in ``THUMBNAIL_SIZES``
+    is rendered from it, so other pages' sizes are cached too.
+
+    Args:
+        url (str): URL of the original image
+        size (str): Key of ``THUMBNAIL_SIZES``
+
+    Returns:
+        bytes or None: The thumbnail, for ``st.image``; None if the image could not
+            be fetched or decoded
+    """
+    if not url:
+        return None
+    data = thumbnail_cache.get(_thumbnail_key(url, size))
+    if data is not None:
+        return data
+
+    try:
+        original = _fetch_original(url)
+        for other_size in THUMBNAIL_SIZES:
+            rendered = render_thumbnail(original, other_size)
+            thumbnail_cache.put(_thumbnail_key(url, other_size), rendered)
+            if other_size == size:
+                data = rendered
+    except Exception as e:
+        print(f"Error creating thumbnail for {url}: {str(e)}")
+        return None
+    return data
+
+
+def thumbnail_data_uri(url, size='card'):
+    """
+    Get the thumbnail of a remote image as a data URI for ``<img src>`` in HTML cards.
+
+    Args:
+        url (str): URL of the original image
+        size (str): Key of ``THUMBNAIL_SIZES``
+
+    Returns:
+        str or None: ``data:`` URI of the thumbnail, or None if it could not be created
+    """
+    data = get_thumbnail(url, size)
+    if data is None:
+        return None
+    mime_type = 'image/webp' if data[8:12] == b'WEBP' else 'image/jpeg'
+    return f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
@@ -2,58 +2,106 @@
 Visualization functions for DesiVerse application.
 """
 
+import functools
+import io
 import plotly.express as px
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 import pandas as pd
-from matplotlib.colors import LinearSegmentedColormap
-from wordcloud import WordCloud
 from data.constants import INDIAN_COLORS
+from utils.disk_cache import ByteCache, cache_key
+from utils.downsampling import DEFAULT_PIXEL_WIDTH, downsample_frame
+from utils.map_layers import cluster_markers
+from utils.plotly_theme import LEGEND_TOP_LEFT, LEGEND_TOP_RIGHT, theme_template, themed_figure
 
-# Create custom colormaps
-indian_cmap = LinearSegmentedColormap.from_list('indian_cmap', INDIAN_COLORS['gradient'])
-earth_cmap = LinearSegmentedColormap.from_list('earth_cmap', INDIAN_COLORS['earth'])
+# Colours of the custom colormaps; matplotlib builds them on first use (see colormap)
+COLORMAP_COLORS = {
+    'indian_cmap': INDIAN_COLORS['gradient'],
+    'earth_cmap': INDIAN_COLORS['earth'],
+    # Earthy tones with saffron highlights for the art forms word cloud
+    'earthy_cmap': [(0, '#8B4513'), (0.3, '#A0522D'), (0.5, '#CD853F'), (0.8, '#DEB887'), (1.0, '#FF9933')]
+}
 
-def create_map_visualization(data, title="Cultural Heritage Sites Across India"):
+# Word cloud canvas size in pixels
+WORDCLOUD_SIZE = (800, 400)
+
+# Scatter plots switch from SVG to WebGL markers above this many points
+SCATTER_WEBGL_THRESHOLD = 1000
+
+# Default marker budget of large scatter plots before sampling or binning kicks in
+SCATTER_MAX_POINTS = 20000
+
+# Rendered matplotlib figures, shared by every session and kept across restarts
+figure_cache = ByteCache('figures', max_memory_bytes=32 * 1024 * 1024, suffix='.png')
+
+@functools.lru_cache(maxsize=None)
+def colormap(name):
+    """
+    Get one of the custom colormaps, importing matplotlib on first use.
+    
+    Args:
+        name (str): Key of ``COLORMAP_COLORS``, e.g. 'indian_cmap'
+        
+    Returns:
+        matplotlib.colors.LinearSegmentedColormap: The colormap
+    """
+    from matplotlib.colors import LinearSegmentedColormap
+    return LinearSegmentedColormap.from_list(name, COLORMAP_COLORS[name])
+
+def __getattr__(name):
+    # ``indian_cmap`` and friends stay importable without loading matplotlib up front
+    if name in COLORMAP_COLORS:
+        return colormap(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def create_map_visualization(data, title="Cultural Heritage Sites Across India", zoom=3, cluster='hex'):
     """
     Create an interactive map visualization with cultural heritage sites.
     
+    Nearby sites are merged into clusters when there are more than the map's marker
+    budget allows (see ``utils.map_layers.cluster_markers``).
+    
     Args:
         data (DataFrame): DataFrame containing latitude, longitude, and other site data
         title (str): Title for the map
+        zoom (float): Zoom level the map opens at, which also sets the cluster size
+        cluster (str): 'hex' or 'grid' clustering of large site counts
         
     Returns:
         plotly.graph_objects.Figure: The map figure
     """
     # Determine which columns to include in hover data
-    hover_data = []
-    if 'tourist_visits' in data.columns:
-        hover_data.append('tourist_visits')
-    if 'art_form' in data.columns:
-        hover_data.append('art_form')
+    text_cols = ['art_form'] if 'art_form' in data.columns else []
+    markers, _ = cluster_markers(
+        data,
+        'latitude',
+        'longitude',
+        zoom,
+        sum_cols=['tourist_visits'],
+        label_col='state',
+        text_cols=text_cols,
+        count_col='sites',
+        method=cluster
+    )
     
     fig = px.scatter_mapbox(
-        data,
+        markers,
         lat='latitude',
         lon='longitude',
         hover_name='state',
-        hover_data=hover_data,
+        hover_data=['tourist_visits', 'sites'] + text_cols,
         size='tourist_visits',
         color='tourist_visits',
         color_continuous_scale='Viridis',
         size_max=15,
-        zoom=3,
+        zoom=zoom,
         mapbox_style="carto-darkmatter",
-        title=title
+        title=title,
+        template=theme_template()
     )
     
     fig.update_layout(
         margin={"r":0,"t":30,"l":0,"b":0},
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500
     )
@@ -79,26 +127,11 @@ def create_pie_chart(data, values_col, names_col, title):
         names=names_col,
         title=title,
         hole=0.4,
-        color_discrete_sequence=px.colors.qualitative.Set3
+        color_discrete_sequence=px.colors.qualitative.Set3,
+        template=theme_template()
     )
     
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        title_font=dict(size=16),
-        height=400,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
-    )
+    fig.update_layout(height=400, legend=LEGEND_TOP_RIGHT)
     
     return fig
 
@@ -123,7 +156,8 @@ def create_bar_chart(data, x_col, y_col, title, color_col=None):
             y=y_col,
             title=title,
             color=color_col,
-            color_continuous_scale='Viridis'
+            color_continuous_scale='Viridis',
+            template=theme_template()
         )
     else:
         fig = px.bar(
@@ -131,26 +165,14 @@ def create_bar_chart(data, x_col, y_col, title, color_col=None):
             x=x_col,
             y=y_col,
             title=title,
-            color_discrete_sequence=INDIAN_COLORS['secondary']
+            color_discrete_sequence=INDIAN_COLORS['secondary'],
+            template=theme_template()
         )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        title_font=dict(size=16),
         height=400,
-        margin=dict(t=50, b=50, l=50, r=50),
         xaxis=dict(tickangle=45),
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
+        legend=LEGEND_TOP_RIGHT
     )
     
     return fig
@@ -176,69 +198,48 @@ def create_grouped_bar_chart(data, x_col, y_cols, title):
         title=title,
         color_discrete_sequence=['#138808', '#FF9933'],  # Green for domestic, Saffron for foreign
         labels={'value': 'Number of Visitors', 'variable': 'Visitor Type'},
-        template='plotly_dark'
+        template=theme_template(dark=True)
     )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            title='Visitor Type',
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
+        legend=dict(title='Visitor Type', **LEGEND_TOP_RIGHT)
     )
     
     return fig
 
-def create_line_chart(data, x_col, y_col, title):
+def create_line_chart(data, x_col, y_col, title, pixel_width=DEFAULT_PIXEL_WIDTH, downsample='lttb'):
     """
     Create a line chart visualization.
     
+    Series longer than the chart's point budget are downsampled first, so the payload
+    stays the same size however much history the data holds.
+    
     Args:
         data (DataFrame): DataFrame containing the data
         x_col (str): Column name for x-axis
         y_col (str or list): Column name(s) for y-axis values
         title (str): Title for the chart
+        pixel_width (int): Chart width in pixels, which sets the point budget
+        downsample (str): 'lttb' or 'minmax'
         
     Returns:
         plotly.graph_objects.Figure: The line chart figure
     """
+    data, _ = downsample_frame(data, x_col, y_col, pixel_width, downsample)
+    
     fig = px.line(
         data,
         x=x_col,
         y=y_col,
         title=title,
         labels={'value': 'Count', 'variable': 'Metric'},
-        color_discrete_sequence=['#FF6B6B', '#4ECDC4']
+        color_discrete_sequence=['#FF6B6B', '#4ECDC4'],
+        template=theme_template()
     )
     
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        title_font=dict(size=16),
-        height=400,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
-    )
+    fig.update_layout(height=400, legend=LEGEND_TOP_RIGHT)
     
     return fig
 
@@ -260,16 +261,8 @@ def create_heatmap(data, x_labels, title):
         x=x_labels,
         aspect="auto",
         color_continuous_scale='Viridis',
-        title=title
-    )
-    
-    fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        title_font=dict(size=16),
-        height=400,
-        margin=dict(t=50, b=50, l=50, r=50)
+        title=title,
+        template=theme_template()
     )
     
     return fig
@@ -296,28 +289,181 @@ def create_scatter_plot(data, x_col, y_col, color_col, title, hover_data=None):
         color=color_col,
         hover_data=hover_data,
         title=title,
-        template='plotly_dark'
+        template=theme_template(dark=True),
+        render_mode='webgl' if len(data) > SCATTER_WEBGL_THRESHOLD else 'svg'
     )
     
+    fig.update_layout(height=500, legend=LEGEND_TOP_RIGHT)
+    
+    return fig
+
+def stratified_sample(data, group_col, max_points, seed=0):
+    """
+    Sample rows so that every group keeps its share of the data.
+    
+    Args:
+        data (DataFrame): DataFrame to sample
+        group_col (str): Column defining the strata
+        max_points (int): Approximate number of rows to keep
+        seed (int): Seed of the random generator, so reruns draw the same sample
+        
+    Returns:
+        DataFrame: The sampled rows in their original order; each group keeps at least one row
+    """
+    if len(data) <= max_points:
+        return data
+    
+    rng = np.random.default_rng(seed)
+    fraction = max_points / len(data)
+    keep = []
+    for rows in data.groupby(group_col, sort=False).indices.values():
+        quota = max(1, int(round(len(rows) * fraction)))
+        keep.append(rng.choice(rows, size=min(quota, len(rows)), replace=False))
+    
+    return data.take(np.sort(np.concatenate(keep)))
+
+def _grid_cells(x, y, bins):
+    """Assign points to a bins x bins rectangular grid; return cell ids and cell centres."""
+    x_edges = np.linspace(x.min(), x.max(), bins + 1)
+    y_edges = np.linspace(y.min(), y.max(), bins + 1)
+    ix = np.clip(np.searchsorted(x_edges, x, side='right') - 1, 0, bins - 1)
+    iy = np.clip(np.searchsorted(y_edges, y, side='right') - 1, 0, bins - 1)
+    x_centres = (x_edges[ix] + x_edges[ix + 1]) / 2
+    y_centres = (y_edges[iy] + y_edges[iy + 1]) / 2
+    return ix * bins + iy, x_centres, y_centres
+
+def _hex_cells(x, y, bins):
+    """Assign points to a hexagonal grid with ``bins`` hexagons across; return cell ids and centres."""
+    x_min, y_min = x.min(), y.min()
+    x_scale = (x.max() - x_min) / bins or 1.0
+    y_scale = (y.max() - y_min) / (bins / np.sqrt(3)) or 1.0
+    
+    # Two offset rectangular lattices; each point goes to the nearer centre
+    u = (x - x_min) / x_scale
+    v = (y - y_min) / y_scale
+    u1, v1 = np.round(u), np.round(v)
+    u2, v2 = np.floor(u) + 0.5, np.floor(v) + 0.5
+    first = (u - u1) ** 2 + 3 * (v - v1) ** 2 < (u - u2) ** 2 + 3 * (v - v2) ** 2
+    cu = np.where(first, u1, u2)
+    cv = np.where(first, v1, v2)
+    
+    cells = (2 * cu).astype(np.int64) * (4 * bins + 4) + (2 * cv).astype(np.int64)
+    return cells, x_min + cu * x_scale, y_min + cv * y_scale
+
+def create_large_scatter_plot(data, x_col, y_col, color_col, title, hover_data=None,
+                              mode='auto', max_points=SCATTER_MAX_POINTS, bins=60, seed=0):
+    """
+    Create a scatter plot that stays responsive for large datasets.
+    
+    Small datasets are drawn like ``create_scatter_plot``. Larger ones use WebGL
+    markers, and beyond ``max_points`` rows are either stratified-sampled per
+    ``color_col`` or pre-aggregated into grid or hexagonal bins, one marker per
+    non-empty (group, bin) sized by its point count.
+    
+    Args:
+        data (DataFrame): DataFrame containing the data
+        x_col (str): Column name for x-axis
+        y_col (str): Column name for y-axis
+        color_col (str): Column name for color encoding (also the sampling strata)
+        title (str): Title for the chart
+        hover_data (list, optional): List of column names to include in hover data
+        mode (str): 'auto', 'svg', 'webgl', 'sample', 'grid' or 'hex'; 'auto' picks
+            svg, webgl or sample based on the row count
+        max_points (int): Marker budget for 'auto' and 'sample'
+        bins (int): Bins across each axis for 'grid' and 'hex'
+        seed (int): Seed of the stratified sample
+        
+    Returns:
+        tuple: (plotly.graph_objects.Figure, dict) where the dict reports the resolved
+            ``mode``, ``total_points``, ``plotted_points`` (markers sent to the browser),
+            ``dropped_points`` (left out by sampling) and ``binned_points``
+    """
+    total = len(data)
+    if mode == 'auto':
+        if total <= SCATTER_WEBGL_THRESHOLD:
+            mode = 'svg'
+        elif total <= max_points:
+            mode = 'webgl'
+        else:
+            mode = 'sample'
+    
+    info = {'mode': mode, 'total_points': total, 'plotted_points': total,
+            'dropped_points': 0, 'binned_points': 0}
+    
+    if mode == 'svg':
+        return create_scatter_plot(data, x_col, y_col, color_col, title, hover_data), info
+    
+    if mode == 'sample':
+        data = stratified_sample(data, color_col, max_points, seed)
+        info['plotted_points'] = len(data)
+        info['dropped_points'] = total - len(data)
+    elif mode not in ('webgl', 'grid', 'hex'):
+        raise ValueError(f"Unknown scatter mode: {mode}")
+    
+    hover_data = list(hover_data or [])
+    colors = px.colors.qualitative.Plotly
+    fig = themed_figure(dark=True)
+    
+    if mode in ('grid', 'hex') and total:
+        x = data[x_col].to_numpy(dtype=float)
+        y = data[y_col].to_numpy(dtype=float)
+        assign = _grid_cells if mode == 'grid' else _hex_cells
+        cells, x_centres, y_centres = assign(x, y, bins)
+        binned = pd.DataFrame({
+            'group': data[color_col].to_numpy(),
+            'cell': cells,
+            'x': x_centres,
+            'y': y_centres
+        }).groupby(['group', 'cell'], sort=True).agg(
+            x=('x', 'first'), y=('y', 'first'), count=('x', 'size')
+        ).reset_index()
+        largest = binned['count'].max()
+        
+        for i, (group, cells_of_group) in enumerate(binned.groupby('group', sort=True)):
+            counts = cells_of_group['count'].to_numpy()
+            fig.add_trace(go.Scattergl(
+                x=cells_of_group['x'],
+                y=cells_of_group['y'],
+                mode='markers',
+                name=str(group),
+                marker=dict(
+                    color=colors[i % len(colors)],
+                    size=4 + 16 * np.sqrt(counts / largest),
+                    opacity=0.8
+                ),
+                customdata=counts,
+                hovertemplate=f"{color_col}={group}<br>{x_col}≈%{{x:,.0f}}<br>{y_col}≈%{{y:,.0f}}"
+                              "<br>points=%{customdata:,}<extra></extra>"
+            ))
+        
+        info['plotted_points'] = len(binned)
+        info['binned_points'] = total
+    else:
+        hover_template = f"{color_col}=%{{fullData.name}}<br>{x_col}=%{{x}}<br>{y_col}=%{{y}}"
+        for j, column in enumerate(hover_data):
+            hover_template += f"<br>{column}=%{{customdata[{j}]}}"
+        hover_template += "<extra></extra>"
+        
+        for i, (group, rows) in enumerate(data.groupby(color_col, sort=False)):
+            fig.add_trace(go.Scattergl(
+                x=rows[x_col],
+                y=rows[y_col],
+                mode='markers',
+                name=str(group),
+                marker=dict(color=colors[i % len(colors)]),
+                customdata=rows[hover_data].to_numpy() if hover_data else None,
+                hovertemplate=hover_template
+            ))
+    
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
-        title_font=dict(size=16),
-        height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
+        title=title,
+        xaxis_title=x_col,
+        yaxis_title=y_col,
+        legend=dict(title=color_col, **LEGEND_TOP_RIGHT),
+        height=500
     )
     
-    return fig
+    return fig, info
 
 def create_bubble_chart(data, x_col, y_col, size_col, color_col, title):
     """
@@ -344,25 +490,13 @@ def create_bubble_chart(data, x_col, y_col, size_col, color_col, title):
         title=title,
         size_max=50,
         color_discrete_sequence=['#FF6B6B', '#4ECDC4'],
-        template='plotly_dark'
+        template=theme_template(dark=True)
     )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=600,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
+        legend=LEGEND_TOP_RIGHT
     )
     
     return fig
@@ -381,7 +515,7 @@ def create_radar_chart(categories, values1, values2, names, title):
     Returns:
         plotly.graph_objects.Figure: The radar chart figure
     """
-    fig = go.Figure()
+    fig = themed_figure()
     
     # Add first trace
     fig.add_trace(go.Scatterpolar(
@@ -419,21 +553,9 @@ def create_radar_chart(categories, values1, values2, names, title):
             ),
             bgcolor='rgba(0,0,0,0)'
         ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        ),
+        legend=LEGEND_TOP_RIGHT,
         title=title
     )
     
@@ -450,14 +572,18 @@ def create_correlation_heatmap(data, title="Correlation Analysis"):
     Returns:
         matplotlib.figure.Figure: The heatmap figure
     """
-    plt.figure(figsize=(10, 6), facecolor='black')
-    ax = plt.gca()
+    import seaborn as sns
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(10, 6), facecolor='black')
+    ax = fig.add_subplot()
     ax.set_facecolor('black')
     
     sns.heatmap(
         data,
+        ax=ax,
         annot=True,
-        cmap=indian_cmap,
+        cmap=colormap('indian_cmap'),
         center=0,
         fmt='.2f',
         linewidths=0.5,
@@ -467,18 +593,19 @@ def create_correlation_heatmap(data, title="Correlation Analysis"):
         yticklabels=True
     )
     
-    plt.title(title, pad=20, color='white')
-    plt.xticks(rotation=45, ha='right', color='white')
-    plt.yticks(rotation=0, color='white')
+    ax.set_title(title, pad=20, color='white')
+    ax.tick_params(axis='x', labelrotation=45, labelcolor='white')
+    ax.tick_params(axis='y', labelrotation=0, labelcolor='white')
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
     
     # Remove white background
-    plt.gcf().set_facecolor('black')
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     ax.spines['bottom'].set_visible(False)
     ax.spines['left'].set_visible(False)
     
-    return plt.gcf()
+    return fig
 
 def create_wordcloud(word_frequencies, title="Popular Indian Art Forms"):
     """
@@ -491,26 +618,27 @@ def create_wordcloud(word_frequencies, title="Popular Indian Art Forms"):
     Returns:
         matplotlib.figure.Figure: The wordcloud figure
     """
+    from matplotlib.figure import Figure
+    from wordcloud import WordCloud
+    
     wordcloud = WordCloud(
-        width=800,
-        height=400,
+        width=WORDCLOUD_SIZE[0],
+        height=WORDCLOUD_SIZE[1],
         background_color='black',
-        colormap=earth_cmap,
+        colormap=colormap('earth_cmap'),
         prefer_horizontal=0.9,
         min_font_size=10,
         max_font_size=100,
         relative_scaling=0.5
     ).generate_from_frequencies(word_frequencies)
     
-    plt.figure(figsize=(10, 5), facecolor='black')
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.axis('off')
-    plt.title(title, pad=20, color='white')
+    fig = Figure(figsize=(10, 5), facecolor='black')
+    ax = fig.add_subplot()
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis('off')
+    ax.set_title(title, pad=20, color='white')
     
-    # Remove white background
-    plt.gcf().set_facecolor('black')
-    
-    return plt.gcf()
+    return fig
 
 def create_tourism_bar_chart(domestic_data, foreign_data, sites, title="Visitor Distribution at Top Heritage Sites"):
     """
@@ -543,26 +671,14 @@ def create_tourism_bar_chart(domestic_data, foreign_data, sites, title="Visitor
             'value': 'Number of Visitors', 
             'variable': 'Visitor Type',
             'site': 'Heritage Site'
-        }
+        },
+        template=theme_template()
     )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            title='Visitor Type',
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
+        legend=dict(title='Visitor Type', **LEGEND_TOP_RIGHT)
     )
     
     return fig
@@ -588,7 +704,7 @@ def create_seasonal_line_chart(months, domestic_data, foreign_data, title="Month
     })
     
     # Create figure using plotly.graph_objects for more control
-    fig = go.Figure()
+    fig = themed_figure()
     
     # Add domestic visitors line
     fig.add_trace(go.Scatter(
@@ -615,22 +731,9 @@ def create_seasonal_line_chart(months, domestic_data, foreign_data, title="Month
         title=title,
         xaxis_title='Month',
         yaxis_title='Number of Visitors',
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            title='Visitor Type',
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        ),
+        legend=dict(title='Visitor Type', **LEGEND_TOP_RIGHT),
         xaxis=dict(
             gridcolor='rgba(255,255,255,0.1)',
             tickfont=dict(color='white')
@@ -669,26 +772,14 @@ def create_tourism_pie_chart(categories, values, title="Distribution of Tourism
         values='percentage',
         names='type',
         title=title,
-        color_discrete_sequence=color_sequence
+        color_discrete_sequence=color_sequence,
+        template=theme_template()
     )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         height=500,
-        margin=dict(t=50, b=50, l=50, r=50),
-        legend=dict(
-            title='Tourism Type',
-            yanchor="top",
-            y=0.99,
-            xanchor="left",
-            x=0.01,
-            bgcolor='rgba(0,0,0,0.5)',
-            bordercolor='rgba(255,255,255,0.2)',
-            borderwidth=1
-        )
+        legend=dict(title='Tourism Type', **LEGEND_TOP_LEFT)
     )
     
     return fig
@@ -706,8 +797,11 @@ def create_funding_heatmap(data, x_labels, y_labels, title="Funding Impact Corre
     Returns:
         matplotlib.figure.Figure: The heatmap figure
     """
-    plt.figure(figsize=(10, 8), facecolor='black')
-    ax = plt.gca()
+    import seaborn as sns
+    from matplotlib.figure import Figure
+    
+    fig = Figure(figsize=(10, 8), facecolor='black')
+    ax = fig.add_subplot()
     ax.set_facecolor('black')
     
     # Blue to red gradient for correlation
@@ -715,6 +809,7 @@ def create_funding_heatmap(data, x_labels, y_labels, title="Funding Impact Corre
     
     sns.heatmap(
         data,
+        ax=ax,
         annot=True,
         cmap=cmap,
         center=0,
@@ -726,18 +821,19 @@ def create_funding_heatmap(data, x_labels, y_labels, title="Funding Impact Corre
         yticklabels=y_labels
     )
     
-    plt.title(title, pad=20, color='white', fontsize=20)
-    plt.xticks(rotation=45, ha='right', color='white')
-    plt.yticks(rotation=0, color='white')
+    ax.set_title(title, pad=20, color='white', fontsize=20)
+    ax.tick_params(axis='x', labelrotation=45, labelcolor='white')
+    ax.tick_params(axis='y', labelrotation=0, labelcolor='white')
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
     
     # Remove white background
-    plt.gcf().set_facecolor('black')
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     ax.spines['bottom'].set_visible(False)
     ax.spines['left'].set_visible(False)
     
-    return plt.gcf()
+    return fig
 
 def create_art_forms_wordcloud(word_frequencies, title="Popular Indian Art Forms"):
     """
@@ -750,30 +846,149 @@ def create_art_forms_wordcloud(word_frequencies, title="Popular Indian Art Forms
     Returns:
         matplotlib.figure.Figure: The wordcloud figure
     """
-    # Create a custom color map with earthy tones and saffron highlights
-    earthy_colors = [(0, '#8B4513'), (0.3, '#A0522D'), (0.5, '#CD853F'), (0.8, '#DEB887'), (1.0, '#FF9933')]
-    earthy_cmap = LinearSegmentedColormap.from_list('earthy_cmap', earthy_colors)
+    from matplotlib.figure import Figure
+    from wordcloud import WordCloud
     
     wordcloud = WordCloud(
-        width=800,
-        height=400,
+        width=WORDCLOUD_SIZE[0],
+        height=WORDCLOUD_SIZE[1],
         background_color='black',
-        colormap=earthy_cmap,
+        colormap=colormap('earthy_cmap'),
         prefer_horizontal=0.9,
         min_font_size=10,
         max_font_size=100,
         relative_scaling=0.5
     ).generate_from_frequencies(word_frequencies)
     
-    plt.figure(figsize=(12, 6), facecolor='black')
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.axis('off')
-    plt.title(title, pad=20, color='white', fontsize=20)
+    fig = Figure(figsize=(12, 6), facecolor='black')
+    ax = fig.add_subplot()
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis('off')
+    ax.set_title(title, pad=20, color='white', fontsize=20)
     
-    # Remove white background
-    plt.gcf().set_facecolor('black')
+    return fig
+
+def render_figure_png(fig):
+    """
+    Render a matplotlib figure to PNG and release its artists.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure from one of the builders above; it is
+            cleared afterwards and must not be reused
+        
+    Returns:
+        bytes: The rendered PNG image
+    """
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight', facecolor=fig.get_facecolor())
+    finally:
+        fig.clear()
+    return buffer.getvalue()
+
+def _cached_figure_image(create_figure, key_parts, *args):
+    """
+    Build and render a matplotlib figure through the content-addressed figure cache.
     
-    return plt.gcf()
+    Args:
+        create_figure (callable): Figure builder, called with ``*args`` on a cache miss
+        key_parts (list): JSON-serializable values that fully determine the figure
+        *args: Arguments for ``create_figure``
+        
+    Returns:
+        bytes: The rendered PNG image
+    """
+    key = cache_key(create_figure.__name__, key_parts)
+    return figure_cache.get_or_create(key, lambda: render_figure_png(create_figure(*args)))
+
+def _cached_wordcloud_image(create_figure, colormap_name, word_frequencies, title):
+    """
+    Render a word cloud figure to PNG through the figure cache.
+    
+    Args:
+        create_figure (callable): Word cloud figure builder, e.g. ``create_wordcloud``
+        colormap_name (str): Key of the ``COLORMAP_COLORS`` entry the builder uses
+        word_frequencies (dict or iterable): Words mapped to frequencies, or ``(word, frequency)`` pairs
+        title (str): Title for the chart
+        
+    Returns:
+        bytes: The rendered PNG image
+    """
+    word_frequencies = dict(word_frequencies)
+    key_parts = [
+        sorted((str(word), float(frequency)) for word, frequency in word_frequencies.items()),
+        COLORMAP_COLORS[colormap_name],
+        WORDCLOUD_SIZE,
+        title
+    ]
+    return _cached_figure_image(create_figure, key_parts, word_frequencies, title)
+
+def create_correlation_heatmap_image(data, title="Correlation Analysis"):
+    """
+    Create a correlation heatmap as a cached PNG image.
+    
+    Args:
+        data (DataFrame): DataFrame containing the correlation data
+        title (str): Title for the chart
+        
+    Returns:
+        bytes: The rendered PNG image
+    """
+    key_parts = [
+        np.asarray(data, dtype=float).round(6).tolist(),
+        [str(label) for label in data.index],
+        [str(label) for label in data.columns],
+        COLORMAP_COLORS['indian_cmap'],
+        title
+    ]
+    return _cached_figure_image(create_correlation_heatmap, key_parts, data, title)
+
+def create_funding_heatmap_image(data, x_labels, y_labels, title="Funding Impact Correlation"):
+    """
+    Create a funding impact heatmap as a cached PNG image.
+    
+    Args:
+        data (numpy.ndarray): 2D array of correlation values
+        x_labels (list): Labels for x-axis (columns)
+        y_labels (list): Labels for y-axis (rows)
+        title (str): Title for the chart
+        
+    Returns:
+        bytes: The rendered PNG image
+    """
+    key_parts = [
+        np.asarray(data, dtype=float).round(6).tolist(),
+        list(x_labels),
+        list(y_labels),
+        title
+    ]
+    return _cached_figure_image(create_funding_heatmap, key_parts, data, x_labels, y_labels, title)
+
+def create_wordcloud_image(word_frequencies, title="Popular Indian Art Forms"):
+    """
+    Create a word cloud visualization as a cached PNG image.
+    
+    Args:
+        word_frequencies (dict or iterable): Words mapped to frequencies, or ``(word, frequency)`` pairs
+        title (str): Title for the chart
+        
+    Returns:
+        bytes: The rendered PNG image
+    """
+    return _cached_wordcloud_image(create_wordcloud, 'earth_cmap', word_frequencies, title)
+
+def create_art_forms_wordcloud_image(word_frequencies, title="Popular Indian Art Forms"):
+    """
+    Create a word cloud visualization of popular art forms as a cached PNG image.
+    
+    Args:
+        word_frequencies (dict or iterable): Words mapped to frequencies, or ``(word, frequency)`` pairs
+        title (str): Title for the chart
+        
+    Returns:
+        bytes: The rendered PNG image
+    """
+    return _cached_wordcloud_image(create_art_forms_wordcloud, 'earthy_cmap', word_frequencies, title)
 
 def create_state_choropleth(df, geo_json, title="Tourist Footfall by State"):
     """
@@ -799,13 +1014,11 @@ def create_state_choropleth(df, geo_json, title="Tourist Footfall by State"):
         opacity=0.7,
         labels={'visitors': 'Visitors'},
         color_continuous_scale="Viridis",
-        title=title
+        title=title,
+        template=theme_template()
     )
     
     fig.update_layout(
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white', size=12),
         title_font=dict(size=20),
         margin={"r":0,"t":50,"l":0,"b":0},
         height=600